@@ -2,11 +2,21 @@
 # Created in 2024 by Gaëtan Serré
 #
 
-from .expression import Expression, emax, emin
+from .expression import Expression, emax, emin, esoftmin
 from .variable import Variable
 from .const import Const
 from .gpep import GPEP
+from .solution import Solution
 
-__all__ = ["Expression", "Variable", "Const", "GPEP", "emax", "emin"]
+__all__ = [
+    "Expression",
+    "Variable",
+    "Const",
+    "GPEP",
+    "Solution",
+    "emax",
+    "emin",
+    "esoftmin",
+]
 
 __version__ = "0.0.1"
@@ -0,0 +1,11 @@
+#
+# Created in 2026 by Gaëtan Serré
+#
+
+from .graph import Node, Graph
+from .program import Program
+from .evaluator import Evaluator
+from .simplify import simplify
+from .jacobian import Jacobian
+from .interval import IntervalEvaluator
+from .backend import Backend, FusedEvaluator, get_backend
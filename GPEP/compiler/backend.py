@@ -0,0 +1,377 @@
+#
+# Created in 2026 by Gaëtan Serré
+#
+
+"""
+Array backends of the compiled evaluator.
+
+The default backend, NumPy, runs the Evaluator tape: one in-place numpy kernel per
+node. Its cost per solver vector is dominated by the Python overhead of each
+kernel call when the vectors are small. The JIT backends instead fuse the whole
+program into a single function: fuse() generates the straight-line source of
+the program, one assignment per node calling the pure implementation of its
+operator written against an array module (see Operator.function), and the
+backend compiles it at once.
+
+- Numba compiles the program in nopython mode, with xp = numpy.
+- JAX traces it with xp = jax.numpy and compiles it with XLA on the CPU. The
+  compiled functions enable float64 for the duration of each call only
+  (jax.enable_x64), so the global JAX configuration of the caller is unchanged.
+
+Both are optional dependencies (pip install GPEP[numba] or GPEP[jax]). Every
+backend also supplies the derivatives of the program (gradient()): JAX by
+automatic differentiation of the fused function, the others by forward-mode
+propagation of tangents on the tape (see Jacobian). When the package of a
+backend is missing, or when a program cannot be fused (e.g. a SoftMin metric,
+whose temperature changes during a solve), a warning is emitted and the NumPy
+tape is used.
+"""
+
+from .evaluator import Evaluator
+from .jacobian import Jacobian
+import importlib
+import warnings
+import numpy as np
+
+
+def fuse(program, xp, compile_op=None):
+    """
+    Generate the source of a function evaluating a program for one solver vector.
+
+    Parameters
+    ----------
+    program : Program
+        Compiled problem.
+    xp : module
+        Array module the operators are implemented against.
+    compile_op : callable or None, optional
+        Applied to the implementation of every operator (e.g. numba.njit), which
+        is shared between the nodes with the same operator type, flag and shapes.
+
+    Returns
+    -------
+    (str, dict)
+        Source of program(x) returning the objective and the residuals, and the
+        namespace (constants and operator implementations) to execute it in.
+    """
+    namespace = {"xp": xp}
+    functions = {}
+    lines = ["def program(x):"]
+    alive = program.reachable()
+    for node in program.graph.nodes:
+        if node.index not in alive:
+            continue
+        name = f"v{node.index}"
+        if node.kind == "input":
+            if node.shape == ():
+                lines.append(f"    {name} = x[{node.value}]")
+            else:
+                stop = node.value + node.shape[0]
+                lines.append(f"    {name} = x[{node.value}:{stop}]")
+            continue
+        if node.kind == "const":
+            value = np.asarray(node.value, dtype=float)
+            if node.shape == ():
+                namespace[name] = float(value)
+            else:
+                namespace[name] = np.ascontiguousarray(
+                    np.broadcast_to(value, node.shape)
+                )
+            continue
+        if node.kind == "op":
+            arg_shape = node.args[1].shape if len(node.args) > 1 else None
+            shapes = (node.args[0].shape, arg_shape)
+        else:
+            shapes = tuple(a.shape for a in node.args)
+        key = (type(node.op), getattr(node.op, "r", None), shapes)
+        if key not in functions:
+            if node.kind == "op":
+                function = node.op.function(xp, *shapes)
+            else:
+                function = node.op.function(xp, list(shapes))
+            if compile_op is not None:
+                function = compile_op(function)
+            functions[key] = (f"f{len(functions)}", function)
+            namespace[functions[key][0]] = function
+        args = ", ".join(f"v{a.index}" for a in node.args)
+        lines.append(f"    {name} = {functions[key][0]}({args})")
+
+    if program.constraints:
+        roots = ", ".join(f"v{node.index}" for node in program.constraints)
+        residuals = f"xp.array(({roots},))"
+    else:
+        residuals = "xp.zeros(0)"
+    lines.append(f"    return v{program.objective.index}, {residuals}")
+    return "\n".join(lines) + "\n", namespace
+
+
+class FusedEvaluator:
+    """
+    Evaluator of a Program fused into a single compiled function.
+
+    It exposes the interface of an Evaluator without batch dimension (x, objective,
+    residuals, run() and evaluate()), but not the partial evaluations
+    (run_changed(), segments()).
+
+    Parameters
+    ----------
+    program : Program
+        Compiled problem to evaluate.
+    backend : Backend
+        JIT backend compiling the program.
+    x : ndarray, optional
+        Buffer of shape (n_comp,) used as input, e.g. Function.storage. Otherwise
+        a new buffer is allocated.
+
+    Attributes
+    ----------
+    source : str
+        Generated source of the program (see fuse()).
+    function : callable
+        Compiled program, mapping x to the objective and the residuals.
+    """
+
+    def __init__(self, program, backend, x=None):
+        self.program = program
+        self.backend = backend
+        self.batch = ()
+        self.dtype = np.dtype(np.float64)
+        if x is None:
+            x = np.zeros(program.n_comp)
+        elif x.shape != (program.n_comp,) or x.dtype != self.dtype:
+            raise ValueError(
+                f"Input buffer must have shape {(program.n_comp,)} "
+                f"and dtype {self.dtype}, got {x.shape} and {x.dtype}."
+            )
+        self.x = x
+        self.residuals = np.zeros(len(program.constraints))
+        self.objective = np.zeros(())
+        self.source, namespace = fuse(program, backend.xp, backend.compile_op)
+        exec(compile(self.source, "<GPEP program>", "exec"), namespace)
+        self.function = backend.compile(namespace["program"])
+        # Compile now (Numba, JAX compile at the first call) so that failures
+        # surface here.
+        self.run()
+
+    def run(self):
+        """Evaluate the compiled program on the current content of x."""
+        objective, residuals = self.function(self.x)
+        self.objective[...] = objective
+        self.residuals[...] = residuals
+
+    def evaluate(self, x):
+        """
+        Copy x into the input buffer and evaluate.
+
+        Parameters
+        ----------
+        x : array_like
+            Solver vector of shape (n_comp,).
+
+        Returns
+        -------
+        (ndarray, ndarray)
+            The objective and residual buffers (overwritten by the next call).
+        """
+        if x is not self.x:
+            np.copyto(self.x, x)
+        self.run()
+        return self.objective, self.residuals
+
+
+class Backend:
+    """
+    NumPy backend: programs are evaluated by the Evaluator tape.
+
+    Subclasses fuse programs into compiled functions: they set module (the
+    optional package to import) and override load(), compile() and possibly
+    gradient().
+
+    Attributes
+    ----------
+    name : str
+    module : str or None
+        Package providing the backend, imported by load().
+    xp : module
+        Array module the operators are implemented against.
+    compile_op : callable or None
+        Applied to every operator implementation before fusion.
+    """
+
+    name = "numpy"
+    module = None
+    compile_op = None
+
+    def __init__(self):
+        self.xp = np
+
+    def load(self):
+        """Import the package of the backend (ImportError if it is missing)."""
+
+    def compile(self, function):
+        """Return the compiled version of a generated program."""
+        return function
+
+    def evaluator(self, program, x=None):
+        """
+        Return an evaluator of a program, without batch dimension.
+
+        Parameters
+        ----------
+        program : Program
+        x : ndarray, optional
+            Input buffer (see Evaluator).
+
+        Returns
+        -------
+        Evaluator or FusedEvaluator
+            The fused program, or the NumPy tape if the backend is NumPy or the
+            program cannot be fused (with a warning).
+        """
+        if self.module is None:
+            return Evaluator(program, x=x)
+        try:
+            return FusedEvaluator(program, self, x=x)
+        except Exception as e:
+            warnings.warn(
+                f"Cannot fuse the program with {self.name} ({type(e).__name__}: "
+                f"{e}): falling back to NumPy.",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+            return Evaluator(program, x=x)
+
+    def gradient(self, program):
+        """
+        Return the derivatives of the metric and of the residuals of a program.
+
+        The tape propagates tangents in forward mode: the residual Jacobian needs
+        one product per column color, the metric gradient one per coordinate it
+        depends on.
+
+        Parameters
+        ----------
+        program : Program
+
+        Returns
+        -------
+        callable
+            gradient(x) returning the gradient of the metric, shape (n_comp,), and
+            the Jacobian of the residuals, shape (n_constraints, n_comp).
+        """
+        jacobian = Jacobian(program)
+        columns, seen = set(), set()
+        stack = [program.objective]
+        while stack:
+            node = stack.pop()
+            if node.index in seen:
+                continue
+            seen.add(node.index)
+            if node.kind == "input":
+                size = node.shape[0] if node.shape else 1
+                columns.update(range(node.value, node.value + size))
+            stack.extend(node.args)
+        basis = np.eye(program.n_comp)
+
+        def gradient(x):
+            jac = jacobian.todense(x)
+            grad = np.zeros(program.n_comp)
+            for j in sorted(columns):
+                grad[j] = jacobian.jvp(basis[j])[0]
+            return grad, jac
+
+        return gradient
+
+
+class NumbaBackend(Backend):
+    """Numba backend: programs are compiled in nopython mode."""
+
+    name = "numba"
+    module = "numba"
+
+    def load(self):
+        self.numba = importlib.import_module("numba")
+        self.compile_op = self.numba.njit
+
+    def compile(self, function):
+        return self.numba.njit(function)
+
+
+class JaxBackend(Backend):
+    """JAX backend: programs are traced with jax.numpy and compiled by XLA."""
+
+    name = "jax"
+    module = "jax"
+
+    def load(self):
+        self.jax = importlib.import_module("jax")
+        self.xp = importlib.import_module("jax.numpy")
+        # Older versions only provide the context manager in jax.experimental.
+        self.enable_x64 = getattr(self.jax, "enable_x64", None)
+        if self.enable_x64 is None:
+            self.enable_x64 = importlib.import_module("jax.experimental").enable_x64
+
+    def compile(self, function):
+        """Return the jit-compiled function, traced and run in float64."""
+        compiled = self.jax.jit(function)
+
+        def run(x):
+            with self.enable_x64(True):
+                return compiled(x)
+
+        return run
+
+    def gradient(self, program):
+        """
+        Return the derivatives of the metric and of the residuals of a program,
+        by forward-mode automatic differentiation of the fused program.
+        """
+        source, namespace = fuse(program, self.xp)
+        exec(compile(source, "<GPEP program>", "exec"), namespace)
+        jacobian = self.compile(self.jax.jacfwd(namespace["program"]))
+
+        def gradient(x):
+            grad, jac = jacobian(x)
+            return np.asarray(grad), np.asarray(jac)
+
+        return gradient
+
+
+BACKENDS = {"numpy": Backend, "numba": NumbaBackend, "jax": JaxBackend}
+
+
+def get_backend(name="numpy"):
+    """
+    Return an array backend by name.
+
+    Parameters
+    ----------
+    name : {"numpy", "numba", "jax"}, optional
+        Default is "numpy".
+
+    Returns
+    -------
+    Backend
+        The loaded backend, or the NumPy backend (with a warning) if the optional
+        package of the requested one is not installed.
+
+    Raises
+    ------
+    ValueError
+        If the name is unknown.
+    """
+    if name not in BACKENDS:
+        raise ValueError(
+            f"Unknown backend {name!r}: expected one of {', '.join(BACKENDS)}."
+        )
+    backend = BACKENDS[name]()
+    try:
+        backend.load()
+    except ImportError:
+        warnings.warn(
+            f"{backend.module} is not installed: falling back to NumPy.",
+            RuntimeWarning,
+            stacklevel=2,
+        )
+        return Backend()
+    return backend
@@ -0,0 +1,278 @@
+#
+# Created in 2026 by Gaëtan Serré
+#
+
+"""
+Allocation-free evaluator for compiled GPEP programs.
+
+The Evaluator turns a Program into a tape of kernel calls over preallocated
+workspace buffers. Inputs are views of a flat solver-vector buffer, constraint
+residuals are written directly into a residual vector and every intermediate
+node owns a buffer sized by shape inference. Once built, run() only calls
+in-place numpy kernels (out= ufuncs): steady-state evaluation performs no
+array allocation.
+
+An optional batch size evaluates many solver vectors at once: every buffer then
+gets a leading batch dimension.
+
+When only a few coordinates of the solver vector change between two evaluations
+(block-coordinate or coordinate-wise search), run_changed() only replays the tape
+entries that depend on the modified inputs and reuses the other buffers.
+"""
+
+import numpy as np
+
+
+class Evaluator:
+    """
+    Tape-based evaluator of a Program.
+
+    Parameters
+    ----------
+    program : Program
+        Compiled problem to evaluate.
+    batch : int or None, optional
+        Number of solver vectors evaluated at once. None (default) evaluates a
+        single vector and uses no batch dimension.
+    dtype : numpy dtype, optional
+        Floating point type of every buffer. Default is numpy.float64.
+    x : ndarray, optional
+        Buffer of shape (batch, n_comp) or (n_comp,) used as input. When given
+        (e.g. Function.storage), the evaluator reads it directly. Otherwise a new
+        buffer is allocated.
+
+    Attributes
+    ----------
+    x : ndarray
+        Input buffer (solver vector(s)).
+    residuals : ndarray
+        Constraint residuals, shape (batch, n_constraints) or (n_constraints,).
+    objective : ndarray
+        Aggregated metric, shape (batch,) or ().
+    buffers : list
+        Buffer of every graph node, indexed by Node.index (None for the nodes that
+        no root of the program depends on).
+    tape : list
+        Pairs (kernel, args) executed in order by run().
+    entries : dict
+        Tape entry computing each operator or aggregator node, by Node.index.
+    copies : dict
+        Tape entry copying a root that is not computed in place (e.g. an input or a
+        node shared by two roots) into its output, by root position (constraints
+        first, then the objective at position len(constraints)).
+    """
+
+    def __init__(self, program, batch=None, dtype=np.float64, x=None):
+        self.program = program
+        self.batch = () if batch is None else (batch,)
+        self.dtype = np.dtype(dtype)
+        if x is None:
+            x = np.zeros(self.batch + (program.n_comp,), dtype=self.dtype)
+        elif x.shape != self.batch + (program.n_comp,) or x.dtype != self.dtype:
+            raise ValueError(
+                f"Input buffer must have shape {self.batch + (program.n_comp,)} "
+                f"and dtype {self.dtype}, got {x.shape} and {x.dtype}."
+            )
+        self.x = x
+        self.residuals = np.zeros(
+            self.batch + (len(program.constraints),), dtype=self.dtype
+        )
+        self.objective = np.zeros(self.batch, dtype=self.dtype)
+        self.buffers = []
+        self.tape = []
+        self.entries = {}
+        self.copies = {}
+        self.consumers = None
+        self.owners = None
+        self.partial_tapes = {}
+        self.build()
+
+    def expand(self, node, shape):
+        """Return the buffer of node broadcastable against a result of the given shape."""
+        buffer = self.buffers[node.index]
+        missing = len(shape) - len(node.shape)
+        if missing > 0:
+            buffer = buffer[(Ellipsis,) + (None,) * missing]
+        return buffer
+
+    def build(self):
+        """Allocate all workspace buffers and record the tape."""
+        targets = {}
+        copies = []
+        roots = [
+            (node, self.residuals[..., i])
+            for i, node in enumerate(self.program.constraints)
+        ]
+        roots.append((self.program.objective, self.objective))
+        for position, (node, out) in enumerate(roots):
+            if node.kind in ("op", "aggr") and node.index not in targets:
+                targets[node.index] = out
+            else:
+                copies.append((position, node, out))
+
+        alive = self.program.reachable()
+        for node in self.program.graph.nodes:
+            if node.index not in alive:
+                buffer = None
+            elif node.kind == "input":
+                if node.shape == ():
+                    buffer = self.x[..., node.value]
+                else:
+                    buffer = self.x[..., node.value : node.value + node.shape[0]]
+            elif node.kind == "const":
+                buffer = np.broadcast_to(
+                    np.asarray(node.value, dtype=self.dtype), self.batch + node.shape
+                )
+            else:
+                buffer = targets.get(node.index)
+                if buffer is None:
+                    buffer = np.zeros(self.batch + node.shape, dtype=self.dtype)
+                args = tuple(self.expand(a, node.shape) for a in node.args)
+                if node.kind == "op":
+                    arg_shape = node.args[1].shape if len(node.args) > 1 else None
+                    kernel = node.op.kernel(node.args[0].shape, arg_shape)
+                else:
+                    kernel = node.op.kernel([a.shape for a in node.args])
+                self.entries[node.index] = (kernel, args + (buffer,))
+                self.tape.append(self.entries[node.index])
+            self.buffers.append(buffer)
+
+        for position, node, out in copies:
+            self.copies[position] = (np.copyto, (out, self.buffers[node.index]))
+            self.tape.append(self.copies[position])
+
+    def build_dependencies(self):
+        """
+        Record the consumers of every node and the input node owning each coordinate.
+        """
+        nodes = self.program.graph.nodes
+        self.consumers = [[] for _ in nodes]
+        self.owners = np.full(self.program.n_comp, -1)
+        for node in nodes:
+            if self.buffers[node.index] is None:
+                continue
+            for a in node.args:
+                self.consumers[a.index].append(node.index)
+            if node.kind == "input":
+                size = node.shape[0] if node.shape else 1
+                self.owners[node.value : node.value + size] = node.index
+
+    def partial_tape(self, inputs):
+        """
+        Return the tape entries that depend on some input nodes.
+
+        Parameters
+        ----------
+        inputs : iterable of int
+            Indices of the modified input nodes.
+
+        Returns
+        -------
+        list
+            Entries of the affected nodes in topological order, followed by the
+            copies of the affected roots. Tapes are cached by set of inputs.
+        """
+        key = frozenset(inputs)
+        if key in self.partial_tapes:
+            return self.partial_tapes[key]
+        if self.consumers is None:
+            self.build_dependencies()
+        dirty = set()
+        stack = list(key)
+        while stack:
+            i = stack.pop()
+            if i in dirty:
+                continue
+            dirty.add(i)
+            stack.extend(self.consumers[i])
+        tape = [self.entries[i] for i in sorted(dirty) if i in self.entries]
+        roots = self.program.roots()
+        for position, entry in self.copies.items():
+            if roots[position].index in dirty:
+                tape.append(entry)
+        if len(self.partial_tapes) >= 1024:
+            self.partial_tapes.clear()
+        self.partial_tapes[key] = tape
+        return tape
+
+    def run_changed(self, indices):
+        """
+        Re-evaluate the nodes depending on some coordinates of x.
+
+        The other buffers keep the values of the previous evaluation, so the result
+        is the one of run() provided that run() (or run_changed()) was called since
+        every other coordinate last changed.
+
+        Parameters
+        ----------
+        indices : array_like of int
+            Coordinates of x modified since the last evaluation.
+        """
+        if self.owners is None:
+            self.build_dependencies()
+        inputs = set(self.owners[indices].tolist())
+        inputs.discard(-1)
+        for kernel, args in self.partial_tape(inputs):
+            kernel(*args)
+
+    def segments(self, order):
+        """
+        Split the tape into one segment per root, for roots evaluated in a given order.
+
+        The segment of a root holds the entries of its dependencies that no earlier
+        root computed. Running the segments in order evaluates the roots one by one,
+        so that evaluation can stop after any of them.
+
+        Parameters
+        ----------
+        order : list of int
+            Root positions (constraints first, then the objective at position
+            len(program.constraints), then the outputs).
+
+        Returns
+        -------
+        list of list
+            Tape entries of each root, following order.
+        """
+        roots = self.program.roots()
+        done = set()
+        segments = []
+        for position in order:
+            cone = []
+            stack = [roots[position]]
+            while stack:
+                node = stack.pop()
+                if node.index in done:
+                    continue
+                done.add(node.index)
+                cone.append(node.index)
+                stack.extend(node.args)
+            segment = [self.entries[i] for i in sorted(cone) if i in self.entries]
+            if position in self.copies:
+                segment.append(self.copies[position])
+            segments.append(segment)
+        return segments
+
+    def run(self):
+        """Evaluate the tape on the current content of x."""
+        for kernel, args in self.tape:
+            kernel(*args)
+
+    def evaluate(self, x):
+        """
+        Copy x into the input buffer and evaluate.
+
+        Parameters
+        ----------
+        x : array_like
+            Solver vector(s) of shape (batch, n_comp) or (n_comp,).
+
+        Returns
+        -------
+        (ndarray, ndarray)
+            The objective and residual buffers (overwritten by the next call).
+        """
+        if x is not self.x:
+            np.copyto(self.x, x)
+        self.run()
+        return self.objective, self.residuals
@@ -0,0 +1,222 @@
+#
+# Created in 2026 by Gaëtan Serré
+#
+
+"""
+Expression graph for the GPEP compiler.
+
+This module lowers Expression trees into a flat DAG of Node objects in
+topological order. Lowering resolves every proxy Variable to its slice of the
+solver vector (see Function.get_layout) and runs shape inference, so that each
+node knows whether it holds a scalar or a d-vector. Sub-expressions shared by
+identity, including the operator-chain prefixes shared by successive iterates,
+are lowered once.
+"""
+
+from ..const import Const
+from ..variable import Variable
+from ..expression import Expression
+from ..operators import Sub
+import numpy as np
+
+
+class Node:
+    """
+    Node of a compiled expression graph.
+
+    Parameters
+    ----------
+    kind : str
+        "input" (slice of the solver vector), "const", "op" (an Operator applied to
+        args[0], args[1] being the evaluated operator argument if any) or "aggr"
+        (an aggregator such as Min/Max applied to all args).
+    shape : tuple
+        Shape of the value, () for scalars and (d,) for vectors.
+    op : Operator or aggregator, optional
+        Operator providing the kernel for "op" and "aggr" nodes.
+    args : iterable of Node, optional
+        Operand nodes.
+    value : any, optional
+        Offset in the solver vector for "input" nodes, constant value for "const" nodes.
+    name : str, optional
+        Human-readable name (Variable id for inputs).
+
+    Attributes
+    ----------
+    index : int
+        Position of the node in Graph.nodes, assigned by Graph.add().
+    """
+
+    __slots__ = ("kind", "shape", "op", "args", "value", "name", "index")
+
+    def __init__(self, kind, shape, op=None, args=(), value=None, name=None):
+        self.kind = kind
+        self.shape = shape
+        self.op = op
+        self.args = list(args)
+        self.value = value
+        self.name = name
+        self.index = None
+
+    def __str__(self):
+        if self.kind == "input":
+            return f"{self.name}[{self.value}]"
+        if self.kind == "const":
+            return f"{self.value}"
+        args = ", ".join(f"%{a.index}" for a in self.args)
+        return f"{type(self.op).__name__}({args})"
+
+
+class Graph:
+    """
+    DAG of Nodes lowered from Expressions, in topological order.
+
+    Parameters
+    ----------
+    layout : list
+        Tuples (Variable, offset, shape) as returned by Function.get_layout(d).
+
+    Attributes
+    ----------
+    nodes : list
+        Nodes in topological order.
+    memo : dict
+        Mapping id(object) -> Node for already lowered objects.
+    """
+
+    def __init__(self, layout):
+        self.layout = {id(v): (v, offset, shape) for v, offset, shape in layout}
+        self.nodes = []
+        self.memo = {}
+        # Keep lowered objects alive so that their ids remain valid keys of memo.
+        self.sources = []
+
+    def add(self, node):
+        """Append a node and return it."""
+        node.index = len(self.nodes)
+        self.nodes.append(node)
+        return node
+
+    def const(self, value):
+        """Add a constant node."""
+        return self.add(Node("const", np.shape(value), value=value))
+
+    def apply(self, op, args):
+        """Add an operator node, inferring its shape from its operands."""
+        arg_shape = args[1].shape if len(args) > 1 else None
+        shape = op.shape(args[0].shape, arg_shape)
+        return self.add(Node("op", shape, op=op, args=args))
+
+    def aggregate(self, aggr, args):
+        """Add an aggregator node (Min, Max, ...) over args."""
+        shape = aggr.shape([a.shape for a in args])
+        return self.add(Node("aggr", shape, op=aggr, args=args))
+
+    def ordering(self, var1, var2, i=0):
+        """
+        Add the residual var1[i] - var2[i] of an ordering between two point Variables.
+
+        Parameters
+        ----------
+        var1, var2 : Variable
+            Variables of the layout (points or gradients).
+        i : int, optional
+            Coordinate compared. Default is 0.
+
+        Returns
+        -------
+        Node
+        """
+        args = []
+        for var in (var1, var2):
+            _, offset, _ = self.layout[id(var)]
+            args.append(
+                self.add(Node("input", (), value=offset + i, name=f"{var.id}[{i}]"))
+            )
+        return self.apply(Sub(None), args)
+
+    def residual(self, constraint):
+        """
+        Lower a Constraint to the node of its canonical residual expr1 - expr2.
+
+        Parameters
+        ----------
+        constraint : Constraint
+
+        Returns
+        -------
+        Node
+        """
+        return self.apply(
+            Sub(None), [self.lower(constraint.expr1), self.lower(constraint.expr2)]
+        )
+
+    @staticmethod
+    def dependencies(obj):
+        """Return the objects that must be lowered before obj."""
+        if isinstance(obj, Variable) or isinstance(obj, Const):
+            return []
+        if isinstance(obj, Expression):
+            if obj.op is None:
+                return [obj.var]
+            if hasattr(obj.op, "expr"):
+                return [obj.parent, obj.op.expr]
+            return [obj.parent]
+        if hasattr(obj, "e_list"):
+            return list(obj.e_list)
+        return []
+
+    def lower(self, obj):
+        """
+        Lower an Expression (or Variable, Const, aggregator, number) into the graph.
+
+        Lowering uses an explicit stack, so arbitrarily deep expressions are supported.
+
+        Parameters
+        ----------
+        obj : Expression, Variable, Const, aggregator or number
+
+        Returns
+        -------
+        Node
+            The node computing obj.
+        """
+        stack = [obj]
+        while stack:
+            top = stack[-1]
+            if id(top) in self.memo:
+                stack.pop()
+                continue
+            deps = [dep for dep in self.dependencies(top) if id(dep) not in self.memo]
+            if deps:
+                stack.extend(deps)
+                continue
+            stack.pop()
+            self.memo[id(top)] = self.build(top)
+            self.sources.append(top)
+        return self.memo[id(obj)]
+
+    def build(self, obj):
+        """Create the node(s) of obj, assuming its dependencies are lowered."""
+        if isinstance(obj, Variable):
+            if id(obj) not in self.layout:
+                return self.const(obj.eval())
+            _, offset, shape = self.layout[id(obj)]
+            if offset is None:
+                return self.const(np.zeros(shape))
+            return self.add(Node("input", shape, value=offset, name=obj.id))
+        if isinstance(obj, Const):
+            return self.const(obj.value)
+        if isinstance(obj, Expression):
+            if obj.op is None:
+                return self.memo[id(obj.var)]
+            args = [self.memo[id(obj.parent)]]
+            if hasattr(obj.op, "expr"):
+                args.append(self.memo[id(obj.op.expr)])
+            return self.apply(obj.op, args)
+        if hasattr(obj, "e_list"):
+            return self.aggregate(obj, [self.memo[id(e)] for e in obj.e_list])
+        return self.const(obj)
+
+    def __str__(self):
+        return "\n".join(f"%{n.index} {n.shape} = {n}" for n in self.nodes)
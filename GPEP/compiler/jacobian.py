@@ -0,0 +1,253 @@
+#
+# Created in 2026 by Gaëtan Serré
+#
+
+"""
+Sparse Jacobian of the constraints of a compiled GPEP program.
+
+Each two-point interpolation constraint only reads the blocks of two points, two
+gradients and two values, so the constraint Jacobian is very sparse. Jacobian
+derives its exact sparsity pattern from the leaves each residual depends on, and
+stores it in CSR form (indptr, indices). Jacobian-vector products are computed by
+forward-mode propagation of tangents through the graph, skipping every node
+whose tangent is zero, and the Jacobian values are recovered from a few products
+thanks to a coloring of structurally orthogonal columns.
+"""
+
+from .evaluator import Evaluator
+import numpy as np
+
+
+class Jacobian:
+    """
+    Sparsity structure and Jacobian-vector products of a Program.
+
+    Parameters
+    ----------
+    program : Program
+        Compiled problem.
+    x : ndarray, optional
+        Input buffer of shape (n_comp,), e.g. Function.storage. A new one is
+        allocated if not given.
+
+    Attributes
+    ----------
+    evaluator : Evaluator
+        Evaluator (without batch dimension) providing the primal values.
+    shape : (int, int)
+        (n_constraints, n_comp).
+    indptr, indices : ndarray
+        CSR structure: the columns of the nonzeros of row i are
+        indices[indptr[i]:indptr[i + 1]], sorted.
+    colors : ndarray
+        Color of each column. Two columns of the same color never appear in the
+        same row.
+    """
+
+    def __init__(self, program, x=None):
+        self.program = program
+        self.evaluator = Evaluator(program, x=x)
+        self.shape = (len(program.constraints), program.n_comp)
+        self.indptr, self.indices = self.sparsity()
+        self.colors = self.color()
+
+    @property
+    def nnz(self):
+        """Number of structural nonzeros."""
+        return len(self.indices)
+
+    def sparsity(self):
+        """
+        Compute the CSR sparsity pattern of the constraint Jacobian.
+
+        Returns
+        -------
+        (ndarray, ndarray)
+            indptr and indices.
+        """
+        leaves = {}
+        for node in self.program.graph.nodes:
+            if node.kind == "input":
+                size = node.shape[0] if node.shape else 1
+                leaves[node.index] = frozenset(range(node.value, node.value + size))
+            elif node.kind == "const":
+                leaves[node.index] = frozenset()
+            else:
+                leaves[node.index] = frozenset().union(
+                    *(leaves[a.index] for a in node.args)
+                )
+        rows = [sorted(leaves[node.index]) for node in self.program.constraints]
+        indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+        np.cumsum([len(row) for row in rows], out=indptr[1:])
+        indices = np.array([c for row in rows for c in row], dtype=np.int64)
+        return indptr, indices
+
+    def color(self):
+        """
+        Greedily color the columns so that no row has two columns of the same color.
+
+        Returns
+        -------
+        ndarray
+            Color of each column (0 for the columns no constraint depends on).
+        """
+        n_rows, n_cols = self.shape
+        rows_of = [[] for _ in range(n_cols)]
+        for i in range(n_rows):
+            for c in self.indices[self.indptr[i] : self.indptr[i + 1]]:
+                rows_of[c].append(i)
+        colors = np.full(n_cols, -1, dtype=np.int64)
+        for c in range(n_cols):
+            forbidden = set()
+            for i in rows_of[c]:
+                forbidden.update(
+                    colors[self.indices[self.indptr[i] : self.indptr[i + 1]]].tolist()
+                )
+            color = 0
+            while color in forbidden:
+                color += 1
+            colors[c] = color
+        return colors
+
+    def tangents(self, v):
+        """
+        Propagate a tangent direction through the graph at the current point.
+
+        Parameters
+        ----------
+        v : ndarray
+            Direction in solver-vector space, shape (n_comp,).
+
+        Returns
+        -------
+        list
+            Tangent of every node (None where it is zero).
+        """
+        evaluator = self.evaluator
+        buffers = evaluator.buffers
+        tangents = []
+        for node in self.program.graph.nodes:
+            tangent = None
+            if buffers[node.index] is None or node.kind == "const":
+                pass
+            elif node.kind == "input":
+                if node.shape == ():
+                    tangent = v[node.value]
+                else:
+                    tangent = v[node.value : node.value + node.shape[0]]
+                if not np.any(tangent):
+                    tangent = None
+            elif node.kind == "op":
+                args = [evaluator.expand(a, node.shape) for a in node.args]
+                dargs = [
+                    self.expand(tangents[a.index], a, node.shape) for a in node.args
+                ]
+                if any(t is not None for t in dargs):
+                    arg, darg = (args[1], dargs[1]) if len(args) > 1 else (None, None)
+                    tangent = node.op.jvp(
+                        args[0], dargs[0], arg, darg, buffers[node.index]
+                    )
+            else:
+                dargs = [tangents[a.index] for a in node.args]
+                if any(t is not None for t in dargs):
+                    args = [buffers[a.index] for a in node.args]
+                    tangent = node.op.jvp(args, dargs, buffers[node.index])
+            if tangent is not None and np.shape(tangent) != node.shape:
+                tangent = np.broadcast_to(tangent, node.shape)
+            tangents.append(tangent)
+        return tangents
+
+    @staticmethod
+    def expand(tangent, node, shape):
+        """Expand a tangent like Evaluator.expand expands its node's buffer."""
+        if tangent is None:
+            return None
+        missing = len(shape) - len(node.shape)
+        if missing > 0:
+            tangent = tangent[(Ellipsis,) + (None,) * missing]
+        return tangent
+
+    def evaluate(self, x):
+        """
+        Evaluate the program at x.
+
+        Parameters
+        ----------
+        x : array_like
+            Flat solver vector.
+        """
+        self.evaluator.evaluate(x)
+
+    def jvp(self, v, x=None):
+        """
+        Return the Jacobian-vector products of the constraints and of the metric.
+
+        Parameters
+        ----------
+        v : array_like
+            Direction, shape (n_comp,).
+        x : array_like, optional
+            Point of evaluation. Defaults to the point of the last evaluation.
+
+        Returns
+        -------
+        (float, ndarray)
+            Directional derivatives of the metric and of the residuals.
+        """
+        if x is not None:
+            self.evaluate(x)
+        tangents = self.tangents(np.asarray(v, dtype=float))
+        jv = np.zeros(self.shape[0])
+        for i, node in enumerate(self.program.constraints):
+            if tangents[node.index] is not None:
+                jv[i] = tangents[node.index]
+        dobj = tangents[self.program.objective.index]
+        return (0.0 if dobj is None else float(dobj)), jv
+
+    def values(self, x=None):
+        """
+        Return the values of the structural nonzeros of the Jacobian.
+
+        One Jacobian-vector product is computed per column color.
+
+        Parameters
+        ----------
+        x : array_like, optional
+            Point of evaluation. Defaults to the point of the last evaluation.
+
+        Returns
+        -------
+        ndarray
+            data aligned with indices: (data, indices, indptr) is the CSR Jacobian.
+        """
+        if x is not None:
+            self.evaluate(x)
+        rows = np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+        data = np.zeros(self.nnz)
+        n_colors = int(self.colors.max()) + 1 if self.shape[1] > 0 else 0
+        for color in range(n_colors):
+            v = (self.colors == color).astype(float)
+            _, jv = self.jvp(v)
+            mask = self.colors[self.indices] == color
+            data[mask] = jv[rows[mask]]
+        return data
+
+    def todense(self, x=None):
+        """
+        Return the Jacobian as a dense array (mostly for checking).
+
+        Parameters
+        ----------
+        x : array_like, optional
+            Point of evaluation.
+
+        Returns
+        -------
+        ndarray
+            Array of shape (n_constraints, n_comp).
+        """
+        data = self.values(x)
+        dense = np.zeros(self.shape)
+        rows = np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+        dense[rows, self.indices] = data
+        return dense
@@ -0,0 +1,90 @@
+#
+# Created in 2026 by Gaëtan Serré
+#
+
+"""
+Compiled performance estimation problem.
+"""
+
+
+class Program:
+    """
+    A Graph together with the roots evaluated by the solver.
+
+    Parameters
+    ----------
+    graph : Graph
+        Lowered expression graph.
+    constraints : list of Node
+        Residual nodes (expr1 - expr2) of the constraints, in solver order.
+    objective : Node
+        Node of the aggregated performance metric.
+    n_comp : int
+        Size of the solver vector.
+    keys : list, optional
+        One key per constraint identifying where it comes from, e.g. the pair of
+        points (k1, k2) of an interpolation constraint, or None. Defaults to None
+        for every constraint.
+    outputs : list of Node, optional
+        Additional nodes (e.g. registered expressions) whose values are kept in
+        their evaluator buffers. Defaults to none.
+    """
+
+    def __init__(self, graph, constraints, objective, n_comp, keys=None, outputs=None):
+        self.graph = graph
+        self.constraints = constraints
+        self.objective = objective
+        self.n_comp = n_comp
+        self.keys = [None] * len(constraints) if keys is None else keys
+        self.outputs = [] if outputs is None else outputs
+
+    def roots(self):
+        """
+        Return the roots of the program.
+
+        Returns
+        -------
+        list of Node
+            Constraints, then the objective (at position len(constraints)), then
+            the outputs.
+        """
+        return self.constraints + [self.objective] + self.outputs
+
+    def restrict(self, indices):
+        """
+        Return the program restricted to a subset of its constraints.
+
+        Parameters
+        ----------
+        indices : iterable of int
+            Positions of the constraints to keep, in the new order.
+
+        Returns
+        -------
+        Program
+            Program over the same graph.
+        """
+        indices = list(indices)
+        constraints = [self.constraints[i] for i in indices]
+        keys = [self.keys[i] for i in indices]
+        return Program(
+            self.graph, constraints, self.objective, self.n_comp, keys, self.outputs
+        )
+
+    def reachable(self):
+        """
+        Return the indices of the nodes the roots depend on.
+
+        Returns
+        -------
+        set of int
+        """
+        alive = set()
+        stack = self.roots()
+        while stack:
+            node = stack.pop()
+            if node.index in alive:
+                continue
+            alive.add(node.index)
+            stack.extend(node.args)
+        return alive
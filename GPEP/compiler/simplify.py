@@ -0,0 +1,250 @@
+#
+# Created in 2026 by Gaëtan Serré
+#
+
+"""
+Algebraic simplification pass for compiled GPEP programs.
+
+The pass rebuilds a Program node by node in topological order and applies local
+rewrites while doing so:
+
+- constant folding of every node whose operands are constants, such as
+  1 / (2 * L) or mu / (2 * (1 - mu / L));
+- canonicalization of reversed operators (`r` flag) and of commutative operands;
+- identities with 0 and 1 (notably the zero gradients of stationary points),
+  x - x, and division by a constant turned into a multiplication;
+- collapsing of chains of scalar multiplies, including the Mul(-1) of negations;
+- fusion of norm() ** 2 and x · x into a single squared-norm (SqNorm) kernel;
+- common subexpression elimination by structural hashing, so that differences
+  such as (x1 - x2) shared by several constraints are computed once.
+
+Dead nodes are removed at the end. The simplified program evaluates to the same
+values as the original one up to floating-point rounding.
+"""
+
+from .graph import Node, Graph
+from .program import Program
+from ..operators import Add, Sub, Mul, Div, Pow, Dot, Norm, SqNorm, Eq, Ne
+import numpy as np
+
+COMMUTATIVE = (Add, Mul, Dot, Eq, Ne)
+
+
+def is_const(node, value=None):
+    """Return True if node is a constant (equal to value everywhere, if given)."""
+    if node is None or node.kind != "const":
+        return False
+    return value is None or bool(np.all(np.asarray(node.value) == value))
+
+
+def is_scalar_const(node):
+    """Return True if node is a scalar constant."""
+    return is_const(node) and node.shape == ()
+
+
+class Simplifier:
+    """
+    Rebuild a Program with algebraic rewrites and hash-consing.
+
+    Parameters
+    ----------
+    program : Program
+        Program to simplify. It is left untouched.
+    """
+
+    def __init__(self, program):
+        self.program = program
+        self.graph = Graph([])
+        self.cache = {}
+
+    def intern(self, key, node):
+        """Return the node already registered under key, or register node."""
+        if key not in self.cache:
+            self.cache[key] = self.graph.add(node)
+        return self.cache[key]
+
+    def input(self, node):
+        key = ("input", node.value, node.shape)
+        return self.intern(
+            key, Node("input", node.shape, value=node.value, name=node.name)
+        )
+
+    def const(self, value):
+        value = np.asarray(value, dtype=float)
+        key = ("const", value.shape, value.tobytes())
+        return self.intern(key, Node("const", value.shape, value=value))
+
+    def fold(self, kernel, args, shape):
+        """Evaluate a kernel on constant operands and return the constant node."""
+        values = []
+        for a in args:
+            value = np.asarray(a.value, dtype=float)
+            missing = len(shape) - value.ndim
+            if missing > 0:
+                value = value[(Ellipsis,) + (None,) * missing]
+            values.append(value)
+        out = np.zeros(shape)
+        kernel(*values, out)
+        return self.const(out)
+
+    def aggregate(self, aggr, args):
+        shapes = [a.shape for a in args]
+        shape = aggr.shape(shapes)
+        if all(is_const(a) for a in args):
+            return self.fold(aggr.kernel(shapes), args, shape)
+        key = ("aggr", type(aggr), tuple(sorted(a.index for a in args)))
+        return self.intern(key, Node("aggr", shape, op=aggr, args=args))
+
+    def apply(self, op, args):
+        """
+        Return the node computing op on args, after rewriting and hash-consing.
+
+        Parameters
+        ----------
+        op : Operator
+        args : list of Node
+            Already simplified operands.
+
+        Returns
+        -------
+        Node
+        """
+        if getattr(op, "r", False):
+            op = type(op)(None)
+            args = [args[1], args[0]]
+        arg_shape = args[1].shape if len(args) > 1 else None
+        shape = op.shape(args[0].shape, arg_shape)
+        if all(is_const(a) for a in args):
+            return self.fold(op.kernel(args[0].shape, arg_shape), args, shape)
+
+        node = self.rewrite(op, args, shape)
+        if node is not None:
+            return node
+
+        if isinstance(op, COMMUTATIVE) and is_const(args[0]):
+            args = [args[1], args[0]]
+        indices = tuple(a.index for a in args)
+        if isinstance(op, COMMUTATIVE):
+            indices = tuple(sorted(indices))
+        key = ("op", type(op), indices)
+        return self.intern(key, Node("op", shape, op=op, args=args))
+
+    def rewrite(self, op, args, shape):
+        """Apply the local rewrite rules; return None if none applies."""
+        a = args[0]
+        b = args[1] if len(args) > 1 else None
+
+        if isinstance(op, COMMUTATIVE) and is_const(a):
+            a, b = b, a
+
+        if isinstance(op, (Add, Sub)) and is_const(b, 0) and a.shape == shape:
+            return a
+        if isinstance(op, Sub) and a is b:
+            return self.const(np.zeros(shape))
+        if isinstance(op, Sub) and is_const(a, 0) and b.shape == shape:
+            return self.apply(Mul(None), [b, self.const(-1.0)])
+
+        if isinstance(op, Mul):
+            if is_const(b, 0):
+                return self.const(np.zeros(shape))
+            if is_const(b, 1) and a.shape == shape:
+                return a
+            if (
+                is_scalar_const(b)
+                and a.kind == "op"
+                and isinstance(a.op, Mul)
+                and is_scalar_const(a.args[1])
+            ):
+                return self.apply(
+                    Mul(None), [a.args[0], self.const(a.args[1].value * b.value)]
+                )
+
+        if isinstance(op, Div) and is_scalar_const(b) and not is_const(b, 0):
+            return self.apply(Mul(None), [a, self.const(1.0 / b.value)])
+
+        if isinstance(op, Pow):
+            if is_const(b, 1) and a.shape == shape:
+                return a
+            if (
+                is_const(b, 2)
+                and a.kind == "op"
+                and isinstance(a.op, Norm)
+                and is_const(a.args[1], 2)
+            ):
+                return self.apply(SqNorm(), [a.args[0]])
+
+        if isinstance(op, Dot):
+            if shape != ():
+                return self.apply(Mul(None), [a, b])
+            if is_const(b, 0):
+                return self.const(np.zeros(shape))
+            if a is b:
+                return self.apply(SqNorm(), [a])
+
+        return None
+
+    def run(self):
+        """
+        Simplify the program.
+
+        Returns
+        -------
+        Program
+            New program over a new graph, without dead nodes.
+        """
+        mapping = {}
+        for node in self.program.graph.nodes:
+            args = [mapping[a.index] for a in node.args]
+            if node.kind == "input":
+                new = self.input(node)
+            elif node.kind == "const":
+                new = self.const(node.value)
+            elif node.kind == "op":
+                new = self.apply(node.op, args)
+            else:
+                new = self.aggregate(node.op, args)
+            mapping[node.index] = new
+
+        constraints = [mapping[n.index] for n in self.program.constraints]
+        objective = mapping[self.program.objective.index]
+        outputs = [mapping[n.index] for n in self.program.outputs]
+        self.prune(constraints + [objective] + outputs)
+        return Program(
+            self.graph,
+            constraints,
+            objective,
+            self.program.n_comp,
+            self.program.keys,
+            outputs,
+        )
+
+    def prune(self, roots):
+        """Remove the nodes that no root depends on and renumber the others."""
+        alive = set()
+        stack = list(roots)
+        while stack:
+            node = stack.pop()
+            if node.index in alive:
+                continue
+            alive.add(node.index)
+            stack.extend(node.args)
+        nodes = [n for n in self.graph.nodes if n.index in alive]
+        for i, node in enumerate(nodes):
+            node.index = i
+        self.graph.nodes = nodes
+        self.cache = {}
+
+
+def simplify(program):
+    """
+    Return an algebraically simplified copy of a Program.
+
+    Parameters
+    ----------
+    program : Program
+
+    Returns
+    -------
+    Program
+    """
+    return Simplifier(program).run()
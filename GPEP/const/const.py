@@ -13,6 +13,8 @@ class Const:
         The constant value.
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, value):
         self.value = value
 
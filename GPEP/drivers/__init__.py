@@ -0,0 +1,9 @@
+#
+# Created in 2026 by Gaëtan Serré
+#
+
+from .continuation import continuation, lift
+from .dimension import grow_dimension
+from .racing import default_portfolio, race
+from .parameter import critical_parameter, optimal_parameter
+from .branch_and_bound import branch_and_bound
@@ -0,0 +1,295 @@
+#
+# Created in 2026 by Gaëtan Serré
+#
+
+"""
+Deterministic spatial branch-and-bound for small GPEP problems.
+
+The search space is a box of the solver vector. Boxes are explored best first,
+by decreasing upper bound of the metric: each one is split in two along its
+widest coordinate (relative to the initial box), and the children are bounded by
+interval evaluation of the compiled program (see GPEP.compiler.IntervalEvaluator).
+A child is discarded when a constraint residual is certainly positive over it, or
+when the upper bound of its metric cannot beat the incumbent by more than the
+tolerance. The incumbent is the best feasible center of the boxes evaluated so
+far (or a given warm start, e.g. the Solution of a global search).
+
+When the search ends, the largest upper bound among the remaining and discarded
+boxes bounds the worst case over the whole box in dimension d: the gap between
+the incumbent and this bound measures what is left to prove. Boxes are processed
+in batches with vectorized interval evaluation, and with several processes the
+initial box is split among forked workers sharing the incumbent.
+"""
+
+from ..compiler import Evaluator, IntervalEvaluator
+from ..solution import Solution
+import heapq
+import itertools
+import multiprocessing
+import os
+import time
+import numpy as np
+
+# Problem shared with the forked workers.
+state = {}
+
+
+def bound_boxes(lo, hi):
+    """Return the interval bounds of the objective and residuals over boxes."""
+    return state["intervals"].evaluate(lo, hi)
+
+
+def feasible_centers(lo, hi):
+    """Return the metric at the centers of boxes, -inf where infeasible."""
+    evaluator = state["evaluator"]
+    size = evaluator.x.shape[0]
+    centers = (lo + hi) / 2
+    metrics = np.empty(len(centers))
+    for start in range(0, len(centers), size):
+        chunk = centers[start : start + size]
+        evaluator.x[: len(chunk)] = chunk
+        evaluator.run()
+        m = evaluator.objective[: len(chunk)]
+        r = evaluator.residuals[: len(chunk)]
+        feasible = np.all(r <= state["feasibility"], axis=1) if r.shape[1] else True
+        metrics[start : start + size] = np.where(feasible & np.isfinite(m), m, -np.inf)
+    return centers, metrics
+
+
+def search(boxes, node_limit):
+    """
+    Run the branch-and-bound on a list of boxes (in a worker or in the caller).
+
+    Parameters
+    ----------
+    boxes : list of (ndarray, ndarray)
+        Boxes (lo, hi) to explore.
+    node_limit : int
+        Maximal number of boxes bounded.
+
+    Returns
+    -------
+    (float, ndarray or None, float, int, bool)
+        Best feasible metric found and its solver vector, upper bound of the metric
+        over the boxes, number of boxes bounded, and whether the search finished
+        (False if the node limit stopped it).
+    """
+    shared, tol, batch = state["shared"], state["tol"], state["batch"]
+    width = state["width"]
+    best_value, best_x = -np.inf, None
+    discarded = -np.inf
+    counter = itertools.count()
+    heap = []
+
+    def threshold():
+        """Upper bound a box must exceed to be kept."""
+        value = max(best_value, shared.value)
+        return value + tol * max(1.0, abs(value)) if np.isfinite(value) else value
+
+    def push(lo, hi, upper):
+        nonlocal discarded
+        for i in range(len(lo)):
+            if upper[i] > threshold():
+                heapq.heappush(heap, (-upper[i], next(counter), lo[i], hi[i]))
+            else:
+                discarded = max(discarded, upper[i])
+
+    def update(lo, hi):
+        nonlocal best_value, best_x
+        olo, ohi, rlo, _ = bound_boxes(lo, hi)
+        feasible = np.all(rlo <= state["feasibility"], axis=1)
+        centers, metrics = feasible_centers(lo, hi)
+        i = int(np.argmax(metrics))
+        if metrics[i] > best_value:
+            best_value, best_x = float(metrics[i]), centers[i].copy()
+            with shared.get_lock():
+                shared.value = max(shared.value, best_value)
+        push(lo[feasible], hi[feasible], ohi[feasible])
+
+    lo = np.array([b[0] for b in boxes])
+    hi = np.array([b[1] for b in boxes])
+    update(lo, hi)
+    n_nodes = len(boxes)
+    while heap and n_nodes < node_limit:
+        if -heap[0][0] <= threshold():
+            break
+        popped = [heapq.heappop(heap) for _ in range(min(batch, len(heap)))]
+        lo = np.array([p[2] for p in popped])
+        hi = np.array([p[3] for p in popped])
+        axis = np.argmax((hi - lo) / width, axis=1)
+        rows = np.arange(len(popped))
+        mid = (lo[rows, axis] + hi[rows, axis]) / 2
+        left_hi, right_lo = hi.copy(), lo.copy()
+        left_hi[rows, axis] = mid
+        right_lo[rows, axis] = mid
+        update(np.concatenate([lo, right_lo]), np.concatenate([left_hi, hi]))
+        n_nodes += 2 * len(popped)
+    upper = max(-heap[0][0] if heap else -np.inf, discarded, best_value)
+    complete = not heap or -heap[0][0] <= threshold()
+    return best_value, best_x, upper, n_nodes, complete
+
+
+def split(lo, hi, n, width):
+    """Split a box into n boxes of equal size, halving the widest sides first."""
+    boxes = [(lo, hi)]
+    while len(boxes) < n:
+        lo, hi = boxes.pop(0)
+        axis = int(np.argmax((hi - lo) / width))
+        mid = (lo[axis] + hi[axis]) / 2
+        left_hi, right_lo = hi.copy(), lo.copy()
+        left_hi[axis] = mid
+        right_lo[axis] = mid
+        boxes += [(lo, left_hi), (right_lo, hi)]
+    return boxes
+
+
+def default_bounds(f, d, radius):
+    """
+    Return the box [-radius, radius] of the solver vector, with the invariances fixed.
+
+    The problem is invariant under a common translation of the points and under
+    adding a constant to each Function, so the first stationary point is fixed at
+    the origin and every Function has value 0 at its first stationary point.
+    """
+    bounds = np.tile([-radius, radius], (f.get_nb_components(d), 1)).astype(float)
+    layout = {v.id: offset for v, offset, _ in f.get_layout(d)}
+    for g in getattr(f, "functions", [f]):
+        k = next(iter(g.stat_grads), None)
+        if k is not None:
+            bounds[layout[g.values[k].id]] = 0
+    k = next(iter(f.stat_grads), None)
+    if k is not None:
+        bounds[layout[f.points[k].id] : layout[f.points[k].id] + d] = 0
+    return bounds
+
+
+def branch_and_bound(
+    pep,
+    d=1,
+    bounds=None,
+    radius=10.0,
+    node_limit=100_000,
+    tol=1e-4,
+    feasibility=1e-6,
+    batch=64,
+    x0=None,
+    processes=None,
+    verbose=0,
+):
+    """
+    Bound the worst case of a small problem by interval branch-and-bound.
+
+    Parameters
+    ----------
+    pep : GPEP
+        Problem to solve.
+    d : int, optional
+        Ambient dimension of points and gradients. Default is 1.
+    bounds : ndarray or None, optional
+        Box of the solver vector, shape (n_comp, 2). Coordinates with equal ends
+        are fixed. Defaults to [-radius, radius] for every coordinate, except the
+        first stationary point and the value of each Function at its first
+        stationary point, fixed at 0 (see default_bounds).
+    radius : float, optional
+        Half-width of the default box. Default is 10.
+    node_limit : int, optional
+        Maximal number of boxes bounded, split evenly among the workers. Default
+        is 100000.
+    tol : float, optional
+        Boxes are discarded when their upper bound exceeds the incumbent by at
+        most tol * max(1, |incumbent|). Default is 1e-4.
+    feasibility : float, optional
+        Constraint violation below which a point is considered feasible. Default
+        is 1e-6.
+    batch : int, optional
+        Number of boxes split at once by each worker. Default is 64.
+    x0 : Solution, ndarray or None, optional
+        Warm start giving the initial incumbent if it is feasible.
+    processes : int or None, optional
+        Number of worker processes. Defaults to the number of CPUs.
+    verbose : int, optional
+        Print a summary when non-zero.
+
+    Returns
+    -------
+    Solution
+        The incumbent (the center of the initial box if no feasible point was
+        found), whose upper_bound is the proven bound of the metric over the box
+        in dimension d and n_eval the number of boxes bounded.
+    """
+    start = time.perf_counter()
+    if bounds is None:
+        bounds = default_bounds(pep.f, d, radius)
+    lo, hi = np.array(bounds[:, 0], dtype=float), np.array(bounds[:, 1], dtype=float)
+    width = np.where(hi > lo, hi - lo, np.inf)
+    processes = os.cpu_count() if processes is None else processes
+    fork = "fork" in multiprocessing.get_all_start_methods()
+    workers = processes if processes > 1 and fork else 1
+
+    program = pep.compile(d)
+    context = multiprocessing.get_context("fork" if fork else None)
+    shared = context.Value("d", -np.inf)
+    evaluator = Evaluator(program, batch=2 * batch)
+    best_value, best_x = -np.inf, None
+    if x0 is not None:
+        z = x0.vector(pep.f, d) if isinstance(x0, Solution) else np.asarray(x0)
+        evaluator.x[0] = z
+        evaluator.run()
+        if np.all(evaluator.residuals[0] <= feasibility):
+            best_value, best_x = float(evaluator.objective[0]), z.copy()
+            shared.value = best_value
+    state.update(
+        intervals=IntervalEvaluator(program),
+        evaluator=evaluator,
+        shared=shared,
+        tol=tol,
+        feasibility=feasibility,
+        batch=batch,
+        width=width,
+    )
+    tic = time.perf_counter()
+    try:
+        if workers > 1:
+            boxes = split(lo, hi, workers, width)
+            with context.Pool(workers) as pool:
+                results = pool.starmap(
+                    search, [([box], node_limit // workers) for box in boxes]
+                )
+        else:
+            results = [search([(lo, hi)], node_limit)]
+    finally:
+        state.clear()
+    elapsed = time.perf_counter() - tic
+
+    for value, x, _, _, _ in results:
+        if value > best_value:
+            best_value, best_x = value, x
+    upper = max(max(r[2] for r in results), best_value)
+    n_nodes = sum(r[3] for r in results)
+    complete = all(r[4] for r in results)
+    if verbose:
+        status = "complete" if complete else "node limit reached"
+        print(
+            f"Branch-and-bound: [{best_value:.6g}, {upper:.6g}] "
+            f"({n_nodes} boxes, {status})"
+        )
+
+    x = (lo + hi) / 2 if best_x is None else best_x
+    F = pep.objective(d)
+    objective = F(x, verbose=False, only_obj=True)
+    timings = {
+        "compile": tic - start,
+        "optimize": elapsed,
+        "total": time.perf_counter() - start,
+    }
+    return Solution.from_function(
+        pep.f,
+        d,
+        x,
+        objective,
+        F.evaluator.residuals,
+        F.program.keys,
+        n_nodes,
+        timings,
+        upper_bound=upper,
+    )
@@ -0,0 +1,168 @@
+#
+# Created in 2026 by Gaëtan Serré
+#
+
+"""
+Continuation over the number of iterations of an algorithm.
+
+The worst-case instance for t iterations is usually close to the one for t - 1
+with one more iterate appended. continuation() solves t = t0, ..., T in turn and
+seeds each stage with the previous optimum lifted into the enlarged layout of the
+Function (more points and expressions, larger dimension).
+"""
+
+from ..compiler import Jacobian
+from ..solution import pack
+import numpy as np
+
+
+def lift(solution, pep, d=None, iterations=50, tol=1e-10):
+    """
+    Lift a Solution into the layout of a larger problem with more proxies.
+
+    The Variables shared with the solution keep their values, and vectors are
+    zero-padded to the new dimension. The new value and gradient proxies (e.g. of
+    the iterate appended by one more iteration) start from the last known ones
+    registered before them, then are repaired: with the previous coordinates
+    fixed, Gauss-Newton steps on the squared positive residuals move the new
+    coordinates towards the interpolation constraints of the class. For the
+    convex classes, the residuals are convex in the gradient and value of the
+    appended point, which becomes feasible; otherwise (e.g. SmoothFunction) the
+    violation only decreases and the solver completes the repair.
+
+    Parameters
+    ----------
+    solution : Solution
+        Solution of the smaller problem.
+    pep : GPEP
+        Larger problem.
+    d : int or None, optional
+        Ambient dimension of the larger problem. Defaults to pep.get_dimension().
+    iterations : int, optional
+        Maximal number of Gauss-Newton steps. Default is 50.
+    tol : float, optional
+        Residual below which a constraint is considered satisfied. Default is 1e-10.
+
+    Returns
+    -------
+    dict
+        Values by Variable id, usable as the x0 of GPEP.solve.
+    """
+    f = pep.f
+    d = pep.get_dimension() if d is None else d
+    variables = dict(solution.variables)
+    for proxies in (f.values, f.grads):
+        previous = None
+        for v in proxies.values():
+            if v.id in variables:
+                previous = variables[v.id]
+            elif previous is not None:
+                variables[v.id] = previous
+
+    f.check_storage(d)
+    layout = [
+        (v, offset, shape) for v, offset, shape in f.get_layout(d) if offset is not None
+    ]
+    free = np.zeros(f.get_nb_components(d), dtype=bool)
+    for v, offset, shape in layout:
+        if v.id not in solution.variables:
+            free[offset : offset + (shape[0] if shape else 1)] = True
+    x = pack(f, d, variables)
+    if free.any():
+        x = repair(Jacobian(pep.compile(d)), x, free, iterations, tol)
+    for v, offset, shape in layout:
+        variables[v.id] = x[offset : offset + shape[0]].copy() if shape else x[offset]
+    return variables
+
+
+def repair(jacobian, x, free, iterations, tol):
+    """
+    Decrease the positive residuals of a program by moving the free coordinates.
+
+    Parameters
+    ----------
+    jacobian : Jacobian
+        Jacobian of the program.
+    x : ndarray
+        Solver vector.
+    free : ndarray
+        Boolean mask of the coordinates that may move.
+    iterations : int
+        Maximal number of Gauss-Newton steps.
+    tol : float
+        Residual below which a constraint is considered satisfied.
+
+    Returns
+    -------
+    ndarray
+        The repaired solver vector.
+    """
+
+    def violation(z):
+        residuals = jacobian.evaluator.evaluate(z)[1]
+        return np.sum(np.maximum(residuals, 0) ** 2), residuals.copy()
+
+    value, residuals = violation(x)
+    for _ in range(iterations):
+        active = residuals > tol
+        if not active.any():
+            break
+        rows = jacobian.todense(x)[active][:, free]
+        step = np.linalg.lstsq(rows, -residuals[active], rcond=None)[0]
+        t = 1.0
+        while t > 1e-8:
+            candidate = x.copy()
+            candidate[free] += t * step
+            candidate_value, candidate_residuals = violation(candidate)
+            if candidate_value < value:
+                break
+            t /= 2
+        else:
+            break
+        x, value, residuals = candidate, candidate_value, candidate_residuals
+    return x
+
+
+def continuation(build, function, T, t0=1, verbose=0, **kwargs):
+    """
+    Solve the PEPs of t = t0, ..., T iterations, each warm-started from the previous.
+
+    Parameters
+    ----------
+    build : callable
+        build(f, t) simulates t iterations of the algorithm on the Function f and
+        returns the GPEP problem (initial conditions and metric set).
+    function : callable
+        Factory returning a new Function instance, e.g.
+        lambda: SmoothStronglyConvexFunction(L=1, mu=0.1).
+    T : int
+        Last number of iterations.
+    t0 : int, optional
+        First number of iterations. Default is 1.
+    verbose : int, optional
+        Print the worst-case value of every stage when non-zero.
+    **kwargs
+        Options of GPEP.solve (opt, calibrate, ...), shared by all stages. Warm
+        starts are passed to factories accepting an m_0 keyword, which can then use
+        a smaller initial spread than for the cold first stage.
+
+    Returns
+    -------
+    dict
+        Solution of every t; the worst-case values {t: solution.objective} form
+        the rate curve.
+    """
+    solutions = {}
+    previous = None
+    for t in range(t0, T + 1):
+        f = function()
+        pep = build(f, t)
+        x0 = None if previous is None else lift(previous, pep, kwargs.get("d"))
+        solution = pep.solve(x0=x0, **kwargs)
+        if verbose:
+            print(
+                f"t={t}: {solution.objective} (max violation {solution.max_violation:.3g})"
+            )
+        solutions[t] = solution
+        previous = solution
+    return solutions
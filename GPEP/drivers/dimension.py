@@ -0,0 +1,91 @@
+#
+# Created in 2026 by Gaëtan Serré
+#
+
+"""
+Low-rank worst-case search with automatic dimension growth.
+
+The ambient dimension d = nb_points + nb_grads can represent any Gram matrix, but
+worst-case instances are often of rank 1 or 2, and the size of the solver vector
+grows linearly with d. grow_dimension() solves the problem in a small dimension
+first. It then probes one more dimension with a short search started from the
+lifted solution (the new coordinates start at 0, so that the lifted point has the
+same objective and feasibility), and only grows d when the probe improves the
+worst-case value.
+"""
+
+from gob.optimizers import CMA_ES
+
+
+def improves(candidate, solution, tol):
+    """Return True if candidate is at least as feasible and has a larger objective."""
+    feasible = candidate.max_violation <= max(tol, solution.max_violation)
+    margin = tol * max(1.0, abs(solution.objective))
+    return feasible and candidate.objective > solution.objective + margin
+
+
+def grow_dimension(
+    pep,
+    d0=1,
+    step=1,
+    probe_eval=2000,
+    probe_sigma0=0.1,
+    tol=1e-6,
+    verbose=0,
+    **kwargs,
+):
+    """
+    Solve a problem in increasing ambient dimension, while it improves the worst case.
+
+    Parameters
+    ----------
+    pep : GPEP
+        Problem to solve.
+    d0 : int, optional
+        Initial dimension. Default is 1.
+    step : int, optional
+        Dimension increment. Default is 1.
+    probe_eval : int, optional
+        Evaluation budget of the CMA-ES probe run in the next dimension. Default is
+        2000.
+    probe_sigma0 : float, optional
+        Initial spread of the probe around the lifted solution. Default is 0.1.
+    tol : float, optional
+        Relative improvement of the objective (and violation) considered
+        significant. Default is 1e-6.
+    verbose : int, optional
+        Print every dimension tried when non-zero.
+    **kwargs
+        Options of GPEP.solve (opt, calibrate, backend, ...) used for every solve,
+        except that the probes replace opt and x0.
+
+    Returns
+    -------
+    Solution
+        Best solution found; its dimension is solution.d.
+    """
+    d_max = pep.get_dimension()
+    d = min(d0, d_max)
+    solution = pep.solve(d=d, **kwargs)
+    if verbose:
+        print(f"d={d}: {solution.objective}")
+    while d < d_max:
+        d_next = min(d + step, d_max)
+        probe_kwargs = dict(
+            kwargs,
+            x0=solution,
+            opt=lambda b, m_0=None: CMA_ES(
+                b, n_eval=probe_eval, sigma0=probe_sigma0, m_0=m_0
+            ),
+        )
+        probe = pep.solve(d=d_next, **probe_kwargs)
+        if verbose:
+            print(f"d={d_next} (probe): {probe.objective}")
+        if not improves(probe, solution, tol):
+            break
+        candidate = pep.solve(d=d_next, **dict(kwargs, x0=probe))
+        solution = candidate if improves(candidate, probe, 0.0) else probe
+        d = d_next
+        if verbose:
+            print(f"d={d}: {solution.objective}")
+    return solution
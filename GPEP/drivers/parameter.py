@@ -0,0 +1,331 @@
+#
+# Created in 2026 by Gaëtan Serré
+#
+
+"""
+Adaptive search over a scalar parameter of a problem builder (e.g. a step size).
+
+critical_parameter() finds by bisection the largest parameter whose worst-case
+value stays below a target (e.g. a contraction factor below 1). Worst-case values
+found by GPEP are lower bounds: a cheap solve that already exceeds the target
+proves the parameter unsafe, so each bisection step starts with a reduced budget
+and only spends the full budget when the cheap solve is inconclusive.
+
+optimal_parameter() minimizes the worst-case value over the parameter by
+golden-section search or Brent's method. The budget of each solve grows
+geometrically as the bracket shrinks, from min_eval at the initial bracket to
+max_eval at the tolerance, so that precision is only paid for near the optimum.
+Each step solves the new trial parameter only: the values of the points carried
+over keep the budget they were solved with, and the returned parameter is solved
+again with the full budget.
+
+Every solve is warm-started from the solution at the nearest parameter evaluated
+so far (the layouts are identical when only the parameter changes).
+"""
+
+from .racing import rank
+from functools import partial
+import math
+import numpy as np
+from gob.optimizers import CMA_ES
+
+
+def default_optimizer(bounds, n_eval, m_0=None):
+    """
+    Return a CMA-ES with n_eval evaluations.
+
+    Its initial spread is half the width of the bounds for a cold start, and a
+    tenth of it around a warm start.
+    """
+    sigma0 = float(np.mean(bounds[:, 1] - bounds[:, 0])) / 2
+    if m_0 is not None:
+        sigma0 /= 10
+    return CMA_ES(bounds, n_eval=n_eval, sigma0=sigma0, m_0=m_0)
+
+
+class ParameterSolves:
+    """
+    Solves of a problem builder at several parameters, with warm starts.
+
+    Parameters
+    ----------
+    build : callable
+        build(f, p) returns the GPEP problem of parameter p on the Function f.
+    function : callable
+        Factory returning a new Function instance.
+    optimizer : callable
+        Factory optimizer(bounds, n_eval, m_0=None).
+    tol : float
+        Constraint violation below which a solution is considered feasible.
+    verbose : int
+        Print every solve when non-zero.
+    kwargs : dict
+        Other options of GPEP.solve.
+
+    Attributes
+    ----------
+    solutions : dict
+        Best solution found at every parameter.
+    n_solves, n_eval : int
+        Number of solves and of objective evaluations so far.
+    """
+
+    def __init__(self, build, function, optimizer, tol, verbose, kwargs):
+        self.build = build
+        self.function = function
+        self.optimizer = optimizer
+        self.tol = tol
+        self.verbose = verbose
+        self.kwargs = kwargs
+        self.solutions = {}
+        self.n_solves = 0
+        self.n_eval = 0
+
+    def solve(self, p, n_eval, x0=None):
+        """
+        Solve the problem of parameter p with a budget of n_eval evaluations.
+
+        Parameters
+        ----------
+        p : float
+        n_eval : int
+        x0 : Solution, optional
+            Warm start. Defaults to the solution at the nearest parameter.
+
+        Returns
+        -------
+        Solution
+            Best solution found at p so far.
+        """
+        if x0 is None and self.solutions:
+            x0 = self.solutions[min(self.solutions, key=lambda q: abs(q - p))]
+        pep = self.build(self.function(), p)
+        opt = partial(self.optimizer, n_eval=int(n_eval))
+        solution = pep.solve(opt=opt, x0=x0, **self.kwargs)
+        self.n_solves += 1
+        self.n_eval += solution.n_eval
+        if p not in self.solutions or rank(solution, self.tol) < rank(
+            self.solutions[p], self.tol
+        ):
+            self.solutions[p] = solution
+        if self.verbose:
+            best = self.solutions[p]
+            print(
+                f"p={p:.6g} ({int(n_eval)} evaluations): {best.objective} "
+                f"(max violation {best.max_violation:.3g})"
+            )
+        return self.solutions[p]
+
+    def value(self, p, n_eval):
+        """Return the worst-case value at p (+inf if no feasible point is found)."""
+        solution = self.solve(p, n_eval)
+        return solution.objective if solution.max_violation <= self.tol else np.inf
+
+
+def critical_parameter(
+    build,
+    function,
+    lo,
+    hi,
+    target=1.0,
+    tol=1e-3,
+    min_eval=5_000,
+    max_eval=100_000,
+    feasibility=1e-6,
+    optimizer=None,
+    verbose=0,
+    **kwargs,
+):
+    """
+    Find the largest parameter whose worst-case value stays below a target.
+
+    The parameters in [lo, p*] are assumed safe (worst case <= target) and those
+    in (p*, hi] unsafe.
+
+    Parameters
+    ----------
+    build : callable
+        build(f, p) simulates the algorithm with parameter p on the Function f and
+        returns the GPEP problem.
+    function : callable
+        Factory returning a new Function instance.
+    lo, hi : float
+        Safe and unsafe ends of the initial bracket.
+    target : float, optional
+        Largest acceptable worst-case value. Default is 1.
+    tol : float, optional
+        Width of the final bracket. Default is 1e-3.
+    min_eval, max_eval : int, optional
+        Budgets of the cheap and full solves. Defaults are 5000 and 100000.
+    feasibility : float, optional
+        Constraint violation below which a solution is considered feasible.
+        Default is 1e-6.
+    optimizer : callable or None, optional
+        Factory optimizer(bounds, n_eval, m_0=None). Defaults to
+        default_optimizer.
+    verbose : int, optional
+        Print every solve when non-zero.
+    **kwargs
+        Other options of GPEP.solve (d, calibrate, ...).
+
+    Returns
+    -------
+    (float, dict)
+        The safe end of the final bracket, and the solutions by parameter.
+    """
+    optimizer = default_optimizer if optimizer is None else optimizer
+    solves = ParameterSolves(build, function, optimizer, feasibility, verbose, kwargs)
+
+    def unsafe(p):
+        solution = solves.solve(p, min_eval)
+        if solution.max_violation <= feasibility and solution.objective > target:
+            return True
+        solution = solves.solve(p, max_eval, x0=solution)
+        return solution.max_violation <= feasibility and solution.objective > target
+
+    while hi - lo > tol:
+        mid = (lo + hi) / 2
+        if unsafe(mid):
+            hi = mid
+        else:
+            lo = mid
+    if verbose:
+        print(f"Critical parameter in [{lo:.6g}, {hi:.6g}] ({solves.n_solves} solves)")
+    return lo, solves.solutions
+
+
+def golden_section(F, lo, hi, tol):
+    """Minimize F(p, width) over [lo, hi] by golden-section search."""
+    invphi = (math.sqrt(5) - 1) / 2
+    a, b = lo, hi
+    c, d = b - invphi * (b - a), a + invphi * (b - a)
+    fc, fd = F(c, b - a), F(d, b - a)
+    while b - a > tol:
+        if fc < fd:
+            b, d, fd = d, c, fc
+            c = b - invphi * (b - a)
+            fc = F(c, b - a)
+        else:
+            a, c, fc = c, d, fd
+            d = a + invphi * (b - a)
+            fd = F(d, b - a)
+    return c if fc < fd else d
+
+
+def brent(F, lo, hi, tol):
+    """Minimize F(p, width) over [lo, hi] by Brent's method."""
+    golden = (3 - math.sqrt(5)) / 2
+    a, b = lo, hi
+    x = w = v = a + golden * (b - a)
+    fx = fw = fv = F(x, b - a)
+    d = e = 0.0
+    tol1, tol2 = tol / 4, tol / 2
+    while abs(x - (a + b) / 2) > tol2 - (b - a) / 2:
+        m = (a + b) / 2
+        parabolic = False
+        if abs(e) > tol1:
+            r = (x - w) * (fx - fv)
+            q = (x - v) * (fx - fw)
+            p = (x - v) * q - (x - w) * r
+            q = 2 * (q - r)
+            if q > 0:
+                p = -p
+            q = abs(q)
+            previous, e = e, d
+            if abs(p) < abs(q * previous / 2) and q * (a - x) < p < q * (b - x):
+                d = p / q
+                if (x + d) - a < tol2 or b - (x + d) < tol2:
+                    d = tol1 if x < m else -tol1
+                parabolic = True
+        if not parabolic:
+            e = (a - x) if x >= m else (b - x)
+            d = golden * e
+        u = x + d if abs(d) >= tol1 else x + math.copysign(tol1, d)
+        fu = F(u, b - a)
+        if fu <= fx:
+            if u >= x:
+                a = x
+            else:
+                b = x
+            v, w, x = w, x, u
+            fv, fw, fx = fw, fx, fu
+        else:
+            if u < x:
+                a = u
+            else:
+                b = u
+            if fu <= fw or w == x:
+                v, w = w, u
+                fv, fw = fw, fu
+            elif fu <= fv or v == x or v == w:
+                v, fv = u, fu
+    return x
+
+
+def optimal_parameter(
+    build,
+    function,
+    lo,
+    hi,
+    tol=1e-3,
+    method="brent",
+    min_eval=5_000,
+    max_eval=100_000,
+    feasibility=1e-6,
+    optimizer=None,
+    verbose=0,
+    **kwargs,
+):
+    """
+    Find the parameter minimizing the worst-case value (e.g. the rate).
+
+    Parameters
+    ----------
+    build : callable
+        build(f, p) simulates the algorithm with parameter p on the Function f and
+        returns the GPEP problem.
+    function : callable
+        Factory returning a new Function instance.
+    lo, hi : float
+        Initial bracket.
+    tol : float, optional
+        Width of the final bracket. Default is 1e-3.
+    method : {"brent", "golden"}, optional
+        Brent's method (parabolic steps safeguarded by golden sections) or plain
+        golden-section search. Default is "brent".
+    min_eval, max_eval : int, optional
+        Budgets of the solves at the initial bracket and at the tolerance.
+        Defaults are 5000 and 100000.
+    feasibility : float, optional
+        Constraint violation below which a solution is considered feasible.
+        Default is 1e-6.
+    optimizer : callable or None, optional
+        Factory optimizer(bounds, n_eval, m_0=None). Defaults to
+        default_optimizer.
+    verbose : int, optional
+        Print every solve when non-zero.
+    **kwargs
+        Other options of GPEP.solve (d, calibrate, ...).
+
+    Returns
+    -------
+    (float, dict)
+        The optimal parameter, solved with the full budget, and the solutions by
+        parameter.
+    """
+    if method not in ("brent", "golden"):
+        raise ValueError(f"Unknown method {method!r}: expected 'brent' or 'golden'.")
+    optimizer = default_optimizer if optimizer is None else optimizer
+    solves = ParameterSolves(build, function, optimizer, feasibility, verbose, kwargs)
+    span = math.log(max((hi - lo) / tol, 1 + 1e-12))
+
+    def F(p, width):
+        progress = min(max(math.log((hi - lo) / max(width, tol)) / span, 0.0), 1.0)
+        return solves.value(p, min_eval * (max_eval / min_eval) ** progress)
+
+    search = brent if method == "brent" else golden_section
+    p = search(F, lo, hi, tol)
+    solves.solve(p, max_eval)
+    if verbose:
+        print(f"Optimal parameter {p:.6g} ({solves.n_solves} solves)")
+    return p, solves.solutions
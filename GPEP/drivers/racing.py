@@ -0,0 +1,142 @@
+#
+# Created in 2026 by Gaëtan Serré
+#
+
+"""
+Racing a portfolio of global optimizers on a GPEP problem.
+
+Which optimizer wins depends on the problem class. race() runs several candidates
+by successive halving: the total evaluation budget is split into rounds of equal
+cost, every surviving candidate runs in parallel for its share of the round,
+warm-started from its own best point so far, and only the best half (by best
+feasible objective) survives to the next round. The budget of the losers thus goes
+to the leaders.
+
+Candidates run in worker processes forked from the caller, which inherit the
+problem and the factories, so that neither has to be pickled. Without fork
+support, or with processes=1, they run sequentially.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+import math
+import multiprocessing
+import os
+from gob.optimizers import CMA_ES, PSO
+
+# Problem and candidates inherited by the forked workers.
+state = {}
+
+
+def default_portfolio():
+    """
+    Return the default candidates: CMA-ES with three initial spreads, and PSO.
+
+    Returns
+    -------
+    dict
+        Factories (bounds, n_eval, m_0=None) -> optimizer, by name.
+    """
+
+    def cma(sigma0):
+        def factory(bounds, n_eval, m_0=None):
+            return CMA_ES(bounds, n_eval=n_eval, sigma0=sigma0, m_0=m_0)
+
+        return factory
+
+    def pso(bounds, n_eval):
+        return PSO(bounds, n_particles=100, iter=max(1, n_eval // 100))
+
+    return {
+        "CMA-ES(sigma0=1)": cma(1),
+        "CMA-ES(sigma0=3)": cma(3),
+        "CMA-ES(sigma0=10)": cma(10),
+        "PSO": pso,
+    }
+
+
+def rank(solution, tol):
+    """Sorting key: feasible solutions first, by decreasing objective."""
+    return (max(solution.max_violation - tol, 0.0), -solution.objective)
+
+
+def run_candidate(name, n_eval, x0):
+    """Run one candidate with a budget of n_eval evaluations (in a worker)."""
+    pep, candidates, kwargs = state["pep"], state["candidates"], state["kwargs"]
+    opt = partial(candidates[name], n_eval=n_eval)
+    return pep.solve(opt=opt, x0=x0, **kwargs)
+
+
+def race(
+    pep,
+    candidates=None,
+    budget=200_000,
+    eta=2,
+    processes=None,
+    tol=1e-6,
+    verbose=0,
+    **kwargs,
+):
+    """
+    Race a portfolio of optimizers on a problem by successive halving.
+
+    Parameters
+    ----------
+    pep : GPEP
+        Problem to solve.
+    candidates : dict or None, optional
+        Optimizer factories by name, called as factory(bounds, n_eval) (and with
+        m_0=x0 when they accept it, to resume from their best point). Defaults to
+        default_portfolio().
+    budget : int, optional
+        Total number of evaluations, shared by all the candidates. Default is
+        200000.
+    eta : int, optional
+        Only the best 1/eta of the candidates survive each round. Default is 2.
+    processes : int or None, optional
+        Number of worker processes. Defaults to the number of CPUs.
+    tol : float, optional
+        Constraint violation below which a solution is considered feasible.
+        Default is 1e-6.
+    verbose : int, optional
+        Print the standings after each round when non-zero.
+    **kwargs
+        Other options of GPEP.solve (d, calibrate, lazy, ...).
+
+    Returns
+    -------
+    Solution
+        Best solution found by any candidate.
+    """
+    candidates = default_portfolio() if candidates is None else candidates
+    names = list(candidates)
+    n_rounds = math.ceil(math.log(len(names), eta)) + 1 if len(names) > 1 else 1
+    processes = os.cpu_count() if processes is None else processes
+    fork = "fork" in multiprocessing.get_all_start_methods()
+
+    state.update(pep=pep, candidates=candidates, kwargs=kwargs)
+    best = {}
+    try:
+        for r in range(n_rounds):
+            n_eval = max(1, budget // n_rounds // len(names))
+            jobs = [(name, n_eval, best.get(name)) for name in names]
+            if processes > 1 and len(names) > 1 and fork:
+                context = multiprocessing.get_context("fork")
+                workers = min(processes, len(names))
+                with ProcessPoolExecutor(workers, mp_context=context) as pool:
+                    results = list(pool.map(run_candidate, *zip(*jobs)))
+            else:
+                results = [run_candidate(*job) for job in jobs]
+            for name, solution in zip(names, results):
+                if name not in best or rank(solution, tol) < rank(best[name], tol):
+                    best[name] = solution
+            names.sort(key=lambda name: rank(best[name], tol))
+            if verbose:
+                print(f"Round {r + 1}/{n_rounds} ({n_eval} evaluations each):")
+                for name in names:
+                    s = best[name]
+                    print(f"\t{name}: {s.objective} (violation {s.max_violation:.3g})")
+            names = names[: max(1, math.ceil(len(names) / eta))]
+    finally:
+        state.clear()
+    return best[names[0]]
@@ -2,4 +2,5 @@
 # Created in 2024 by Gaëtan Serré
 #
 
-from .expression import Expression, emin, emax
+from .expression import Expression, emin, emax, esoftmin
+from .stats import graph_stats
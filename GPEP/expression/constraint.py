@@ -28,6 +28,8 @@ class Constraint:
         Symbolic representation used for printing (e.g. '<', '<=', '==').
     """
 
+    __slots__ = ("expr1", "expr2", "op", "sym")
+
     def __init__(self, expr1, expr2, op, sym):
         self.expr1 = expr1
         self.expr2 = expr2
@@ -21,6 +21,7 @@ the operators package and constraint.py in this project.
 """
 
 from ..const import Const
+from functools import partial
 from ..operators import *
 from .constraint import Constraint
 import numpy as np
@@ -35,17 +36,91 @@ class Expression:
     var : Variable or Const
         The base variable or constant for the expression. Must implement eval().
     op_list : list, optional
-        Sequence of operator nodes to apply (each providing eval/str). Defaults to [].
+        Sequence of operator nodes to apply (each providing eval/str). Defaults to None
+        (no operator).
+
+    Attributes
+    ----------
+    parent : Expression or None
+        Expression to which op is applied, None for a bare base variable/constant.
+    op : Operator or None
+        Last operator of the chain.
+    depth : int
+        Number of operators in the chain.
 
     Notes
     -----
-    Operator overloads append operator nodes and return new Expression instances.
+    The operator sequence is stored as a persistent linked chain: operator overloads
+    return a new Expression pointing to self as parent, in O(1) time and memory.
+    Expressions derived from the same prefix (e.g. successive iterates of an
+    algorithm) share it instead of copying it.
     Comparison overloads return Constraint objects.
     """
 
-    def __init__(self, var, op_list=[]):
+    __slots__ = ("var", "parent", "op", "depth", "hash_")
+
+    def __init__(self, var, op_list=None):
         self.var = var
-        self.op_list = op_list
+        self.parent = None
+        self.op = None
+        self.depth = 0
+        if op_list:
+            parent = Expression(var)
+            for op in op_list[:-1]:
+                parent = parent.apply(op)
+            self.link(parent, op_list[-1])
+
+    def link(self, parent, op):
+        """
+        Make self the result of applying op to parent.
+
+        Parameters
+        ----------
+        parent : Expression
+            Prefix of the chain.
+        op : Operator
+            Operator applied to parent.
+        """
+        self.parent = parent
+        self.op = op
+        self.depth = parent.depth + 1
+        self.hash_ = hash((hash(parent), op))
+
+    def apply(self, op):
+        """
+        Return a new Expression applying op to self, in O(1).
+
+        Parameters
+        ----------
+        op : Operator
+            Operator node to append.
+
+        Returns
+        -------
+        Expression
+            Expression whose chain is self's chain followed by op.
+        """
+        expr = Expression(self.var)
+        expr.link(self, op)
+        return expr
+
+    @property
+    def op_list(self):
+        """
+        List of operators applied to var, in application order.
+
+        Returns
+        -------
+        list
+            Materialized operator chain (O(depth)).
+        """
+        op_list = []
+        expr = self
+        while expr.op is not None:
+            op_list.append(expr.op)
+            expr = expr.parent
+        op_list.reverse()
+        return op_list
 
     def eval(self):
         """
@@ -89,56 +164,52 @@ class Expression:
         str
             A readable nested representation built by folding operator .str(...) calls.
         """
-
-        def rec_aux(op_list):
-            if op_list == []:
-                return str(self.var)
-            else:
-                return op_list[-1].str(rec_aux(op_list[:-1]))
-
-        return rec_aux(self.op_list)
+        s = str(self.var)
+        for op in self.op_list:
+            s = op.str(s)
+        return s
 
     def __add__(self, other):
         other = self.conv_to_const(other)
-        return Expression(self.var, self.op_list + [Add(other)])
+        return self.apply(Add(other))
 
     def __radd__(self, other):
         return self.__add__(other)
 
     def __sub__(self, other, r=False):
         other = self.conv_to_const(other)
-        return Expression(self.var, self.op_list + [Sub(other, r)])
+        return self.apply(Sub(other, r))
 
     def __rsub__(self, other):
         return self.__sub__(other, r=True)
 
     def __mul__(self, other):
         other = self.conv_to_const(other)
-        return Expression(self.var, self.op_list + [Mul(other)])
+        return self.apply(Mul(other))
 
     def __rmul__(self, other):
         return self.__mul__(other)
 
     def __neg__(self):
-        return Expression(self.var, self.op_list + [Mul(Const(-1))])
+        return self.apply(Mul(Const(-1)))
 
     def __pow__(self, other, r=False):
         other = self.conv_to_const(other)
-        return Expression(self.var, self.op_list + [Pow(other, r)])
+        return self.apply(Pow(other, r))
 
     def __rpow__(self, other):
         return self.__pow__(other, r=True)
 
     def __truediv__(self, other, r=False):
         other = self.conv_to_const(other)
-        return Expression(self.var, self.op_list + [Div(other, r)])
+        return self.apply(Div(other, r))
 
     def __rtruediv__(self, other):
         return self.__truediv__(other, r=True)
 
     def dot(self, other):
         other = self.conv_to_const(other)
-        return Expression(self.var, self.op_list + [Dot(other)])
+        return self.apply(Dot(other))
 
     def __matmul__(self, other):
         return self.dot(other)
@@ -161,27 +232,29 @@ class Expression:
 
     def __eq__(self, other):
         other = self.conv_to_const(other)
-        return Expression(self.var, self.op_list + [Eq(other)])
+        return self.apply(Eq(other))
 
     def __ne__(self, other):
         other = self.conv_to_const(other)
-        return Expression(self.var, self.op_list + [Ne(other)])
+        return self.apply(Ne(other))
 
     def norm(self, other=2):
         other = self.conv_to_const(other)
-        return Expression(self.var, self.op_list + [Norm(other)])
+        return self.apply(Norm(other))
 
     def abs(self):
-        return Expression(self.var, self.op_list + [Abs()])
+        return self.apply(Abs())
 
     def exp(self):
-        return Expression(self.var, self.op_list + [Exp()])
+        return self.apply(Exp())
 
     def log(self):
-        return Expression(self.var, self.op_list + [Log()])
+        return self.apply(Log())
 
     def __hash__(self):
-        return hash((self.var, tuple(self.op_list)))
+        if self.op is None:
+            return hash((self.var, ()))
+        return self.hash_
 
 
 class ExpressionList(Expression):
@@ -200,10 +273,148 @@ class ExpressionList(Expression):
     The aggregator class must implement eval() to compute the aggregated value.
     """
 
+    __slots__ = ()
+
     def __init__(self, e_list, aggr_cls):
         super().__init__(aggr_cls(e_list))
 
 
+def aggregate_kernel(ufunc, shapes):
+    """
+    Build a kernel folding a binary ufunc (numpy.minimum/maximum) over several values.
+
+    Scalar values are folded in place into out. Non-scalar values are first reduced
+    over all their entries, as np.min/np.max do on a list of arrays.
+
+    Parameters
+    ----------
+    ufunc : numpy.ufunc
+        Binary ufunc used to fold the values.
+    shapes : list of tuple
+        Shapes of the aggregated values.
+
+    Returns
+    -------
+    callable
+        kernel(*values, out).
+    """
+    if all(shape == () for shape in shapes):
+
+        def kernel(*args):
+            out = args[-1]
+            np.copyto(out, args[0])
+            for value in args[1:-1]:
+                ufunc(out, value, out=out)
+
+        return kernel
+
+    axes = [tuple(range(-len(shape), 0)) for shape in shapes]
+
+    def kernel(*args):
+        out = args[-1]
+        np.copyto(out, ufunc.reduce(args[0], axis=axes[0]))
+        for value, axis in zip(args[1:-1], axes[1:]):
+            ufunc(out, ufunc.reduce(value, axis=axis), out=out)
+
+    return kernel
+
+
+def aggregate_interval(ufunc, shapes):
+    """
+    Build the interval extension of a minimum or maximum over several values.
+
+    The extremum of intervals is the interval of the extrema of their ends.
+
+    Parameters
+    ----------
+    ufunc : numpy.ufunc
+        numpy.minimum or numpy.maximum.
+    shapes : list of tuple
+        Shapes of the aggregated values.
+
+    Returns
+    -------
+    callable
+        interval(*bounds) mapping the pairs (lo, hi) of the values to (lo, hi).
+    """
+    axes = [tuple(range(-len(shape), 0)) for shape in shapes]
+
+    def extension(*bounds):
+        lo = hi = None
+        for (vlo, vhi), axis in zip(bounds, axes):
+            vlo, vhi = ufunc.reduce(vlo, axis=axis), ufunc.reduce(vhi, axis=axis)
+            lo = vlo if lo is None else ufunc(lo, vlo)
+            hi = vhi if hi is None else ufunc(hi, vhi)
+        return lo, hi
+
+    return extension
+
+
+def aggregate_function(fold, reduce, shapes):
+    """
+    Build a pure minimum or maximum over several values for the JIT backends.
+
+    Parameters
+    ----------
+    fold : callable
+        Binary elementwise extremum of the array module (xp.minimum/xp.maximum).
+    reduce : callable
+        Reduction of the array module (xp.min/xp.max), applied to non-scalar values.
+    shapes : list of tuple
+        Shapes of the aggregated values.
+
+    Returns
+    -------
+    callable
+        function(*values) returning the extremum (see Operator.function).
+    """
+    if len(shapes) == 1:
+        return (lambda value: value) if shapes[0] == () else reduce
+    if all(shape == () for shape in shapes):
+
+        def function(*values):
+            out = values[0]
+            for value in values[1:]:
+                out = fold(out, value)
+            return out
+
+        return function
+
+    def function(*values):
+        out = reduce(values[0])
+        for value in values[1:]:
+            out = fold(out, reduce(value))
+        return out
+
+    return function
+
+
+def aggregate_jvp(values, tangents, out):
+    """
+    Return the tangent of a minimum or maximum: the tangent of the selected element.
+
+    Parameters
+    ----------
+    values : list of ndarray
+        Aggregated values (no batch dimension).
+    tangents : list of ndarray or None
+        Their tangents (None if zero).
+    out : ndarray
+        The aggregate.
+
+    Returns
+    -------
+    ndarray or None
+    """
+    for value, tangent in zip(values, tangents):
+        hits = np.flatnonzero(np.asarray(value) == out)
+        if hits.size > 0:
+            if tangent is None:
+                return None
+            return np.broadcast_to(tangent, np.shape(value)).flat[hits[0]]
+    return None
+
+
 class Min:
     """
     Aggregator returning the minimum value among a list of expressions.
@@ -214,6 +425,8 @@ class Min:
         Iterable of Expression objects whose values will be compared.
     """
 
+    __slots__ = ("e_list",)
+
     def __init__(self, e_list):
         self.e_list = e_list
 
@@ -228,6 +441,65 @@ class Min:
         """
         return np.min([e.eval() for e in self.e_list])
 
+    def shape(self, shapes):
+        """
+        Return the shape of the aggregate: a scalar.
+
+        Parameters
+        ----------
+        shapes : list of tuple
+            Shapes of the aggregated expressions.
+
+        Returns
+        -------
+        tuple
+            ().
+        """
+        return ()
+
+    def kernel(self, shapes):
+        """
+        Return an allocation-free minimum over the aggregated values.
+
+        Returns
+        -------
+        callable
+            kernel(*values, out) writing the minimum into out.
+        """
+        return aggregate_kernel(np.minimum, shapes)
+
+    def interval(self, shapes):
+        """
+        Return the interval extension of the minimum.
+
+        Returns
+        -------
+        callable
+            interval(*bounds) mapping the pairs (lo, hi) of the values to (lo, hi).
+        """
+        return aggregate_interval(np.minimum, shapes)
+
+    def function(self, xp, shapes):
+        """
+        Return a pure minimum over the aggregated values (see Operator.function).
+
+        Returns
+        -------
+        callable
+            function(*values) returning the minimum.
+        """
+        return aggregate_function(xp.minimum, xp.min, shapes)
+
+    def jvp(self, values, tangents, out):
+        """
+        Return the tangent of the minimum: the tangent of the selected value.
+
+        Returns
+        -------
+        ndarray or None
+        """
+        return aggregate_jvp(values, tangents, out)
+
     def __hash__(self):
         return hash(tuple(self.e_list))
 
@@ -242,6 +514,8 @@ class Max:
         Iterable of Expression objects whose values will be compared.
     """
 
+    __slots__ = ("e_list",)
+
     def __init__(self, e_list):
         self.e_list = e_list
 
@@ -256,6 +530,214 @@ class Max:
         """
         return np.max([e.eval() for e in self.e_list])
 
+    def shape(self, shapes):
+        """
+        Return the shape of the aggregate: a scalar.
+
+        Parameters
+        ----------
+        shapes : list of tuple
+            Shapes of the aggregated expressions.
+
+        Returns
+        -------
+        tuple
+            ().
+        """
+        return ()
+
+    def kernel(self, shapes):
+        """
+        Return an allocation-free maximum over the aggregated values.
+
+        Returns
+        -------
+        callable
+            kernel(*values, out) writing the maximum into out.
+        """
+        return aggregate_kernel(np.maximum, shapes)
+
+    def interval(self, shapes):
+        """
+        Return the interval extension of the maximum.
+
+        Returns
+        -------
+        callable
+            interval(*bounds) mapping the pairs (lo, hi) of the values to (lo, hi).
+        """
+        return aggregate_interval(np.maximum, shapes)
+
+    def function(self, xp, shapes):
+        """
+        Return a pure maximum over the aggregated values (see Operator.function).
+
+        Returns
+        -------
+        callable
+            function(*values) returning the maximum.
+        """
+        return aggregate_function(xp.maximum, xp.max, shapes)
+
+    def jvp(self, values, tangents, out):
+        """
+        Return the tangent of the maximum: the tangent of the selected value.
+
+        Returns
+        -------
+        ndarray or None
+        """
+        return aggregate_jvp(values, tangents, out)
+
+    def __hash__(self):
+        return hash(tuple(self.e_list))
+
+
+def softmin(values, temperature):
+    """
+    Return the log-sum-exp soft minimum of values along the last axis.
+
+    softmin(v) = -temperature * log(sum(exp(-v / temperature))), computed stably.
+    It lies in [min(v) - temperature * log(n), min(v)] and tends to min(v) when the
+    temperature tends to 0.
+
+    Parameters
+    ----------
+    values : ndarray
+    temperature : float
+
+    Returns
+    -------
+    ndarray
+    """
+    m = np.min(values, axis=-1)
+    z = np.exp(-(values - m[..., None]) / temperature)
+    return m - temperature * np.log(np.sum(z, axis=-1))
+
+
+class SoftMin:
+    """
+    Aggregator returning a temperature-controlled soft minimum of expressions.
+
+    The log-sum-exp soft minimum is a smooth lower approximation of Min whose error
+    is at most temperature * log(n). The temperature can be lowered during a solve
+    (annealing) to converge to the hard minimum.
+
+    Parameters
+    ----------
+    e_list : iterable
+        Iterable of Expression objects whose values will be compared.
+    temperature : float, optional
+        Initial temperature. Default is 1.
+    """
+
+    __slots__ = ("e_list", "temperature")
+
+    def __init__(self, e_list, temperature=1.0):
+        self.e_list = e_list
+        self.temperature = temperature
+
+    def eval(self):
+        """
+        Evaluate all expressions and return their soft minimum.
+
+        Returns
+        -------
+        float
+        """
+        values = np.concatenate([np.ravel(e.eval()) for e in self.e_list])
+        return softmin(values, self.temperature)
+
+    def shape(self, shapes):
+        """
+        Return the shape of the aggregate: a scalar.
+
+        Parameters
+        ----------
+        shapes : list of tuple
+            Shapes of the aggregated expressions.
+
+        Returns
+        -------
+        tuple
+            ().
+        """
+        return ()
+
+    def kernel(self, shapes):
+        """
+        Return a soft-minimum kernel reading the current temperature at each call.
+
+        Unlike Min, the kernel allocates a few temporaries.
+
+        Returns
+        -------
+        callable
+            kernel(*values, out) writing the soft minimum into out.
+        """
+        sizes = [len(shape) for shape in shapes]
+
+        def kernel(*args):
+            out = args[-1]
+            values = [
+                np.reshape(v, np.shape(v)[: np.ndim(v) - k] + (-1,))
+                for v, k in zip(args[:-1], sizes)
+            ]
+            batch = np.shape(out)
+            values = [np.broadcast_to(v, batch + v.shape[-1:]) for v in values]
+            np.copyto(out, softmin(np.concatenate(values, axis=-1), self.temperature))
+
+        return kernel
+
+    def interval(self, shapes):
+        """
+        Return the interval extension of the soft minimum.
+
+        The soft minimum of n values lies in [min - temperature * log(n), min].
+
+        Returns
+        -------
+        callable
+            interval(*bounds) mapping the pairs (lo, hi) of the values to (lo, hi).
+        """
+        minimum = aggregate_interval(np.minimum, shapes)
+        n = sum(int(np.prod(shape)) for shape in shapes)
+
+        def extension(*bounds):
+            lo, hi = minimum(*bounds)
+            return lo - self.temperature * np.log(n), hi
+
+        return extension
+
+    def function(self, xp, shapes):
+        """
+        Raise NotImplementedError: a compiled function would freeze the temperature,
+        which changes during a solve (annealing). Soft-minimum programs are
+        evaluated by the NumPy tape.
+        """
+        raise NotImplementedError("SoftMin has no array function")
+
+    def jvp(self, values, tangents, out):
+        """
+        Return the tangent of the soft minimum: the softmax(-v / temperature) average
+        of the tangents.
+
+        Returns
+        -------
+        ndarray or None
+        """
+        if all(t is None for t in tangents):
+            return None
+        v = np.concatenate([np.ravel(value) for value in values])
+        dv = np.concatenate(
+            [
+                np.ravel(np.broadcast_to(0.0 if t is None else t, np.shape(value)))
+                for value, t in zip(values, tangents)
+            ]
+        )
+        weights = np.exp(-(v - out) / self.temperature)
+        return np.dot(weights, dv) / np.sum(weights)
+
     def __hash__(self):
         return hash(tuple(self.e_list))
 
@@ -292,3 +774,22 @@ def emax(e_list):
         ExpressionList wrapping a Max aggregator.
     """
     return ExpressionList(e_list, Max)
+
+
+def esoftmin(e_list, temperature=1.0):
+    """
+    Construct an ExpressionList that evaluates to a soft minimum (see SoftMin).
+
+    Parameters
+    ----------
+    e_list : iterable
+        Iterable of Expression objects.
+    temperature : float, optional
+        Initial temperature. Default is 1.
+
+    Returns
+    -------
+    ExpressionList
+        ExpressionList wrapping a SoftMin aggregator.
+    """
+    return ExpressionList(e_list, partial(SoftMin, temperature=temperature))
@@ -0,0 +1,110 @@
+#
+# Created in 2026 by Gaëtan Serré
+#
+
+"""
+Memory and structure statistics of expression graphs.
+
+graph_stats walks the objects reachable from a set of roots (Expressions,
+Variables, Consts, Operators, aggregators and Constraints), counting each
+distinct object once, and reports how large the corresponding DAG is.
+"""
+
+import sys
+from ..const import Const
+from .constraint import Constraint
+from .expression import Expression
+
+
+def children(obj):
+    """
+    Return the graph objects referenced by obj.
+
+    Parameters
+    ----------
+    obj : Expression, Const, Operator, aggregator or Constraint
+
+    Returns
+    -------
+    list
+    """
+    if isinstance(obj, Constraint):
+        return [obj.expr1, obj.expr2]
+    if isinstance(obj, Const):
+        return []
+    if isinstance(obj, Expression):
+        if obj.var is obj:
+            return []
+        if obj.op is None:
+            return [obj.var]
+        return [obj.parent, obj.op]
+    if hasattr(obj, "e_list"):
+        return list(obj.e_list)
+    expr = getattr(obj, "expr", None)
+    if expr is not None:
+        return [expr]
+    return []
+
+
+def sizeof(obj):
+    """Return the approximate size in bytes of a graph object, including its __dict__."""
+    size = sys.getsizeof(obj)
+    if hasattr(obj, "__dict__"):
+        size += sys.getsizeof(obj.__dict__)
+    if hasattr(obj, "e_list"):
+        size += sys.getsizeof(obj.e_list)
+    return size
+
+
+def graph_stats(roots):
+    """
+    Compute structure and memory statistics of the DAG reachable from roots.
+
+    Parameters
+    ----------
+    roots : iterable
+        Expressions, Constraints or aggregators.
+
+    Returns
+    -------
+    dict
+        - "nodes": number of distinct objects (expressions, variables, constants,
+          operators, aggregators and constraints);
+        - "depth": length of the longest path from a root to a leaf;
+        - "tree_size": number of nodes the graph would have without any sharing;
+        - "sharing": tree_size / nodes, the average number of uses of a node;
+        - "bytes": approximate memory footprint of the distinct objects (numeric
+          values held by Variables are not counted).
+    """
+    roots = list(roots)
+    order = []
+    seen = set()
+    stack = [(root, False) for root in roots]
+    while stack:
+        obj, expanded = stack.pop()
+        if expanded:
+            order.append(obj)
+            continue
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        stack.append((obj, True))
+        stack.extend((child, False) for child in children(obj))
+
+    depth = {}
+    tree_size = {}
+    for obj in order:
+        kids = children(obj)
+        depth[id(obj)] = 1 + max((depth[id(c)] for c in kids), default=-1)
+        tree_size[id(obj)] = 1 + sum(tree_size[id(c)] for c in kids)
+
+    ids = {id(root) for root in roots}
+    nodes = len(order)
+    total = sum(tree_size[i] for i in ids)
+    return {
+        "nodes": nodes,
+        "depth": max((depth[i] for i in ids), default=0),
+        "tree_size": total,
+        "sharing": total / nodes if nodes else 1.0,
+        "bytes": sum(sizeof(obj) for obj in order),
+    }
@@ -4,6 +4,7 @@ from .smooth_strongly_convex_function import SmoothStronglyConvexFunction
 from .convex_function import ConvexFunction
 from .convex_lipschitz_function import ConvexLipschitzFunction
 from .smooth_function import SmoothFunction
+from .composite import Composite
 
 __all__ = [
     "SmoothConvexFunction",
@@ -11,4 +12,5 @@ __all__ = [
     "ConvexFunction",
     "ConvexLipschitzFunction",
     "SmoothFunction",
+    "Composite",
 ]
@@ -0,0 +1,247 @@
+#
+# Created in 2026 by Gaëtan Serré
+#
+
+"""
+Several Functions sharing a point space, for composite problems.
+
+Composite (e.g. proximal and splitting) methods query several functions at the
+same iterates. Each Function keeps its own points, proxies and interpolation
+constraints, and any Function can be evaluated at the points and expressions of
+the others. Composite exposes them through the layout interface of a single
+Function: the solver vector is the concatenation of the blocks [X | G | F] of
+every Function, each one allocated as a view of a slice of a shared buffer, and
+the interpolation constraints are generated function by function.
+"""
+
+import numpy as np
+
+
+class Composite:
+    """
+    Block-structured container of several Functions.
+
+    Parameters
+    ----------
+    functions : list of Function
+        Functions with distinct prefixes (see Function).
+
+    Attributes
+    ----------
+    functions : list of Function
+    storage : ndarray or None
+        Shared buffer of the solver vector, allocated by allocate().
+    d : int or None
+        Ambient dimension of the last allocation.
+
+    Raises
+    ------
+    ValueError
+        If two Functions share the id of a point, proxy or expression.
+    """
+
+    def __init__(self, functions):
+        self.functions = list(functions)
+        self.name = " + ".join(f.name for f in self.functions)
+        self.d = None
+        self.storage = None
+        self.storage_key = None
+        self.check_ids()
+
+    def check_ids(self):
+        """Raise ValueError if two Functions use the same key or proxy id."""
+        seen = {}
+        for i, f in enumerate(self.functions):
+            for k in f.values:
+                if seen.setdefault(k, i) != i:
+                    raise ValueError(
+                        f"Key {k!r} is used by several Functions: give each "
+                        "Function of a GPEP problem a distinct prefix."
+                    )
+
+    def merged(self, attribute):
+        """Return the union of a dict attribute of every Function, in order."""
+        d = {}
+        for f in self.functions:
+            d.update(getattr(f, attribute))
+        return d
+
+    @property
+    def points(self):
+        return self.merged("points")
+
+    @property
+    def values(self):
+        return self.merged("values")
+
+    @property
+    def grads(self):
+        return self.merged("grads")
+
+    @property
+    def stat_grads(self):
+        return self.merged("stat_grads")
+
+    @property
+    def expr(self):
+        return self.merged("expr")
+
+    def owner(self, k):
+        """Return the Function owning the key k."""
+        for f in self.functions:
+            if k in f.values:
+                return f
+        raise KeyError(k)
+
+    def __str__(self):
+        return "\n".join(str(f) for f in self.functions)
+
+    def get_nb_stat_points(self):
+        return sum(f.get_nb_stat_points() for f in self.functions)
+
+    def get_nb_init_points(self):
+        return sum(f.get_nb_init_points() for f in self.functions)
+
+    def get_nb_components(self, d):
+        """
+        Return the size of the shared solver vector for ambient dimension d.
+
+        Parameters
+        ----------
+        d : int
+
+        Returns
+        -------
+        int
+        """
+        return sum(f.get_nb_components(d) for f in self.functions)
+
+    def get_storage_key(self, d):
+        """Return the tuple of the storage keys of the Functions."""
+        return tuple(f.get_storage_key(d) for f in self.functions)
+
+    def allocate(self, d, buffer=None):
+        """
+        Allocate the shared storage and bind every Function to its slice.
+
+        Parameters
+        ----------
+        d : int
+            Ambient dimension of points and gradients.
+        buffer : ndarray, optional
+            1-D float array of size get_nb_components(d) to use as storage.
+
+        Returns
+        -------
+        ndarray
+            The storage buffer.
+        """
+        n_comp = self.get_nb_components(d)
+        if buffer is None:
+            buffer = np.zeros(n_comp)
+        elif buffer.shape != (n_comp,):
+            raise ValueError(
+                f"Storage buffer must have shape ({n_comp},), got {buffer.shape}."
+            )
+        self.check_ids()
+        offset = 0
+        for f in self.functions:
+            size = f.get_nb_components(d)
+            f.allocate(d, buffer[offset : offset + size])
+            offset += size
+        self.d = d
+        self.storage = buffer
+        self.storage_key = self.get_storage_key(d)
+        return buffer
+
+    def get_layout(self, d):
+        """
+        Return the position of every proxy Variable in the shared solver vector.
+
+        Parameters
+        ----------
+        d : int
+
+        Returns
+        -------
+        list
+            Tuples (Variable, offset, shape), Function by Function (see
+            Function.get_layout).
+        """
+        layout = []
+        start = 0
+        for f in self.functions:
+            for v, offset, shape in f.get_layout(d):
+                layout.append((v, None if offset is None else start + offset, shape))
+            start += f.get_nb_components(d)
+        return layout
+
+    def check_storage(self, d=None):
+        """
+        Reallocate the storage if proxies were registered since the last allocation.
+
+        Parameters
+        ----------
+        d : int, optional
+            Ambient dimension. Defaults to the current one.
+
+        Raises
+        ------
+        ValueError
+            If d is not given and the storage was never allocated.
+        """
+        if d is None:
+            if self.d is None:
+                raise ValueError(
+                    "The storage was never allocated: the dimension d is required."
+                )
+            d = self.d
+        if self.storage_key != self.get_storage_key(d):
+            self.allocate(d)
+
+    def bind(self, x):
+        """
+        Assign the whole shared solver vector with a single copy.
+
+        Parameters
+        ----------
+        x : ndarray
+        """
+        if x is not self.storage:
+            np.copyto(self.storage, x)
+
+    def iter_interpolation_constraints(self, pairs=None):
+        """
+        Iterate over the interpolation constraints of every Function.
+
+        Parameters
+        ----------
+        pairs : iterable of (str, str), optional
+            Keys (k1, k2) of the constraints to generate, both owned by the same
+            Function. By default, all constraints are generated, Function by
+            Function.
+
+        Yields
+        ------
+        ((str, str), Constraint)
+        """
+        if pairs is None:
+            for f in self.functions:
+                yield from f.iter_interpolation_constraints()
+            return
+        for k1, k2 in pairs:
+            yield from self.owner(k1).iter_interpolation_constraints([(k1, k2)])
+
+    def create_interpolation_constraints(self, pairs=None):
+        """
+        Create the interpolation constraints of every Function.
+
+        Parameters
+        ----------
+        pairs : iterable of (str, str), optional
+
+        Returns
+        -------
+        list
+        """
+        return [c for _, c in self.iter_interpolation_constraints(pairs)]
@@ -9,6 +9,7 @@ Defines interpolation constraints appropriate for convex functions.
 """
 
 from .function import Function
+from .instances import PiecewiseLinear
 
 
 class ConvexFunction(Function):
@@ -17,13 +18,17 @@ class ConvexFunction(Function):
 
     Parameters
     ----------
-    None
-        This class does not require constructor arguments; it initializes a
-        Function with the name "Convex".
+    prefix : str, optional
+        Prefix of the ids, needed to share a GPEP problem with other Functions.
+        Default is "".
     """
 
-    def __init__(self):
-        super().__init__("Convex")
+    def __init__(self, prefix=""):
+        super().__init__("Convex", prefix)
+
+    def sample(self, d, n, rng):
+        """Sample random piecewise-linear convex functions (see Function.sample)."""
+        return PiecewiseLinear(n, d, rng)
 
     def gen_2_points_constraint(self, x1, x2, f1, f2, g1, g2):
         """
@@ -9,6 +9,7 @@ Provides a ConvexFunction variant that enforces a Lipschitz bound on the gradien
 """
 
 from .convex_function import ConvexFunction
+from .instances import PiecewiseLinear
 from ..expression import Expression
 from ..const import Const
 
@@ -22,9 +23,12 @@ class ConvexLipschitzFunction(ConvexFunction):
     M : float
         Lipschitz constant for the gradient (positive scalar). Stored internally
         as an Expression(Const(M)).
+    prefix : str, optional
+        Prefix of the ids, needed to share a GPEP problem with other Functions.
+        Default is "".
     """
 
-    def __init__(self, M):
+    def __init__(self, M, prefix=""):
         """
         Initialize the ConvexLipschitzFunction.
 
@@ -32,11 +36,21 @@ class ConvexLipschitzFunction(ConvexFunction):
         ----------
         M : float
             Lipschitz constant for the gradient.
+        prefix : str, optional
+            Prefix of the ids of the points, proxies and expressions (see
+            Function). Default is "".
         """
         self.M = Expression(Const(M))
-        super().__init__()
+        super().__init__(prefix)
         self.name = "Convex Lipschitz"
 
+    def sample(self, d, n, rng):
+        """
+        Sample random piecewise-linear convex functions with slopes of norm at most
+        M (see Function.sample).
+        """
+        return PiecewiseLinear(n, d, rng, M=float(self.M.eval()))
+
     def gen_1_point_constraint(self, x, f, g):
         """
         Generate the single-point Lipschitz-gradient constraint.
@@ -22,6 +22,9 @@ class Function:
     ----------
     name : str
         Short descriptive name for the function instance.
+    prefix : str, optional
+        Prefix of the ids of the points, proxies and expressions of the function.
+        Functions sharing a GPEP problem need distinct prefixes. Default is "".
 
     Attributes
     ----------
@@ -39,9 +42,16 @@ class Function:
         Mapping expression id -> expression object for expressions tracked by the Function.
     hash_to_id : dict
         Mapping hash(expression) -> expression id used to reuse proxies for identical expressions.
+    storage : ndarray or None
+        Contiguous buffer laid out as the solver vector [X | G | F], allocated by allocate().
+    X, G, F : ndarray or None
+        Views of storage holding the points (nb_points × d), the gradients of
+        non-stationary points (nb_grads × d) and the values (nb_values).
+    Z : ndarray or None
+        Permanent zero block (nb_stat_points × d) backing the stationary gradients.
     """
 
-    def __init__(self, name):
+    def __init__(self, name, prefix=""):
         """
         Initialize a Function container.
 
@@ -49,8 +59,11 @@ class Function:
         ----------
         name : str
             Name of the function for identification/logging.
+        prefix : str, optional
+            Prefix of the ids of the points, proxies and expressions.
         """
         self.name = name
+        self.prefix = prefix
 
         self.point_counter = 0
         self.points = {}
@@ -62,6 +75,14 @@ class Function:
         self.expr = {}
         self.hash_to_id = {}
 
+        self.d = None
+        self.storage = None
+        self.X = None
+        self.G = None
+        self.F = None
+        self.Z = None
+        self.storage_key = None
+
     def __str__(self):
         """
         Return a short human-readable summary of the Function.
@@ -158,12 +179,13 @@ class Function:
         (Variable, Variable)
             Tuple (f_e, g_e) proxies for the expression.
         """
-        self.expr[f"e{self.expr_counter}"] = e
-        fe = Variable(f"f_e{self.expr_counter}")
-        ge = Variable(f"g_e{self.expr_counter}")
-        self.values[f"e{self.expr_counter}"] = fe
-        self.grads[f"e{self.expr_counter}"] = ge
-        self.hash_to_id[hash(e)] = f"e{self.expr_counter}"
+        key = f"{self.prefix}e{self.expr_counter}"
+        self.expr[key] = e
+        fe = Variable(f"f_{key}")
+        ge = Variable(f"g_{key}")
+        self.values[key] = fe
+        self.grads[key] = ge
+        self.hash_to_id[hash(e)] = key
         self.expr_counter += 1
         return fe, ge
 
@@ -205,12 +227,12 @@ class Function:
         Variable
             The gradient proxy Variable associated with v.
         """
-        if isinstance(v, Variable):
-            if v.id in self.grads:
-                return self.grads[v.id]
-            elif v.id in self.stat_grads:
-                return self.stat_grads[v.id]
+        if isinstance(v, Variable) and v.id in self.grads:
+            return self.grads[v.id]
+        elif isinstance(v, Variable) and v.id in self.stat_grads:
+            return self.stat_grads[v.id]
         else:
+            # Expressions, and points of other Functions, are registered once.
             if hash(v) in self.hash_to_id:
                 id = self.hash_to_id[hash(v)]
                 return self.grads[id]
@@ -227,7 +249,7 @@ class Function:
         Variable
             The newly created point variable.
         """
-        v = Variable(f"x{self.point_counter}")
+        v = Variable(f"{self.prefix}x{self.point_counter}")
         self.add_point_(v)
         self.point_counter += 1
         return v
@@ -241,7 +263,7 @@ class Function:
         Variable
             The newly created stationary point variable.
         """
-        v = Variable(f"x{self.point_counter}")
+        v = Variable(f"{self.prefix}x{self.point_counter}")
         self.points[v.id] = v
         fv = Variable(f"f_{v.id}")
         gv = Variable(f"g_{v.id}")
@@ -250,17 +272,182 @@ class Function:
         self.point_counter += 1
         return v
 
+    def get_nb_components(self, d):
+        """
+        Return the size of the solver vector for ambient dimension d.
+
+        Parameters
+        ----------
+        d : int
+            Ambient dimension of points and gradients.
+
+        Returns
+        -------
+        int
+            nb_points * d + nb_grads * d + nb_values.
+        """
+        return (len(self.points) + len(self.grads)) * d + len(self.values)
+
+    def get_storage_key(self, d):
+        """
+        Return the key identifying the storage layout for dimension d.
+
+        Returns
+        -------
+        tuple
+            (d, nb_points, nb_grads, nb_values, nb_stat_points).
+        """
+        return (
+            d,
+            len(self.points),
+            len(self.grads),
+            len(self.values),
+            len(self.stat_grads),
+        )
+
+    def allocate(self, d, buffer=None):
+        """
+        Allocate the contiguous storage and bind every proxy Variable to a view of it.
+
+        After this call, points, gradients and values read their value directly from
+        X, G and F, so that assigning the solver vector is a single array copy (see
+        bind()). Stationary gradients read a permanent zero block. The values held
+        by a previous storage are copied into the new one.
+
+        Parameters
+        ----------
+        d : int
+            Ambient dimension of points and gradients.
+        buffer : ndarray, optional
+            1-D float array of size get_nb_components(d) to use as storage. When
+            given, the proxies are views of buffer itself and no copy is ever needed.
+
+        Returns
+        -------
+        ndarray
+            The storage buffer.
+        """
+        n_comp = self.get_nb_components(d)
+        if buffer is None:
+            buffer = np.zeros(n_comp)
+        elif buffer.shape != (n_comp,):
+            raise ValueError(
+                f"Storage buffer must have shape ({n_comp},), got {buffer.shape}."
+            )
+        nb_points = len(self.points)
+        nb_grads = len(self.grads)
+        thresh = nb_points * d
+
+        X = buffer[:thresh].reshape(nb_points, d)
+        G = buffer[thresh : thresh + nb_grads * d].reshape(nb_grads, d)
+        F = buffer[thresh + nb_grads * d :]
+        # Keep the values already assigned: proxies are only ever appended, and
+        # vectors are truncated or zero-padded to the new dimension.
+        for new, old in ((X, self.X), (G, self.G)):
+            if old is not None and old is not new:
+                rows, cols = min(len(old), len(new)), min(old.shape[1], d)
+                new[:rows, :cols] = old[:rows, :cols]
+        if self.F is not None and self.F is not F:
+            n = min(len(self.F), len(F))
+            F[:n] = self.F[:n]
+
+        self.d = d
+        self.storage = buffer
+        self.X, self.G, self.F = X, G, F
+        self.Z = np.zeros((len(self.stat_grads), d))
+        self.Z.flags.writeable = False
+        self.storage_key = self.get_storage_key(d)
+
+        for i, v in enumerate(self.points.values()):
+            v.set_value(self.X[i])
+        for i, v in enumerate(self.grads.values()):
+            v.var.set_value(self.G[i])
+        for i, v in enumerate(self.values.values()):
+            v.var.set_value(self.F[i, ...])
+        for i, v in enumerate(self.stat_grads.values()):
+            v.var.set_value(self.Z[i])
+        return buffer
+
+    def get_layout(self, d):
+        """
+        Return the position of every proxy Variable in the solver vector.
+
+        The layout matches allocate(): points, then gradients, then values.
+
+        Parameters
+        ----------
+        d : int
+            Ambient dimension of points and gradients.
+
+        Returns
+        -------
+        list
+            Tuples (Variable, offset, shape) where shape is (d,) for points and
+            gradients and () for values. Stationary gradients have offset None:
+            they are identically zero.
+        """
+        layout = []
+        offset = 0
+        for v in self.points.values():
+            layout.append((v, offset, (d,)))
+            offset += d
+        for v in self.grads.values():
+            layout.append((v, offset, (d,)))
+            offset += d
+        for v in self.values.values():
+            layout.append((v, offset, ()))
+            offset += 1
+        for v in self.stat_grads.values():
+            layout.append((v, None, (d,)))
+        return layout
+
+    def check_storage(self, d=None):
+        """
+        Reallocate the storage if proxies were registered since the last allocation.
+
+        Parameters
+        ----------
+        d : int, optional
+            Ambient dimension. Defaults to the current one.
+
+        Raises
+        ------
+        ValueError
+            If d is not given and the storage was never allocated.
+        """
+        if d is None:
+            if self.d is None:
+                raise ValueError(
+                    "The storage was never allocated: the dimension d is required."
+                )
+            d = self.d
+        if self.storage_key != self.get_storage_key(d):
+            self.allocate(d)
+
+    def bind(self, x):
+        """
+        Assign the whole solver vector [X | G | F] with a single copy.
+
+        Parameters
+        ----------
+        x : ndarray
+            Flat solver vector of size get_nb_components(d).
+        """
+        if x is not self.storage:
+            np.copyto(self.storage, x)
+
     def set_points(self, points):
         """
         Assign numeric values to tracked input points.
 
         Parameters
         ----------
-        points : iterable
-            Values to assign in the order of self.points keys.
+        points : array_like
+            Array of shape (nb_points, d), in the order of self.points keys.
         """
-        for i, k in enumerate(self.points.keys()):
-            self.points[k].set_value(points[i])
+        points = np.asarray(points)
+        self.check_storage(points.shape[1] if points.ndim == 2 else None)
+        self.X[...] = points
 
     def set_values(self, values):
         """
@@ -268,11 +455,11 @@ class Function:
 
         Parameters
         ----------
-        values : iterable
+        values : array_like
             Values assigned to value proxy Variables in the order of self.values keys.
         """
-        for i, k in enumerate(self.values.keys()):
-            self.values[k].var.set_value(values[i])
+        self.check_storage()
+        self.F[...] = values
 
     def set_grads(self, values):
         """
@@ -280,23 +467,26 @@ class Function:
 
         Parameters
         ----------
-        values : iterable
-            Gradient values assigned to gradient proxy Variables.
+        values : array_like
+            Array of shape (nb_grads, d), in the order of self.grads keys.
         """
-        for i, k in enumerate(self.grads.keys()):
-            self.grads[k].var.set_value(values[i])
+        values = np.asarray(values)
+        self.check_storage(values.shape[1] if values.ndim == 2 else None)
+        self.G[...] = values
 
     def set_stat_grads(self, d):
         """
-        Initialize stationary gradient proxies to zero vectors of dimension d.
+        Bind stationary gradient proxies to zero vectors of dimension d.
+
+        The zeros live in the permanent block Z, so this is free once the storage
+        is allocated for dimension d.
 
         Parameters
         ----------
         d : int
             Dimension of the zero gradient vectors.
         """
-        for k in self.stat_grads.keys():
-            self.stat_grads[k].var.set_value(np.zeros(d))
+        self.check_storage(d)
 
     @staticmethod
     def merge_dicts(d1, d2):
@@ -317,13 +507,79 @@ class Function:
         d.update(d2)
         return d
 
+    def sample(self, d, n, rng):
+        """
+        Sample concrete functions of the class.
+
+        Parameters
+        ----------
+        d : int
+            Dimension.
+        n : int
+            Number of functions.
+        rng : numpy.random.Generator
+
+        Returns
+        -------
+        callable
+            Batch of functions stationary at the origin, with value 0 there, mapping
+            points of shape (n, d) to values (n,) and gradients (n, d) (see
+            GPEP.functions.instances).
+
+        Raises
+        ------
+        NotImplementedError
+            If the class provides no sampler.
+        """
+        raise NotImplementedError(f"No sampler for {self.name} functions.")
+
     def gen_1_point_constraint(self, x, f, g):
         pass
 
     def gen_2_points_constraint(self, x1, x2, f1, f2, g1, g2):
         pass
 
-    def create_interpolation_constraints(self):
+    def iter_interpolation_constraints(self, pairs=None):
+        """
+        Iterate over interpolation constraints together with the points they involve.
+
+        Parameters
+        ----------
+        pairs : iterable of (str, str), optional
+            Keys (k1, k2) of the constraints to generate, where k1 == k2 denotes the
+            one-point constraint of k1. By default, all constraints are generated in
+            the order of create_interpolation_constraints().
+
+        Yields
+        ------
+        ((str, str), Constraint)
+            Key of the constraint and the constraint itself.
+        """
+        points = self.merge_dicts(self.points, self.expr)
+        grads = self.merge_dicts(self.grads, self.stat_grads)
+        if pairs is None:
+            pairs = (
+                (k1, k2)
+                for k1 in points
+                for k2 in [k1] + [k for k in points if k != k1]
+            )
+        for k1, k2 in pairs:
+            if k1 == k2:
+                c = self.gen_1_point_constraint(points[k1], self.values[k1], grads[k1])
+                if c is None:
+                    continue
+            else:
+                c = self.gen_2_points_constraint(
+                    points[k1],
+                    points[k2],
+                    self.values[k1],
+                    self.values[k2],
+                    grads[k1],
+                    grads[k2],
+                )
+            yield (k1, k2), c
+
+    def create_interpolation_constraints(self, pairs=None):
         """
         Create interpolation constraints for all tracked points and expressions.
 
@@ -331,31 +587,14 @@ class Function:
         and two-point interpolation constraints using gen_1_point_constraint and
         gen_2_points_constraint. It returns the list of constructed constraints.
 
+        Parameters
+        ----------
+        pairs : iterable of (str, str), optional
+            Restrict the generation to these keys (see iter_interpolation_constraints).
+
         Returns
         -------
         list
             List of constraints representing interpolation relations.
         """
-        points = self.merge_dicts(self.points, self.expr)
-        grads = self.merge_dicts(self.grads, self.stat_grads)
-        constraints = []
-        for k1, x1 in points.items():
-            f1 = self.values[k1]
-            g1 = grads[k1]
-            c1 = self.gen_1_point_constraint(x1, f1, g1)
-            if c1 is not None:
-                constraints.append(c1)
-            for k2, x2 in points.items():
-                if k1 == k2:
-                    continue
-                constraints.append(
-                    self.gen_2_points_constraint(
-                        x1,
-                        x2,
-                        f1,
-                        self.values[k2],
-                        g1,
-                        grads[k2],
-                    )
-                )
-        return constraints
+        return [c for _, c in self.iter_interpolation_constraints(pairs)]
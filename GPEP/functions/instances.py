@@ -0,0 +1,125 @@
+#
+# Created in 2026 by Gaëtan Serré
+#
+
+"""
+Concrete instances of function classes, vectorized over a batch of functions.
+
+Each instance is stationary at the origin, with value 0 there, and evaluates a
+batch of n functions at n points at once, so that an unrolled algorithm can be
+run numerically on many sampled functions simultaneously (see
+GPEP.presolve.sample_seeds).
+"""
+
+import numpy as np
+
+
+def sample_spectrum(lo, hi, n, d, rng):
+    """
+    Sample n spectra of size d in [lo, hi].
+
+    Worst cases of first-order methods usually have extreme eigenvalues, so each
+    eigenvalue is lo or hi with probability 1/4 each, and uniform otherwise.
+
+    Returns
+    -------
+    ndarray
+        Array of shape (n, d).
+    """
+    u = rng.uniform(size=(n, d))
+    spectrum = rng.uniform(lo, hi, size=(n, d))
+    spectrum[u < 0.25] = lo
+    spectrum[u > 0.75] = hi
+    return spectrum
+
+
+class Quadratic:
+    """
+    Batch of quadratics f(x) = x·Ax / 2 with random rotations.
+
+    Parameters
+    ----------
+    spectrum : ndarray
+        Eigenvalues of A, shape (n, d).
+    rng : numpy.random.Generator
+        Generator of the random eigenvectors.
+
+    Attributes
+    ----------
+    A : ndarray
+        Hessians, shape (n, d, d).
+    """
+
+    def __init__(self, spectrum, rng):
+        n, d = spectrum.shape
+        Q, _ = np.linalg.qr(rng.standard_normal((n, d, d)))
+        self.A = np.einsum("nij,nj,nkj->nik", Q, spectrum, Q)
+
+    def __call__(self, X):
+        """
+        Evaluate the batch of functions.
+
+        Parameters
+        ----------
+        X : ndarray
+            Points of shape (n, d), one per function.
+
+        Returns
+        -------
+        (ndarray, ndarray)
+            Values of shape (n,) and gradients of shape (n, d).
+        """
+        grads = np.einsum("nij,nj->ni", self.A, X)
+        return 0.5 * np.einsum("ni,ni->n", X, grads), grads
+
+
+class PiecewiseLinear:
+    """
+    Batch of piecewise-linear convex functions f(x) = max_i a_i·x.
+
+    The slopes are centered, so that 0 is a subgradient at the origin.
+
+    Parameters
+    ----------
+    n, d : int
+        Number of functions and dimension.
+    rng : numpy.random.Generator
+    pieces : int, optional
+        Number of affine pieces. Defaults to d + 1.
+    M : float or None, optional
+        If given, the slopes have norms at most M (M-Lipschitz functions).
+
+    Attributes
+    ----------
+    slopes : ndarray
+        Slopes a_i, shape (n, pieces, d).
+    """
+
+    def __init__(self, n, d, rng, pieces=None, M=None):
+        pieces = d + 1 if pieces is None else pieces
+        slopes = rng.standard_normal((n, pieces, d))
+        slopes -= slopes.mean(axis=1, keepdims=True)
+        if M is not None:
+            norms = np.linalg.norm(slopes, axis=-1, keepdims=True)
+            scale = M * rng.uniform(size=(n, pieces, 1)) ** (1 / max(d, 1))
+            slopes *= scale / np.maximum(norms, 1e-300)
+        self.slopes = slopes
+
+    def __call__(self, X):
+        """
+        Evaluate the batch of functions.
+
+        Parameters
+        ----------
+        X : ndarray
+            Points of shape (n, d), one per function.
+
+        Returns
+        -------
+        (ndarray, ndarray)
+            Values of shape (n,) and subgradients of shape (n, d).
+        """
+        values = np.einsum("npd,nd->np", self.slopes, X)
+        active = np.argmax(values, axis=1)
+        rows = np.arange(len(X))
+        return values[rows, active], self.slopes[rows, active]
@@ -21,9 +21,12 @@ class SmoothConvexFunction(SmoothStronglyConvexFunction):
     L : float
         Smoothness constant (L > 0). This class instantiates the
         SmoothStronglyConvexFunction with mu=0.
+    prefix : str, optional
+        Prefix of the ids, needed to share a GPEP problem with other Functions.
+        Default is "".
     """
 
-    def __init__(self, L):
+    def __init__(self, L, prefix=""):
         """
         Initialize the SmoothConvexFunction.
 
@@ -31,6 +34,9 @@ class SmoothConvexFunction(SmoothStronglyConvexFunction):
         ----------
         L : float
             Smoothness constant.
+        prefix : str, optional
+            Prefix of the ids of the points, proxies and expressions (see
+            Function). Default is "".
         """
-        super().__init__(L, mu=0)
+        super().__init__(L, mu=0, prefix=prefix)
         self.name = "Smooth Convex"
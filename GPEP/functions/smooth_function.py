@@ -10,6 +10,7 @@ functions.
 """
 
 from .function import Function
+from .instances import Quadratic, sample_spectrum
 from ..expression import Expression
 from ..const import Const
 
@@ -21,6 +22,9 @@ class SmoothFunction(Function):
     ----------
     L : float
         Smoothness constant (L > 0). Stored internally as Expression(Const(L)).
+    prefix : str, optional
+        Prefix of the ids, needed to share a GPEP problem with other Functions.
+        Default is "".
 
     Reference
     ---------
@@ -30,7 +34,7 @@ class SmoothFunction(Function):
     <https://arxiv.org/pdf/1512.07516.pdf>`_
     """
 
-    def __init__(self, L):
+    def __init__(self, L, prefix=""):
         """
         Initialize the SmoothFunction.
 
@@ -38,9 +42,20 @@ class SmoothFunction(Function):
         ----------
         L : float
             Smoothness constant.
+        prefix : str, optional
+            Prefix of the ids of the points, proxies and expressions (see
+            Function). Default is "".
         """
         self.L = Expression(Const(L))
-        super().__init__("Smooth")
+        super().__init__("Smooth", prefix)
+
+    def sample(self, d, n, rng):
+        """
+        Sample random (possibly indefinite) quadratics with spectrum in [-L, L]
+        (see Function.sample).
+        """
+        L = float(self.L.eval())
+        return Quadratic(sample_spectrum(-L, L, n, d, rng), rng)
 
     def gen_2_points_constraint(self, x1, x2, f1, f2, g1, g2):
         """
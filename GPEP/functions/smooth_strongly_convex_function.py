@@ -12,6 +12,7 @@ interpolation framework.
 """
 
 from .function import Function
+from .instances import Quadratic, sample_spectrum
 from ..expression import Expression
 from ..const import Const
 
@@ -26,6 +27,9 @@ class SmoothStronglyConvexFunction(Function):
         Smoothness constant (L > 0). Internally stored as Expression(Const(L)).
     mu : float
         Strong convexity constant (0 <= mu < L). Internally stored as Expression(Const(mu)).
+    prefix : str, optional
+        Prefix of the ids, needed to share a GPEP problem with other Functions.
+        Default is "".
 
     Notes
     -----
@@ -41,7 +45,7 @@ class SmoothStronglyConvexFunction(Function):
 
     """
 
-    def __init__(self, L, mu):
+    def __init__(self, L, mu, prefix=""):
         """
         Initialize the SmoothStronglyConvexFunction.
 
@@ -51,10 +55,20 @@ class SmoothStronglyConvexFunction(Function):
             Smoothness constant.
         mu : float
             Strong convexity constant.
+        prefix : str, optional
+            Prefix of the ids of the points, proxies and expressions (see
+            Function). Default is "".
         """
         self.L = Expression(Const(L))
         self.mu = Expression(Const(mu))
-        super().__init__("Smooth Strongly Convex")
+        super().__init__("Smooth Strongly Convex", prefix)
+
+    def sample(self, d, n, rng):
+        """Sample random quadratics with spectrum in [mu, L] (see Function.sample)."""
+        spectrum = sample_spectrum(
+            float(self.mu.eval()), float(self.L.eval()), n, d, rng
+        )
+        return Quadratic(spectrum, rng)
 
     def gen_2_points_constraint(self, x1, x2, f1, f2, g1, g2):
         """
@@ -15,28 +15,79 @@ The implementation uses gob.optimizers for numerical minimization and expects
 the Function instance to expose points, values and gradient proxies.
 """
 
-from .expression import emin
+from .expression import emin, esoftmin, graph_stats
+from .compiler import Graph, Program, Jacobian
+from .compiler import simplify as simplify_program
+from .functions import Composite
+from .objective import Objective, LazyObjective, Anytime
+from .presolve import calibrate as calibrate_search
+from .presolve import detect_symmetry, sample_seeds, relaxation_bound
+from .solution import Solution, pack
+import inspect
+import time
 import numpy as np
 from gob.optimizers import CMA_ES
 from gob.benchmarks import create_bounds
 
 
+def create_optimizer(opt, bounds, sigma0, m_0=None):
+    """Instantiate the optimizer of GPEP.solve.
+
+    Parameters
+    ----------
+    opt : callable or None
+        Optimizer factory, or None for the default CMA-ES.
+    bounds : ndarray
+        Search bounds.
+    sigma0 : float
+        Initial spread of the default CMA-ES.
+    m_0 : ndarray or None, optional
+        Starting point, passed to the default CMA-ES and to the factories that
+        accept an m_0 keyword.
+
+    Returns
+    -------
+    Optimizer
+    """
+    if opt is None:
+        return CMA_ES(bounds, n_eval=250_000, sigma0=sigma0, m_0=m_0)
+    if m_0 is not None:
+        try:
+            parameters = inspect.signature(opt).parameters.values()
+        except (TypeError, ValueError):
+            parameters = []
+        if any(p.name == "m_0" or p.kind == p.VAR_KEYWORD for p in parameters):
+            return opt(bounds, m_0=m_0)
+    return opt(bounds)
+
+
 class GPEP:
     """GPEP problem manager.
 
     Parameters
     ----------
-    f : Function
-        Function instance providing sampled points, value and gradient proxies.
+    f : Function or list of Function
+        Function instance providing sampled points, value and gradient proxies, or
+        several Functions sharing the same points.
 
     Attributes
     ----------
-    f : Function
-        The managed Function instance.
+    f : Function or Composite
+        The managed Function instance, or the Composite of several Functions.
+    functions : list of Function
+        The managed Functions.
     initial_conditions : list
         List of constraint objects representing initial problem conditions.
     metric : list
         List of Expression objects describing the performance metric to maximize/minimize.
+    calibration : Calibration or None
+        Search-space calibration of the last solve(calibrate=True).
+    seeds : Seeds or None
+        Feasible samples of the last solve(seeds=n).
+    relaxation : Relaxation or None
+        Upper bound of the last solve(relaxation=True).
+    monitor : Anytime or None
+        Deadline and snapshots of the current (or last) solve.
     """
 
     def __init__(self, f):
@@ -44,12 +95,21 @@ class GPEP:
 
         Parameters
         ----------
-        f : Function
-            Function instance for which to build the PEP.
+        f : Function or list of Function
+            Function instance for which to build the PEP, or several Functions
+            with distinct prefixes sharing the same points (e.g. the smooth and
+            nonsmooth parts of a composite problem), gathered into a Composite.
         """
-        self.f = f
+        self.functions = list(f) if isinstance(f, (list, tuple)) else [f]
+        self.f = (
+            self.functions[0] if len(self.functions) == 1 else Composite(self.functions)
+        )
         self.initial_conditions = []
         self.metric = []
+        self.calibration = None
+        self.seeds = None
+        self.relaxation = None
+        self.monitor = None
 
     def set_initial_condition(self, constraint):
         """Add an initial condition constraint.
@@ -71,7 +131,195 @@ class GPEP:
         """
         self.metric.append(metric)
 
-    def solve(self, opt=None, verbose=0):
+    def get_dimension(self):
+        """Return the ambient dimension used for points and gradients.
+
+        Returns
+        -------
+        int
+            nb_points + nb_grads, large enough to represent any Gram matrix.
+        """
+        return len(self.f.points) + len(self.f.grads)
+
+    def get_nb_components(self, d):
+        """Return the size of the solver vector for ambient dimension d.
+
+        Parameters
+        ----------
+        d : int
+            Ambient dimension of points and gradients.
+
+        Returns
+        -------
+        int
+            nb_points * d + nb_grads * d + nb_values.
+        """
+        return self.f.get_nb_components(d)
+
+    def compile(self, d, simplify=True, temperature=None, symmetry=None):
+        """Compile the interpolation constraints, initial conditions and metric.
+
+        Parameters
+        ----------
+        d : int
+            Ambient dimension of points and gradients.
+        simplify : bool, optional
+            Run the algebraic simplification pass (constant folding, operator
+            fusion, common subexpression elimination). Default is True.
+        temperature : float or None, optional
+            If given, aggregate the metrics with a soft minimum of this initial
+            temperature (see esoftmin) instead of emin. Default is None.
+        symmetry : Symmetry or None, optional
+            If given, add the symmetry-breaking orderings x_k1[0] <= x_k2[0] of its
+            orbits (keyed ("symmetry", k1, k2)). Default is None.
+
+        Returns
+        -------
+        Program
+            Graph whose constraint roots are, in order, the interpolation constraints
+            (keyed by their pair of points) followed by the initial conditions (keyed
+            None), and whose objective root is emin(metric) (or esoftmin(metric)).
+        """
+        graph = Graph(self.f.get_layout(d))
+        keys = []
+        constraints = []
+        for key, c in self.f.iter_interpolation_constraints():
+            keys.append(key)
+            constraints.append(graph.residual(c))
+        for c in self.initial_conditions:
+            keys.append(None)
+            constraints.append(graph.residual(c))
+        if symmetry is not None:
+            for k1, k2 in symmetry.orderings():
+                keys.append(("symmetry", k1, k2))
+                constraints.append(graph.ordering(self.f.points[k1], self.f.points[k2]))
+        if temperature is None:
+            objective = graph.lower(emin(self.metric))
+        else:
+            objective = graph.lower(esoftmin(self.metric, temperature))
+        program = Program(
+            graph, constraints, objective, self.get_nb_components(d), keys
+        )
+        if simplify:
+            return simplify_program(program)
+        return program
+
+    def objective(
+        self,
+        d,
+        lazy=False,
+        lazy_period=1000,
+        temperature=None,
+        symmetry=None,
+        **kwargs,
+    ):
+        """Build the penalized objective minimized by the optimizer.
+
+        The problem is compiled once; each call then binds the solver vector to the
+        Function storage and runs an allocation-free Evaluator on it.
+
+        Parameters
+        ----------
+        d : int
+            Ambient dimension of points and gradients.
+        lazy : bool, optional
+            Only penalize a working set of interpolation constraints, grown by
+            cutting planes (see LazyObjective). Default is False.
+        lazy_period : int, optional
+            Number of evaluations between two checks of the full constraint set when
+            lazy is True. Default is 1000.
+        temperature : float or None, optional
+            Optimize a soft minimum of the metrics with this initial temperature,
+            annealed during the run, instead of their hard minimum. Default is None.
+        symmetry : Symmetry or None, optional
+            Symmetry to break, e.g. self.symmetry(): the points of each orbit are
+            ordered along their first coordinate. Default is None.
+        **kwargs
+            Options of Objective, e.g. short_circuit=True to stop evaluating a
+            candidate at its first decisive violation, incremental=True to only
+            re-evaluate what depends on the coordinates that changed since the
+            previous call, or the annealing schedule (anneal_rate, anneal_period).
+
+        Returns
+        -------
+        Objective
+            F(x, only_obj=False, verbose=False) mapping a flat solver vector to the
+            penalized objective, or to the metric value when only_obj is True.
+        """
+        self.f.check_storage(d)
+        program = self.compile(d, temperature=temperature, symmetry=symmetry)
+        if lazy:
+            return LazyObjective(self.f, program, period=lazy_period, **kwargs)
+        return Objective(self.f, program, **kwargs)
+
+    def symmetry(self):
+        """Detect the permutations of points leaving the problem invariant.
+
+        Returns
+        -------
+        Symmetry
+            Orbits of interchangeable points and order of the group (see
+            GPEP.presolve.detect_symmetry).
+        """
+        return detect_symmetry(self)
+
+    def relaxation_bound(self, solver=None):
+        """Bound the worst case from above by a semidefinite relaxation.
+
+        Parameters
+        ----------
+        solver : str or None, optional
+            cvxpy solver name. Defaults to the solver chosen by cvxpy.
+
+        Returns
+        -------
+        Relaxation
+            Optimal value of the relaxation in the Gram matrix of the points and
+            gradients, or the reason why no bound is available (see
+            GPEP.presolve.relaxation_bound).
+        """
+        return relaxation_bound(self, solver=solver)
+
+    def jacobian(self, d, simplify=True):
+        """Build the sparse constraint Jacobian of the problem.
+
+        Parameters
+        ----------
+        d : int
+            Ambient dimension of points and gradients.
+        simplify : bool, optional
+            Compile with the simplification pass. Default is True.
+
+        Returns
+        -------
+        Jacobian
+            CSR sparsity pattern (indptr, indices) of the residuals with respect to
+            the solver vector, Jacobian-vector products (jvp) and Jacobian values.
+        """
+        self.f.check_storage(d)
+        return Jacobian(self.compile(d, simplify=simplify), x=self.f.storage)
+
+    def solve(
+        self,
+        opt=None,
+        verbose=0,
+        lazy=False,
+        lazy_period=1000,
+        lazy_rounds=5,
+        short_circuit=False,
+        backend="numpy",
+        temperature=None,
+        calibrate=False,
+        break_symmetry=False,
+        seeds=0,
+        relaxation=False,
+        gap_tol=1e-3,
+        time_limit=None,
+        snapshot=None,
+        snapshot_period=1.0,
+        x0=None,
+        d=None,
+    ):
         """Assemble and solve the finite-dimensional optimization representing the PEP.
 
         Parameters
@@ -82,69 +330,247 @@ class GPEP:
             For a custom optimizer, the callable should accept bounds (dimension × (min, max))as input and return an optimizer instance with a minimize() method.
         verbose : int, optional
             Verbosity flag (print progress when non-zero).
+        lazy : bool, optional
+            Start from a small working set of interpolation constraints (one-point
+            constraints, consecutive points and stationary points) and add the
+            violated ones by cutting planes. Default is False.
+        lazy_period : int, optional
+            Number of evaluations between two cutting-plane rounds during a
+            minimization. Default is 1000.
+        lazy_rounds : int, optional
+            Maximum number of additional minimizations, each one started from the
+            previous solution, when constraints were added after a minimization.
+            Default is 5.
+        short_circuit : bool, optional
+            Stop evaluating a candidate at its first decisive constraint violation.
+            Default is False.
+        backend : {"numpy", "numba", "jax"}, optional
+            Array backend of the evaluator. "numba" and "jax" fuse the problem into
+            a single compiled function, which costs a few seconds of compilation
+            and then evaluates candidates much faster than the NumPy tape (see
+            GPEP.compiler.backend). They fall back to NumPy, with a warning, when
+            the optional package is not installed. Default is "numpy".
+        temperature : float or None, optional
+            Optimize a log-sum-exp soft minimum of the metrics, with this initial
+            temperature halved every 1000 evaluations, instead of their hard
+            minimum. The returned objective is always the exact emin. Default is
+            None.
+        calibrate : bool, optional
+            Presolve step choosing the scale of each block of the solver vector
+            (see GPEP.presolve.calibrate). The optimizer then searches the scaled
+            coordinates within the calibrated bounds (also given to opt) with unit
+            initial spread, instead of [-10, 10] with sigma0=10. The calibration
+            is stored in self.calibration and printed if verbose. Default is False.
+        break_symmetry : bool, optional
+            Presolve step detecting the permutations of points leaving the problem
+            invariant (see symmetry()) and ordering the points of each orbit along
+            their first coordinate, so that the optimizer explores a single copy of
+            each equivalent worst case. The symmetry is printed if verbose. Default
+            is False.
+        seeds : int, optional
+            Presolve step running the algorithm on this many concrete functions
+            sampled from the class of self.f (see GPEP.presolve.sample_seeds). The
+            best feasible sample gives an immediate lower bound and, when x0 is not
+            given, the warm start of the optimizer. The seeds are stored in
+            self.seeds and summarized if verbose. Only available for a single
+            Function. Default is 0 (no seeding).
+        relaxation : bool, optional
+            Presolve step computing an upper bound of the worst case by a
+            semidefinite relaxation (see relaxation_bound()), when the problem is
+            linear in the Gram matrix. The search then stops as soon as a feasible
+            candidate is within gap_tol of the bound. The bound is stored in
+            self.relaxation, printed if verbose and reported in the Solution.
+            Default is False.
+        gap_tol : float, optional
+            Relative tolerance of the gap to the relaxation bound. Default is 1e-3.
+        time_limit : float or None, optional
+            Wall-clock limit of the whole solve, in seconds. Once it is reached, the
+            optimizer stops receiving evaluations and the best candidate seen so far
+            is returned, with Solution.timed_out set. Default is None (no limit).
+        snapshot : str or None, optional
+            Path of a .npz file where the best candidate so far (solver vector,
+            penalized value, evaluation count, elapsed time) is written at most every
+            snapshot_period seconds, for other processes. Within the same process,
+            self.monitor.snapshot() returns it from any thread (see
+            GPEP.objective.Anytime). Default is None.
+        snapshot_period : float, optional
+            Default is 1 second.
+        x0 : Solution, dict or None, optional
+            Warm start: a previous Solution (possibly of a problem with other points
+            or another dimension) or values by Variable id, e.g.
+            {"x0": [1, 0], "f_x0": 0.5}. Missing Variables start at 0. The default
+            CMA-ES (or a factory accepting an m_0 keyword) starts its search from
+            x0, and x0 is returned if the optimizer finds nothing better.
+        d : int or None, optional
+            Ambient dimension of points and gradients. Defaults to
+            get_dimension(), which can represent any Gram matrix; worst cases of
+            lower rank can be searched in smaller dimension (see
+            GPEP.drivers.grow_dimension).
 
         Returns
         -------
-        tuple
-            (x_opt, objective_value) where x_opt is the optimizer solution and objective_value
-            is the evaluated objective at x_opt.
+        Solution
+            Named points, gradients and values, per-constraint residuals, number of
+            evaluations and timings. It unpacks as (x_opt, objective_value) where
+            x_opt is the optimizer solution and objective_value is the evaluated
+            objective at x_opt.
+
+        Raises
+        ------
+        ValueError
+            If seeds is requested for a problem with several Functions.
 
         Notes
         -----
         The method converts the abstract interpolation constraints into numeric constraints
         using the current proxy Variable values and minimizes a penalized objective via the
-        chosen optimizer.
+        chosen optimizer. In lazy mode, the final report always covers the full set of
+        constraints.
         """
+        if seeds and isinstance(self.f, Composite):
+            raise ValueError(
+                "Seeding samples a single function class: it is not available for "
+                "problems with several Functions."
+            )
         if verbose:
             print("Solving PEP...")
             print(self.f)
 
-        nb_points = len(self.f.points)
-        nb_values = len(self.f.values)
-        nb_grads = len(self.f.grads)
-
-        def F(x, only_obj=False, verbose=False):
-            x = np.array(x)
-            self.f.set_points(x[: nb_points * d].reshape(nb_points, d))
-            thresh = nb_points * d
-            self.f.set_grads(x[thresh : thresh + nb_grads * d].reshape(nb_grads, d))
-            thresh += nb_grads * d
-            self.f.set_values(x[thresh:])
-
-            self.f.set_stat_grads(d)
-
-            obj = -emin(self.metric).eval()
+        timings = {}
+        start = time.perf_counter()
+        if d is None:
+            d = self.get_dimension()
+        symmetry = None
+        if break_symmetry:
+            symmetry = self.symmetry()
+            if verbose:
+                print(symmetry)
+        F = self.objective(
+            d,
+            lazy=lazy,
+            lazy_period=lazy_period,
+            temperature=temperature,
+            symmetry=symmetry,
+            short_circuit=short_circuit,
+            backend=backend,
+        )
+        timings["compile"] = time.perf_counter() - start
 
-            abstract_constraints = self.f.create_interpolation_constraints()
-            constraints = np.zeros(
-                len(abstract_constraints) + len(self.initial_conditions)
-            )
-            for i, constraint in enumerate(
-                abstract_constraints + self.initial_conditions
-            ):
-                constraints[i] = constraint.c_eval()
+        tic = time.perf_counter()
+        if calibrate:
+            self.calibration = calibrate_search(self, d)
+            if verbose:
+                print(self.calibration)
+            bounds = self.calibration.bounds
+            sigma0 = self.calibration.sigma0
+            G = self.calibration.wrap(F)
+        else:
+            n_comp = self.get_nb_components(d)
+            l, u = -10, 10
+            bounds = create_bounds(n_comp, l, u)
+            sigma0 = 10
+            G = F
+        if seeds:
+            self.seeds = sample_seeds(self, d, n_samples=seeds)
             if verbose:
-                print("Obj=", -obj, "Constraints=", constraints)
+                print(self.seeds)
+        target = None
+        if relaxation:
+            self.relaxation = self.relaxation_bound()
+            if verbose:
+                print(self.relaxation)
+            bound = self.relaxation.bound
+            if bound is not None and np.isfinite(bound):
+                # Penalized value of a feasible candidate within gap_tol of the bound.
+                target = -(bound - gap_tol * abs(bound))
+        z0 = None
+        if x0 is not None:
+            if isinstance(x0, Solution):
+                z0 = x0.vector(self.f, d)
+            else:
+                z0 = pack(self.f, d, x0)
+        elif seeds and self.seeds.best is not None:
+            z0 = self.seeds.best
+        if z0 is not None:
+            if calibrate:
+                z0 = self.calibration.to_z(z0)
+            z0 = np.clip(z0, bounds[:, 0], bounds[:, 1])
+        timings["presolve"] = time.perf_counter() - tic
 
-            if only_obj:
-                return -obj
+        tic = time.perf_counter()
+        self.monitor = Anytime(
+            G,
+            deadline=None if time_limit is None else start + time_limit,
+            period=snapshot_period,
+            path=snapshot,
+            to_x=self.calibration.to_x if calibrate else None,
+            target=target,
+            exact=lambda: F.exact,
+        )
+        res = self.monitor.minimize(create_optimizer(opt, bounds, sigma0, z0))
+        if z0 is not None:
+            value = G(z0)
+            if F.exact and value < res[1]:
+                res = (z0, value)
+        x = self.calibration.to_x(res[0]) if calibrate else res[0]
 
-            lambda_ = np.zeros_like(constraints)
-            lambda_[constraints > 0] = 1e15 * max(1, np.abs(obj))
+        if lazy:
+            for _ in range(lazy_rounds):
+                if self.monitor.timed_out or F.cut(x) == 0:
+                    break
+                if verbose:
+                    print(f"Working set: {len(F.active)}/{len(F.full.constraints)}")
+                optimizer = create_optimizer(opt, bounds, sigma0, res[0])
+                res = self.monitor.minimize(optimizer)
+                x = self.calibration.to_x(res[0]) if calibrate else res[0]
+        self.monitor.publish()
+        timings["optimize"] = time.perf_counter() - tic
+        n_eval = F.n_eval
 
-            return obj + np.sum(lambda_ * constraints)
+        if lazy or temperature is not None:
+            F = self.objective(d, symmetry=symmetry)
+        objective = F(x, verbose=True, only_obj=True)
+        timings["total"] = time.perf_counter() - start
+        return Solution.from_function(
+            self.f,
+            d,
+            x,
+            objective,
+            F.evaluator.residuals,
+            F.program.keys,
+            n_eval,
+            timings,
+            timed_out=self.monitor.timed_out,
+            upper_bound=self.relaxation.bound if relaxation else None,
+        )
 
-        d = nb_points + nb_grads
+    def graph_stats(self, interpolation=True):
+        """Report the size of the expression graph of the problem.
 
-        n_comp = nb_points * d + nb_grads * d + nb_values
-        l, u = -10, 10
-        bounds = create_bounds(n_comp, l, u)
-        if opt is None:
-            opt = CMA_ES(bounds, n_eval=250_000, sigma0=10)
-        else:
-            opt = opt(bounds)
-        res = opt.minimize(F)
-        return res[0], F(res[0], verbose=True, only_obj=True)
+        Parameters
+        ----------
+        interpolation : bool, optional
+            Include the interpolation constraints generated by the Function (they
+            are rebuilt on demand but usually dominate the graph). Default is True.
+
+        Returns
+        -------
+        dict
+            Statistics computed by graph_stats ("nodes", "depth", "tree_size",
+            "sharing", "bytes"), plus "constraints", the number of constraints.
+        """
+        f = self.f
+        roots = list(self.metric) + list(self.initial_conditions)
+        for proxies in (f.points, f.expr, f.values, f.grads, f.stat_grads):
+            roots += list(proxies.values())
+        constraints = list(self.initial_conditions)
+        if interpolation:
+            interpolation_constraints = f.create_interpolation_constraints()
+            roots += interpolation_constraints
+            constraints += interpolation_constraints
+        stats = graph_stats(roots)
+        stats["constraints"] = len(constraints)
+        return stats
 
     def print_info(self):
         """Print a human-readable summary of current proxies and values.
@@ -0,0 +1,7 @@
+#
+# Created in 2026 by Gaëtan Serré
+#
+
+from .objective import Objective
+from .lazy import LazyObjective
+from .anytime import Anytime
@@ -0,0 +1,183 @@
+#
+# Created in 2026 by Gaëtan Serré
+#
+
+"""
+Wall-clock deadline and best-so-far snapshots for the optimizer loop.
+
+The gob optimizers run their own loop and cannot be interrupted from the
+objective. Once the deadline has passed, Anytime stops evaluating and returns a
+constant: CMA-ES then terminates on flat fitness after a single generation, and
+the other optimizers consume the rest of their budget at negligible cost. The
+search stops in the same way as soon as a candidate reaches a target value (e.g.
+within tolerance of an upper bound of the worst case). The best candidate seen
+before the deadline is kept, and periodically published as a
+snapshot readable from another thread (snapshot()) or process (a .npz file).
+
+Only exactly evaluated candidates are recorded or can reach the target: the value
+returned to the optimizer may be a lower bound (short-circuited candidate), see
+Objective.exact.
+"""
+
+import os
+import threading
+import time
+import numpy as np
+
+
+class Anytime:
+    """
+    Objective wrapper enforcing a deadline and recording the best candidate.
+
+    Parameters
+    ----------
+    F : callable
+        Penalized objective F(z, **kwargs).
+    deadline : float or None, optional
+        Value of time.perf_counter() after which no candidate is evaluated. None
+        means no deadline.
+    period : float, optional
+        Minimal number of seconds between two snapshots. Default is 1.
+    path : str or None, optional
+        If given, every snapshot is also written (atomically) to this .npz file.
+    to_x : callable or None, optional
+        Map from the optimizer coordinates to the solver vector (e.g.
+        Calibration.to_x) applied to the published candidates.
+    stop_value : float, optional
+        Value returned after the deadline. Default is 1e300.
+    target : float or None, optional
+        Value at or below which a candidate ends the run: the following ones are
+        not evaluated either. None means no target.
+    exact : callable or None, optional
+        exact() returns whether the last value returned by F is exact (e.g.
+        lambda: objective.exact). None means that every value is exact.
+
+    Attributes
+    ----------
+    best_value : float
+        Smallest exact penalized value seen so far.
+    best_z : ndarray or None
+        Candidate (in optimizer coordinates) of best_value.
+    n_eval : int
+        Number of candidates evaluated before the deadline.
+    timed_out : bool
+        Whether the deadline was reached.
+    reached : bool
+        Whether a candidate of the current run reached the target.
+    """
+
+    def __init__(
+        self,
+        F,
+        deadline=None,
+        period=1.0,
+        path=None,
+        to_x=None,
+        stop_value=1e300,
+        target=None,
+        exact=None,
+    ):
+        self.F = F
+        self.deadline = deadline
+        self.period = period
+        self.path = path
+        self.to_x = to_x
+        self.stop_value = stop_value
+        self.target = target
+        self.exact = exact
+        self.best_value = np.inf
+        self.best_z = None
+        self.n_eval = 0
+        self.timed_out = False
+        self.reached = False
+        self.start = time.perf_counter()
+        self.next_snapshot = self.start + period
+        self.lock = threading.Lock()
+        self.latest = None
+
+    def __call__(self, z, **kwargs):
+        """
+        Evaluate the objective, unless the deadline has passed or the target has
+        been reached.
+
+        Keyword arguments (only_obj, verbose) are forwarded to F and bypass the
+        deadline and the record.
+        """
+        if kwargs:
+            return self.F(z, **kwargs)
+        now = time.perf_counter()
+        if self.deadline is not None and now >= self.deadline:
+            self.timed_out = True
+            return self.stop_value
+        if self.reached:
+            return self.stop_value
+        value = self.F(z)
+        self.n_eval += 1
+        if self.exact is None or self.exact():
+            if value < self.best_value:
+                self.best_value = value
+                self.best_z = np.array(z, dtype=float)
+            if self.target is not None and value <= self.target:
+                self.reached = True
+        if now >= self.next_snapshot:
+            self.publish()
+            self.next_snapshot = now + self.period
+        return value
+
+    def minimize(self, optimizer):
+        """
+        Run optimizer.minimize on the wrapped objective.
+
+        The record and the target flag are reset first, since the objective may
+        have changed since the previous run (e.g. cuts of a LazyObjective).
+
+        Parameters
+        ----------
+        optimizer : Optimizer
+
+        Returns
+        -------
+        (ndarray, float)
+            Best candidate and value from the record, or from the optimizer if no
+            candidate was evaluated exactly (the value reported by the optimizer
+            may be a lower bound or an estimate).
+        """
+        self.best_value = np.inf
+        self.best_z = None
+        self.reached = False
+        res = optimizer.minimize(self)
+        if self.best_z is not None:
+            res = (self.best_z, self.best_value)
+        return res
+
+    def publish(self):
+        """Publish the best candidate so far as the latest snapshot."""
+        if self.best_z is None:
+            return
+        x = self.best_z if self.to_x is None else self.to_x(self.best_z)
+        snapshot = {
+            "x": np.array(x, dtype=float),
+            "value": self.best_value,
+            "n_eval": self.n_eval,
+            "elapsed": time.perf_counter() - self.start,
+        }
+        with self.lock:
+            self.latest = snapshot
+        if self.path is not None:
+            # Write then rename, so that readers never see a partial file.
+            tmp = f"{self.path}.tmp.npz"
+            np.savez(tmp, **snapshot)
+            os.replace(tmp, self.path)
+
+    def snapshot(self):
+        """
+        Return the latest snapshot (safe to call from another thread).
+
+        Returns
+        -------
+        dict or None
+            Keys "x" (solver vector), "value" (penalized value), "n_eval" and
+            "elapsed" (seconds), or None before the first snapshot.
+        """
+        with self.lock:
+            return self.latest
@@ -0,0 +1,157 @@
+#
+# Created in 2026 by Gaëtan Serré
+#
+
+"""
+Cutting-plane objective over a working set of interpolation constraints.
+
+Most of the N(N-1) two-point interpolation constraints are slack at the worst
+case. LazyObjective only penalizes a working set: the one-point constraints, the
+constraints between consecutive points (in registration order) and those
+involving stationary points, plus the initial conditions and the symmetry-breaking
+orderings. Periodically, the full
+set is checked at the incumbent and the violated constraints join the working set.
+"""
+
+from .objective import Objective
+from ..compiler import Evaluator
+import numpy as np
+
+
+def initial_working_set(f):
+    """
+    Return the interpolation keys of the initial working set of a Function.
+
+    Parameters
+    ----------
+    f : Function or Composite
+
+    Returns
+    -------
+    set of (str, str)
+        One-point keys (k, k), pairs of consecutively registered points in both
+        directions, and pairs between any point and a stationary point (of the
+        same Function).
+    """
+    working = set()
+    for g in getattr(f, "functions", [f]):
+        order = list(g.values.keys())
+        working |= {(k, k) for k in order}
+        for k1, k2 in zip(order[:-1], order[1:]):
+            working |= {(k1, k2), (k2, k1)}
+        for s in g.stat_grads:
+            for k in order:
+                if k != s:
+                    working |= {(k, s), (s, k)}
+    return working
+
+
+class LazyObjective(Objective):
+    """
+    Penalized objective restricted to a growing working set of constraints.
+
+    Parameters
+    ----------
+    f : Function
+        Function whose storage receives the solver vector.
+    program : Program
+        Full compiled problem, with interpolation keys (see GPEP.compile).
+    period : int, optional
+        Number of evaluations between two checks of the full constraint set at the
+        incumbent. Default is 1000.
+    tol : float, optional
+        Residual above which an inactive constraint is considered violated.
+        Default is 0.
+    **kwargs
+        Other options of Objective (penalty, short_circuit, ...).
+
+    Attributes
+    ----------
+    full : Program
+        The full program.
+    active : list of int
+        Indices in full.constraints of the working set.
+    """
+
+    def __init__(self, f, program, period=1000, tol=0.0, **kwargs):
+        self.full = program
+        self.full_evaluator = Evaluator(program, x=f.storage)
+        self.period = period
+        self.tol = tol
+        working = initial_working_set(f)
+        # Initial conditions and symmetry-breaking orderings are always active.
+        self.active = [
+            i
+            for i, key in enumerate(program.keys)
+            if key is None or key in working or key[0] == "symmetry"
+        ]
+        self.best_value = np.inf
+        self.best_x = np.zeros(program.n_comp)
+        super().__init__(f, program.restrict(self.active), **kwargs)
+
+    def check(self, x):
+        """
+        Evaluate the full constraint set at x.
+
+        Parameters
+        ----------
+        x : array_like
+            Flat solver vector.
+
+        Returns
+        -------
+        list of int
+            Indices of the violated constraints that are not in the working set.
+        """
+        self.f.bind(x)
+        self.full_evaluator.run()
+        violated = np.flatnonzero(self.full_evaluator.residuals > self.tol)
+        active = set(self.active)
+        return [int(i) for i in violated if i not in active]
+
+    def cut(self, x):
+        """
+        Add the constraints violated at x to the working set.
+
+        Parameters
+        ----------
+        x : array_like
+            Flat solver vector, typically the incumbent.
+
+        Returns
+        -------
+        int
+            Number of constraints added.
+        """
+        added = self.check(x)
+        if added:
+            self.active = sorted(self.active + added)
+            self.set_program(self.full.restrict(self.active))
+            # The penalized landscape changed: re-rank the incumbent.
+            self.best_value = Objective.__call__(self, self.best_x)
+        return len(added)
+
+    def __call__(self, x, only_obj=False, verbose=False):
+        """
+        Evaluate the penalized objective over the working set.
+
+        When verbose is True, the residuals of the full constraint set are printed.
+        Every `period` evaluations, the full set is checked at the incumbent.
+        """
+        if verbose:
+            self.check(x)
+            print(
+                "Obj=",
+                float(self.full_evaluator.objective),
+                "Constraints=",
+                self.full_evaluator.residuals,
+            )
+        value = super().__call__(x, only_obj=only_obj)
+        if only_obj:
+            return value
+        if value < self.best_value:
+            self.best_value = value
+            np.copyto(self.best_x, x)
+        if self.n_eval % self.period == 0:
+            self.cut(self.best_x)
+        return value
@@ -0,0 +1,330 @@
+#
+# Created in 2026 by Gaëtan Serré
+#
+
+"""
+Penalized objective minimized by the global optimizers.
+
+The Objective wraps a compiled Program: each call binds the solver vector to the
+Function storage, runs the Evaluator and turns the metric and the constraint
+residuals into a single penalized value.
+
+With short-circuiting enabled, constraints are evaluated one by one, the most
+frequently violated (then the cheapest) first, and the metric last. As soon as a
+lower bound of the penalized value exceeds the values of most candidates seen
+recently, the candidate is hopeless: evaluation stops and the lower bound is
+returned instead. Rank-based optimizers such as CMA-ES only use the ordering of the best
+candidates of each generation, which is preserved.
+
+The evaluator is provided by an array backend (see GPEP.compiler.backend): the
+NumPy tape by default, or the whole program fused into one function compiled by
+Numba or JAX, which removes the per-kernel overhead of the tape.
+"""
+
+from ..compiler import get_backend
+from ..expression.expression import SoftMin
+import numpy as np
+
+
+class Objective:
+    """
+    Penalized objective of a compiled performance estimation problem.
+
+    Parameters
+    ----------
+    f : Function
+        Function whose storage (see Function.allocate) receives the solver vector.
+    program : Program
+        Compiled problem.
+    penalty : float, optional
+        Weight of the constraint violations. Default is 1e15.
+    short_circuit : bool, optional
+        Stop the evaluation at the first decisive violation. Default is False.
+    threshold : float, optional
+        Smallest sum of positive residuals considered decisive. Default is 1e-9.
+    quantile : float, optional
+        A violation is decisive when it exceeds threshold and the lower bound
+        penalty * violations - 1 of the penalized value exceeds this quantile of
+        the values returned by the last window evaluations, so that hopeless
+        candidates still rank behind the others. Default is 0.5.
+    window : int, optional
+        Number of evaluations between two updates of the decisive level. Nothing is
+        short-circuited during the first window. Default is 100.
+    reorder_period : int, optional
+        Number of evaluations between two reorderings of the constraints. Violation
+        counts are halved at each reordering, so the order follows recent
+        violations. Default is 1000.
+    incremental : bool, optional
+        Only re-evaluate the nodes depending on the coordinates that changed since
+        the previous evaluation (see Evaluator.run_changed). Incompatible with
+        short_circuit. Default is False.
+    anneal_rate : float, optional
+        Factor applied to the temperature of a SoftMin metric every anneal_period
+        evaluations. Default is 0.5.
+    anneal_period : int, optional
+        Default is 1000.
+    min_temperature : float, optional
+        Floor of the annealed temperature. Default is 1e-12.
+    backend : {"numpy", "numba", "jax"}, optional
+        Array backend evaluating the program (see GPEP.compiler.get_backend). The
+        JIT backends fall back to NumPy, with a warning, when their package is
+        missing or the program cannot be fused. When loaded, they are
+        incompatible with short_circuit and incremental, which run parts of the
+        NumPy tape. Default is "numpy".
+
+    Attributes
+    ----------
+    evaluator : Evaluator or FusedEvaluator
+        Evaluator of program reading f.storage.
+    backend : Backend
+        Array backend of the evaluator.
+    n_eval : int
+        Number of evaluations performed so far.
+    n_short : int
+        Number of evaluations stopped early.
+    counts : ndarray
+        Decayed number of violations of each constraint.
+    decisive : float
+        Current sum of positive residuals at which evaluation stops.
+    softmin : SoftMin or None
+        Aggregator of the metric if it is a soft minimum.
+    exact : bool
+        Whether the last value returned is the exact penalized value: False for a
+        short-circuited candidate (a lower bound).
+    """
+
+    def __init__(
+        self,
+        f,
+        program,
+        penalty=1e15,
+        short_circuit=False,
+        threshold=1e-9,
+        quantile=0.5,
+        window=100,
+        reorder_period=1000,
+        incremental=False,
+        anneal_rate=0.5,
+        anneal_period=1000,
+        min_temperature=1e-12,
+        backend="numpy",
+    ):
+        if short_circuit and incremental:
+            raise ValueError(
+                "Short-circuit and incremental evaluation cannot be combined."
+            )
+        # A JIT backend whose package is missing falls back to NumPy, where
+        # every evaluation mode is available.
+        self.backend = get_backend(backend)
+        if self.backend.module is not None and (short_circuit or incremental):
+            raise ValueError(
+                f"The {backend} backend cannot be combined with short-circuit, "
+                "incremental evaluation."
+            )
+        self.f = f
+        self.penalty = penalty
+        self.short_circuit = short_circuit
+        self.threshold = threshold
+        self.quantile = quantile
+        self.window = window
+        self.reorder_period = reorder_period
+        self.incremental = incremental
+        self.anneal_rate = anneal_rate
+        self.anneal_period = anneal_period
+        self.min_temperature = min_temperature
+        self.n_eval = 0
+        self.n_short = 0
+        self.exact = True
+        self.set_program(program)
+
+    def set_program(self, program):
+        """
+        Compile the evaluator of a (new) program.
+
+        Parameters
+        ----------
+        program : Program
+        """
+        self.program = program
+        self.evaluator = self.backend.evaluator(program, x=self.f.storage)
+        self.derivatives = None
+        self.violations = np.zeros_like(self.evaluator.residuals)
+        self.last = None
+        op = program.objective.op
+        self.softmin = op if isinstance(op, SoftMin) else None
+        if self.short_circuit:
+            n = len(program.constraints)
+            self.counts = np.zeros(n)
+            self.decisive = np.inf
+            self.recent = np.zeros(self.window)
+            self.costs = np.array(
+                [len(self.evaluator.segments([i])[0]) for i in range(n)], dtype=float
+            )
+            self.reorder()
+
+    def reorder(self):
+        """
+        Sort the constraints by decreasing violation count, then increasing cost.
+
+        The cost of a constraint is the number of tape entries it needs on its own.
+        The metric is always evaluated last.
+        """
+        n = len(self.counts)
+        self.order = np.lexsort((self.costs, -self.counts)).tolist()
+        self.segments = self.evaluator.segments(self.order + [n])
+        self.counts *= 0.5
+
+    def run_short_circuit(self):
+        """
+        Evaluate the constraints in order until a decisive violation.
+
+        Returns
+        -------
+        float
+            The penalized value, or a lower bound of it if evaluation stopped early.
+        """
+        residuals = self.evaluator.residuals
+        violation = 0.0
+        position = self.n_eval % self.window
+        for i, segment in zip(self.order, self.segments):
+            for kernel, args in segment:
+                kernel(*args)
+            r = residuals[i]
+            if r > 0:
+                self.counts[i] += 1
+                violation += r
+                if violation > self.decisive:
+                    self.n_short += 1
+                    self.exact = False
+                    value = self.penalty * violation - 1
+                    self.recent[position] = value
+                    return value
+        for kernel, args in self.segments[-1]:
+            kernel(*args)
+        obj = -float(self.evaluator.objective)
+        value = obj + self.penalty * max(1, abs(obj)) * violation
+        self.recent[position] = value
+        self.exact = True
+        return value
+
+    def anneal(self):
+        """Lower the temperature of the SoftMin metric (not at the first evaluation)."""
+        if self.n_eval == 0:
+            return
+        temperature = self.softmin.temperature * self.anneal_rate
+        self.softmin.temperature = max(self.min_temperature, temperature)
+        # The metric changed without any input changing.
+        self.last = None
+
+    def evaluate(self, x):
+        """
+        Evaluate the metric and the constraint residuals at x.
+
+        Parameters
+        ----------
+        x : array_like
+            Flat solver vector.
+
+        Returns
+        -------
+        (float, ndarray)
+            The aggregated metric and the residual buffer (overwritten by the next
+            evaluation).
+        """
+        if self.incremental and self.last is not None:
+            changed = np.flatnonzero(x != self.last)
+            self.f.bind(x)
+            self.evaluator.run_changed(changed)
+        else:
+            self.f.bind(x)
+            self.evaluator.run()
+        if self.incremental:
+            if self.last is None:
+                self.last = np.array(x, dtype=float)
+            else:
+                np.copyto(self.last, x)
+        self.n_eval += 1
+        return float(self.evaluator.objective), self.evaluator.residuals
+
+    def penalize(self, metric, residuals):
+        """
+        Return the penalized value -metric + penalty * max(1, |metric|) * sum(max(r, 0)).
+
+        Parameters
+        ----------
+        metric : float
+        residuals : ndarray
+
+        Returns
+        -------
+        float
+        """
+        np.maximum(residuals, 0, out=self.violations)
+        obj = -metric
+        return obj + self.penalty * max(1, abs(obj)) * float(self.violations.sum())
+
+    def gradient(self, x):
+        """
+        Return the penalized value and its gradient at x.
+
+        The derivatives of the metric and of the residuals are supplied by the
+        backend (see Backend.gradient) and built at the first call. Where the
+        penalized value is not differentiable (a residual or |metric| - 1 at 0),
+        a one-sided derivative is returned.
+
+        Parameters
+        ----------
+        x : array_like
+            Flat solver vector.
+
+        Returns
+        -------
+        (float, ndarray)
+        """
+        if self.derivatives is None:
+            self.derivatives = self.backend.gradient(self.program)
+        metric, residuals = self.evaluate(x)
+        value = self.penalize(metric, residuals)
+        dmetric, jacobian = self.derivatives(np.asarray(x, dtype=float))
+        violation = float(self.violations.sum())
+        scale = max(1, abs(metric))
+        dscale = np.sign(metric) * dmetric if abs(metric) > 1 else 0.0
+        dviolation = jacobian[residuals > 0].sum(axis=0)
+        grad = -dmetric + self.penalty * (dscale * violation + scale * dviolation)
+        return value, grad
+
+    def __call__(self, x, only_obj=False, verbose=False):
+        """
+        Evaluate the penalized objective.
+
+        Parameters
+        ----------
+        x : array_like
+            Flat solver vector.
+        only_obj : bool, optional
+            Return the metric value instead of the penalized objective.
+        verbose : bool, optional
+            Print the metric and the constraint residuals.
+
+        Returns
+        -------
+        float
+        """
+        if self.softmin is not None and self.n_eval % self.anneal_period == 0:
+            self.anneal()
+        if self.short_circuit and not (only_obj or verbose):
+            self.f.bind(x)
+            self.n_eval += 1
+            if self.n_eval % self.reorder_period == 0:
+                self.reorder()
+            if self.n_eval % self.window == 0:
+                level = np.quantile(self.recent, self.quantile)
+                self.decisive = max(self.threshold, (level + 1) / self.penalty)
+            return self.run_short_circuit()
+        self.exact = True
+        metric, residuals = self.evaluate(x)
+        if verbose:
+            print("Obj=", metric, "Constraints=", residuals)
+        if only_obj:
+            return metric
+        return self.penalize(metric, residuals)
@@ -10,6 +10,7 @@ from .div import Div
 from .pow import Pow
 from .dot import Dot
 from .norm import Norm
+from .sqnorm import SqNorm
 from .eq import Eq
 from .ne import Ne
 from .abs import Abs
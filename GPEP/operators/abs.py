@@ -9,11 +9,14 @@ Applies numpy.abs to the evaluated value and provides a printable form.
 """
 
 from .operator import Operator
+from .interval import magnitude
 import numpy as np
 
 
 class Abs(Operator):
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
@@ -30,6 +33,24 @@ class Abs(Operator):
         """
         return np.abs(value)
 
+    def kernel(self, shape, arg_shape=None):
+        """Return numpy.abs writing into out."""
+        return np.abs
+
+    def jvp(self, value, dvalue, arg, darg, out):
+        """Return the tangent sign(value) * dvalue."""
+        if dvalue is None:
+            return None
+        return np.sign(value) * dvalue
+
+    def interval(self, shape, arg_shape=None):
+        """Return the interval of |value|."""
+        return lambda lo, hi, arg_lo, arg_hi: magnitude(lo, hi)
+
+    def function(self, xp, shape, arg_shape=None):
+        """Return xp.abs(value)."""
+        return lambda value: xp.abs(value)
+
     def str(self, expr):
         """String representation for absolute value.
 
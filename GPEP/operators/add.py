@@ -9,6 +9,7 @@ Defines the Add class, representing an addition operation in an expression tree.
 """
 
 from .operator import Operator
+import numpy as np
 
 
 class Add(Operator):
@@ -21,6 +22,8 @@ class Add(Operator):
         Right-hand expression to add.
     """
 
+    __slots__ = ("expr",)
+
     def __init__(self, expr):
         self.expr = expr
         super().__init__()
@@ -40,6 +43,26 @@ class Add(Operator):
         """
         return value + self.expr.eval()
 
+    def kernel(self, shape, arg_shape=None):
+        """Return numpy.add writing into out."""
+        return np.add
+
+    def jvp(self, value, dvalue, arg, darg, out):
+        """Return the tangent dvalue + darg."""
+        if dvalue is None:
+            return darg
+        if darg is None:
+            return dvalue
+        return dvalue + darg
+
+    def interval(self, shape, arg_shape=None):
+        """Return the interval sum [lo + arg_lo, hi + arg_hi]."""
+        return lambda lo, hi, arg_lo, arg_hi: (lo + arg_lo, hi + arg_hi)
+
+    def function(self, xp, shape, arg_shape=None):
+        """Return value + arg."""
+        return lambda value, arg: value + arg
+
     def str(self, expr):
         """Return string representation of the addition node.
 
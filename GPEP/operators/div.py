@@ -9,6 +9,8 @@ Supports both value / expr and expr / value depending on the `r` flag.
 """
 
 from .operator import Operator
+from .interval import mul, reciprocal
+import numpy as np
 
 
 class Div(Operator):
@@ -23,6 +25,8 @@ class Div(Operator):
         If True, computes expr / value instead of value / expr.
     """
 
+    __slots__ = ("expr", "r")
+
     def __init__(self, expr, r=False):
         self.expr = expr
         self.r = r
@@ -47,6 +51,39 @@ class Div(Operator):
         else:
             return self.expr.eval() / value
 
+    def kernel(self, shape, arg_shape=None):
+        """Return numpy.divide writing into out, honoring the `r` flag."""
+        if not self.r:
+            return np.divide
+        return lambda value, arg, out: np.divide(arg, value, out)
+
+    def jvp(self, value, dvalue, arg, darg, out):
+        """Return the tangent of the quotient (dnum - out * dden) / den."""
+        if self.r:
+            value, dvalue, arg, darg = arg, darg, value, dvalue
+        if dvalue is None and darg is None:
+            return None
+        tangent = 0 if dvalue is None else dvalue
+        if darg is not None:
+            tangent = tangent - out * darg
+        return tangent / arg
+
+    def interval(self, shape, arg_shape=None):
+        """Return the interval quotient, unbounded when the divisor contains 0."""
+
+        def quotient(lo, hi, arg_lo, arg_hi):
+            if self.r:
+                lo, hi, arg_lo, arg_hi = arg_lo, arg_hi, lo, hi
+            return mul(lo, hi, *reciprocal(arg_lo, arg_hi))
+
+        return quotient
+
+    def function(self, xp, shape, arg_shape=None):
+        """Return value / arg, honoring the `r` flag."""
+        if not self.r:
+            return lambda value, arg: value / arg
+        return lambda value, arg: arg / value
+
     def str(self, expr):
         """
         Return string representation of the division node.
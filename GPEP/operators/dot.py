@@ -9,6 +9,7 @@ Computes the dot product between evaluated values and a stored vector expression
 """
 
 from .operator import Operator
+from .interval import mul, total
 import numpy as np
 
 
@@ -22,6 +23,8 @@ class Dot(Operator):
         Right-hand side vector expression to dot with.
     """
 
+    __slots__ = ("expr",)
+
     def __init__(self, expr):
         self.expr = expr
         super().__init__()
@@ -42,6 +45,39 @@ class Dot(Operator):
         """
         return np.dot(value, self.expr.eval())
 
+    def shape(self, shape, arg_shape=None):
+        """Return () for a vector-vector product, the broadcast shape if a side is scalar."""
+        if shape == () or arg_shape == ():
+            return np.broadcast_shapes(shape, arg_shape)
+        return ()
+
+    def kernel(self, shape, arg_shape=None):
+        """Return numpy.vecdot (or numpy.multiply if a side is scalar) writing into out."""
+        if shape == () or arg_shape == ():
+            return np.multiply
+        return np.vecdot
+
+    def jvp(self, value, dvalue, arg, darg, out):
+        """Return the tangent dvalue · arg + value · darg."""
+        product = np.vecdot if value.ndim > out.ndim else np.multiply
+        tangent = None if dvalue is None else product(dvalue, arg)
+        if darg is not None:
+            term = product(value, darg)
+            tangent = term if tangent is None else tangent + term
+        return tangent
+
+    def interval(self, shape, arg_shape=None):
+        """Return the interval dot product (the interval product if a side is scalar)."""
+        if shape == () or arg_shape == ():
+            return mul
+        return lambda lo, hi, arg_lo, arg_hi: total(*mul(lo, hi, arg_lo, arg_hi))
+
+    def function(self, xp, shape, arg_shape=None):
+        """Return xp.dot(value, arg) (value * arg if a side is scalar)."""
+        if shape == () or arg_shape == ():
+            return lambda value, arg: value * arg
+        return lambda value, arg: xp.dot(value, arg)
+
     def str(self, expr):
         """
         Return string representation of the dot product node.
@@ -5,6 +5,7 @@ Compares evaluated value to a stored expression proxy.
 """
 
 from .operator import Operator
+import numpy as np
 
 
 class Eq(Operator):
@@ -16,6 +17,8 @@ class Eq(Operator):
         Right-hand side expression to compare against.
     """
 
+    __slots__ = ("expr",)
+
     def __init__(self, expr):
         self.expr = expr
         super().__init__()
@@ -33,6 +36,30 @@ class Eq(Operator):
         """
         return value == self.expr.eval()
 
+    def kernel(self, shape, arg_shape=None):
+        """Return numpy.equal writing into out."""
+        return np.equal
+
+    def jvp(self, value, dvalue, arg, darg, out):
+        """Return None: the comparison is piecewise constant."""
+        return None
+
+    def interval(self, shape, arg_shape=None):
+        """Return [0, 1], or the exact result when it is the same over the box."""
+
+        def extension(lo, hi, arg_lo, arg_hi):
+            disjoint = (hi < arg_lo) | (arg_hi < lo)
+            same = (lo == hi) & (arg_lo == arg_hi) & (lo == arg_lo)
+            low = same.astype(float)
+            high = np.where(disjoint, 0.0, 1.0)
+            return low, high
+
+        return extension
+
+    def function(self, xp, shape, arg_shape=None):
+        """Return 1.0 where value == arg, 0.0 elsewhere."""
+        return lambda value, arg: (value == arg) * 1.0
+
     def str(self, expr):
         """Return string representation for equality.
 
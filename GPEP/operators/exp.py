@@ -11,6 +11,8 @@ import numpy as np
 class Exp(Operator):
     """Exponential operator node."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
@@ -27,6 +29,24 @@ class Exp(Operator):
         """
         return np.exp(value)
 
+    def kernel(self, shape, arg_shape=None):
+        """Return numpy.exp writing into out."""
+        return np.exp
+
+    def jvp(self, value, dvalue, arg, darg, out):
+        """Return the tangent exp(value) * dvalue."""
+        if dvalue is None:
+            return None
+        return out * dvalue
+
+    def interval(self, shape, arg_shape=None):
+        """Return [exp(lo), exp(hi)] (exp is increasing)."""
+        return lambda lo, hi, arg_lo, arg_hi: (np.exp(lo), np.exp(hi))
+
+    def function(self, xp, shape, arg_shape=None):
+        """Return xp.exp(value)."""
+        return lambda value: xp.exp(value)
+
     def str(self, expr):
         """Return string representation for exponential.
 
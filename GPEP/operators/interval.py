@@ -0,0 +1,126 @@
+#
+# Created in 2026 by Gaëtan Serré
+#
+
+"""
+Interval arithmetic helpers for the interval extensions of the operators.
+
+An interval is a pair of arrays (lo, hi) of the same (broadcastable) shape, with
+lo <= hi elementwise; infinite ends are allowed. Every helper returns an enclosure
+of the exact range of the operation over the input intervals, so that evaluating
+a compiled program on boxes of the solver vector gives guaranteed bounds of its
+constraints and metrics over the boxes (see GPEP.compiler.IntervalEvaluator).
+
+The enclosures also hold in floating point: the evaluator rounds the interval of
+every node outward (outward()), which covers the error of one operation or
+library function, and the reductions (total(), Norm) add the error bound of the
+summation of their n terms.
+"""
+
+import numpy as np
+
+EPS = np.finfo(float).eps
+
+
+def outward(lo, hi, rel=4 * EPS):
+    """
+    Round an interval outward, to enclose the rounding error of its computation.
+
+    The finite ends move away by the relative margin rel (a few ulps by default,
+    the accuracy of numpy's elementary functions), then by one more ulp.
+    """
+    with np.errstate(invalid="ignore", over="ignore"):
+        lo = np.where(np.isinf(lo), lo, lo - rel * np.abs(lo))
+        hi = np.where(np.isinf(hi), hi, hi + rel * np.abs(hi))
+    return np.nextafter(lo, -np.inf), np.nextafter(hi, np.inf)
+
+
+def unbounded(lo):
+    """Return the interval (-inf, inf) with the shape of lo."""
+    shape = np.shape(lo)
+    return np.full(shape, -np.inf), np.full(shape, np.inf)
+
+
+def mul(alo, ahi, blo, bhi):
+    """Return an enclosure of {a * b : a in [alo, ahi], b in [blo, bhi]}."""
+    with np.errstate(invalid="ignore"):
+        corners = [alo * blo, alo * bhi, ahi * blo, ahi * bhi]
+    # 0 * inf is nan: the product is then 0 at this corner.
+    corners = [
+        np.nan_to_num(c, nan=0.0, posinf=np.inf, neginf=-np.inf) for c in corners
+    ]
+    lo = np.minimum(
+        np.minimum(corners[0], corners[1]), np.minimum(corners[2], corners[3])
+    )
+    hi = np.maximum(
+        np.maximum(corners[0], corners[1]), np.maximum(corners[2], corners[3])
+    )
+    return lo, hi
+
+
+def reciprocal(lo, hi):
+    """Return an enclosure of {1 / x : x in [lo, hi]} ((-inf, inf) if it contains 0)."""
+    zero = (lo <= 0) & (hi >= 0)
+    with np.errstate(divide="ignore"):
+        rlo = np.where(zero, -np.inf, 1.0 / np.where(zero, 1.0, hi))
+        rhi = np.where(zero, np.inf, 1.0 / np.where(zero, 1.0, lo))
+    return rlo, rhi
+
+
+def magnitude(lo, hi):
+    """Return the interval of |x| for x in [lo, hi]."""
+    alo, ahi = np.abs(lo), np.abs(hi)
+    low = np.where((lo <= 0) & (hi >= 0), 0.0, np.minimum(alo, ahi))
+    return low, np.maximum(alo, ahi)
+
+
+def square(lo, hi):
+    """Return the interval of x ** 2 for x in [lo, hi]."""
+    mlo, mhi = magnitude(lo, hi)
+    return mlo * mlo, mhi * mhi
+
+
+def power(blo, bhi, elo, ehi):
+    """
+    Return an enclosure of {b ** e : b in [blo, bhi], e in [elo, ehi]}.
+
+    Constant integer exponents are exact for any base. Otherwise, the base must be
+    positive (nonnegative for nonnegative exponents), where b ** e is monotone in
+    each argument and its extrema are at the corners; any other case gives
+    (-inf, inf).
+    """
+    blo, bhi, elo, ehi = np.broadcast_arrays(blo, bhi, elo, ehi)
+    with np.errstate(all="ignore"):
+        corners = [np.power(b, e) for b in (blo, bhi) for e in (elo, ehi)]
+        lo = np.minimum(
+            np.minimum(corners[0], corners[1]), np.minimum(corners[2], corners[3])
+        )
+        hi = np.maximum(
+            np.maximum(corners[0], corners[1]), np.maximum(corners[2], corners[3])
+        )
+    integer = (elo == ehi) & (np.round(elo) == elo)
+    zero = (blo <= 0) & (bhi >= 0)
+    even = integer & (np.mod(elo, 2) == 0)
+    # Even powers are not monotone on an interval containing 0.
+    lo = np.where(even & zero, np.where(elo == 0, 1.0, 0.0), lo)
+    valid = np.where(integer, ~zero | (elo >= 0), (blo > 0) | ((blo >= 0) & (elo >= 0)))
+    valid &= ~(np.isnan(lo) | np.isnan(hi))
+    return np.where(valid, lo, -np.inf), np.where(valid, hi, np.inf)
+
+
+def total(lo, hi, axis=-1):
+    """
+    Return an enclosure of the sum of intervals along an axis.
+
+    A floating-point sum of n terms is within (n - 1) * EPS * sum(|terms|) of the
+    exact one, so each end moves outward by this bound.
+    """
+    n = np.shape(lo)[axis]
+    with np.errstate(invalid="ignore"):
+        slo, shi = np.sum(lo, axis=axis), np.sum(hi, axis=axis)
+        elo = (n - 1) * EPS * np.sum(np.abs(lo), axis=axis)
+        ehi = (n - 1) * EPS * np.sum(np.abs(hi), axis=axis)
+        return (
+            np.where(np.isinf(slo), slo, slo - elo),
+            np.where(np.isinf(shi), shi, shi + ehi),
+        )
@@ -11,6 +11,8 @@ import numpy as np
 class Log(Operator):
     """Natural logarithm operator node."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
@@ -27,6 +29,29 @@ class Log(Operator):
         """
         return np.log(value)
 
+    def kernel(self, shape, arg_shape=None):
+        """Return numpy.log writing into out."""
+        return np.log
+
+    def jvp(self, value, dvalue, arg, darg, out):
+        """Return the tangent dvalue / value."""
+        if dvalue is None:
+            return None
+        return dvalue / value
+
+    def interval(self, shape, arg_shape=None):
+        """Return [log(lo), log(hi)] (log is increasing), -inf at nonpositive ends."""
+
+        def extension(lo, hi, arg_lo, arg_hi):
+            with np.errstate(divide="ignore"):
+                return np.log(np.maximum(lo, 0.0)), np.log(np.maximum(hi, 0.0))
+
+        return extension
+
+    def function(self, xp, shape, arg_shape=None):
+        """Return xp.log(value)."""
+        return lambda value: xp.log(value)
+
     def str(self, expr):
         """Return string representation for log.
 
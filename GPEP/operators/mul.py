@@ -5,6 +5,8 @@ Performs multiplication with a stored expression proxy and provides a string for
 """
 
 from .operator import Operator
+from .interval import mul
+import numpy as np
 
 
 class Mul(Operator):
@@ -16,6 +18,8 @@ class Mul(Operator):
         Right-hand expression or scalar to multiply by.
     """
 
+    __slots__ = ("expr",)
+
     def __init__(self, expr):
         self.expr = expr
         super().__init__()
@@ -34,6 +38,25 @@ class Mul(Operator):
         """
         return value * self.expr.eval()
 
+    def kernel(self, shape, arg_shape=None):
+        """Return numpy.multiply writing into out."""
+        return np.multiply
+
+    def jvp(self, value, dvalue, arg, darg, out):
+        """Return the tangent dvalue * arg + value * darg."""
+        tangent = None if dvalue is None else dvalue * arg
+        if darg is not None:
+            tangent = value * darg if tangent is None else tangent + value * darg
+        return tangent
+
+    def interval(self, shape, arg_shape=None):
+        """Return the interval product."""
+        return mul
+
+    def function(self, xp, shape, arg_shape=None):
+        """Return value * arg."""
+        return lambda value, arg: value * arg
+
     def str(self, expr):
         """Return string representation for multiplication.
 
@@ -6,11 +6,14 @@ Negation of Eq; provides boolean inequality and string form.
 """
 
 from .eq import Eq
+import numpy as np
 
 
 class Ne(Eq):
     """Inequality operator node (not equal)."""
 
+    __slots__ = ()
+
     def eval(self, value):
         """Return negation of Eq.eval().
 
@@ -24,6 +27,30 @@ class Ne(Eq):
         """
         return not super().eval(value)
 
+    def kernel(self, shape, arg_shape=None):
+        """Return numpy.not_equal writing into out."""
+        return np.not_equal
+
+    def jvp(self, value, dvalue, arg, darg, out):
+        """Return None: the comparison is piecewise constant."""
+        return None
+
+    def interval(self, shape, arg_shape=None):
+        """Return [0, 1], or the exact result when it is the same over the box."""
+
+        def extension(lo, hi, arg_lo, arg_hi):
+            disjoint = (hi < arg_lo) | (arg_hi < lo)
+            same = (lo == hi) & (arg_lo == arg_hi) & (lo == arg_lo)
+            low = disjoint.astype(float)
+            high = np.where(same, 0.0, 1.0)
+            return low, high
+
+        return extension
+
+    def function(self, xp, shape, arg_shape=None):
+        """Return 1.0 where value != arg, 0.0 elsewhere."""
+        return lambda value, arg: (value != arg) * 1.0
+
     def str(self, expr):
         """Return string representation for inequality.
 
@@ -5,6 +5,7 @@ Computes the vector norm (numpy.linalg.norm) of an evaluated value with given or
 """
 
 from .operator import Operator
+from .interval import EPS, magnitude, outward, unbounded
 import numpy as np
 
 
@@ -17,6 +18,8 @@ class Norm(Operator):
         Order of the norm (e.g. 2 for Euclidean norm) or an Expression/Const.
     """
 
+    __slots__ = ("expr",)
+
     def __init__(self, expr):
         self.expr = expr
         super().__init__()
@@ -35,6 +38,91 @@ class Norm(Operator):
         """
         return np.linalg.norm(value, self.expr.eval())
 
+    def shape(self, shape, arg_shape=None):
+        """Return (): the norm of a vector is a scalar."""
+        return ()
+
+    def kernel(self, shape, arg_shape=None):
+        """Return a norm kernel writing into out.
+
+        The Euclidean norm is computed as sqrt(value · value) in place; other
+        orders fall back to numpy.linalg.vector_norm. The order is assumed to be
+        the same for the whole batch.
+        """
+        if shape == ():
+            return lambda value, order, out: np.abs(value, out)
+
+        def norm(value, order, out):
+            order = order.flat[0]
+            if order == 2:
+                np.vecdot(value, value, out)
+                np.sqrt(out, out)
+            else:
+                np.copyto(out, np.linalg.vector_norm(value, ord=order, axis=-1))
+
+        return norm
+
+    def jvp(self, value, dvalue, arg, darg, out):
+        """Return the tangent of the norm (zero where the norm vanishes).
+
+        The order is considered constant.
+        """
+        if dvalue is None:
+            return None
+        if value.ndim == out.ndim:
+            return np.sign(value) * dvalue
+        order = arg.flat[0]
+        if order == np.inf:
+            i = np.argmax(np.abs(value), axis=-1)[..., None]
+            return np.take_along_axis(np.sign(value) * dvalue, i, axis=-1)[..., 0]
+        if order == 1:
+            return np.vecdot(np.sign(value), dvalue)
+        weights = np.sign(value) * np.abs(value) ** (order - 1)
+        scale = np.power(out, order - 1, where=out > 0, out=np.ones_like(out))
+        return np.where(out > 0, np.vecdot(weights, dvalue) / scale, 0.0)
+
+    def interval(self, shape, arg_shape=None):
+        """
+        Return the interval of the norm of order arg.
+
+        The norm is nondecreasing in the magnitude of every coordinate: its range
+        over a box is [norm(m), norm(M)] with [m_i, M_i] the range of |value_i|.
+        The order must be a constant; otherwise the interval is unbounded. The
+        ends are rounded outward by the error bound of the n-term summation.
+        """
+
+        def extension(lo, hi, arg_lo, arg_hi):
+            mlo, mhi = magnitude(lo, hi)
+            if shape == ():
+                return mlo, mhi
+            order = np.unique(np.concatenate([np.ravel(arg_lo), np.ravel(arg_hi)]))
+            if order.size != 1:
+                return unbounded(mlo[..., 0])
+            norm = np.linalg.vector_norm
+            return outward(
+                norm(mlo, ord=order[0], axis=-1),
+                norm(mhi, ord=order[0], axis=-1),
+                rel=(shape[-1] + 4) * EPS,
+            )
+
+        return extension
+
+    def function(self, xp, shape, arg_shape=None):
+        """Return the norm of order arg (sqrt(value · value) for the Euclidean norm).
+
+        The order is a constant of the program, so that the test on its value is
+        resolved when the function is compiled.
+        """
+        if shape == ():
+            return lambda value, order: xp.abs(value)
+
+        def norm(value, order):
+            if order == 2:
+                return xp.sqrt(xp.dot(value, value))
+            return xp.linalg.norm(value, order)
+
+        return norm
+
     def str(self, expr):
         """String representation for norm.
 
@@ -8,11 +8,23 @@ Base operator abstraction for GPEP.
 Defines the minimal Operator interface expected by the expression system:
 - eval(value) computes the operator action on a numeric/array value.
 - str(expr) returns a textual representation used when building expression strings.
+- shape(shape, arg_shape) and kernel(shape, arg_shape) are used by the compiler to
+  infer result shapes and evaluate into preallocated buffers.
+- jvp(value, dvalue, arg, darg, out) propagates tangents for Jacobian-vector
+  products (see GPEP.compiler.Jacobian).
+- interval(shape, arg_shape) returns the interval extension of the operator, used
+  to bound programs over boxes (see GPEP.compiler.IntervalEvaluator).
+- function(xp, shape, arg_shape) returns a pure implementation written against an
+  array module xp (numpy, jax.numpy), fused into a single compiled function by the
+  JIT backends (see GPEP.compiler.backend).
 """
 
+from .interval import unbounded
+import numpy as np
+
 
 class Operator:
-    """Abstract operator node used in Expression.op_list.
+    """Abstract operator node used in Expression operator chains.
 
     Parameters
     ----------
@@ -20,10 +32,13 @@ class Operator:
 
     Notes
     -----
-    Subclasses should implement eval(value) and str(expr). The base class
-    provides no concrete implementation.
+    Subclasses should implement eval(value) and str(expr), and kernel(shape, arg_shape)
+    to be usable by the compiled evaluator. The base class provides no concrete
+    implementation.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         pass
 
@@ -42,6 +57,118 @@ class Operator:
         """
         pass
 
+    def shape(self, shape, arg_shape=None):
+        """Infer the shape of the result from the shapes of its operands.
+
+        Parameters
+        ----------
+        shape : tuple
+            Shape of the value the operator is applied to (() for scalars, (d,) for vectors).
+        arg_shape : tuple or None
+            Shape of the operator argument (self.expr), or None for unary operators.
+
+        Returns
+        -------
+        tuple
+            Shape of the result. Defaults to numpy broadcasting of both shapes.
+        """
+        if arg_shape is None:
+            return shape
+        return np.broadcast_shapes(shape, arg_shape)
+
+    def kernel(self, shape, arg_shape=None):
+        """Return an allocation-free implementation of the operator.
+
+        Parameters
+        ----------
+        shape : tuple
+            Shape of the value the operator is applied to.
+        arg_shape : tuple or None
+            Shape of the operator argument, or None for unary operators.
+
+        Returns
+        -------
+        callable
+            kernel(value, out) for unary operators and kernel(value, arg, out)
+            otherwise, writing the result into the preallocated array out.
+            Operands are already broadcast to the rank of out.
+        """
+        pass
+
+    def jvp(self, value, dvalue, arg, darg, out):
+        """Return the directional derivative (tangent) of the operator.
+
+        Parameters
+        ----------
+        value : ndarray
+            Value the operator was applied to.
+        dvalue : ndarray or None
+            Tangent of value (None if it is zero).
+        arg : ndarray or None
+            Value of the operator argument, or None for unary operators.
+        darg : ndarray or None
+            Tangent of arg (None if it is zero).
+        out : ndarray
+            Result of the operator, as computed by kernel().
+
+        Returns
+        -------
+        ndarray or None
+            Tangent of the result, broadcastable to out, or None if it is zero.
+            Operands are already broadcast to the rank of out.
+        """
+        pass
+
+    def interval(self, shape, arg_shape=None):
+        """Return the interval extension of the operator.
+
+        Parameters
+        ----------
+        shape : tuple
+            Shape of the value the operator is applied to.
+        arg_shape : tuple or None
+            Shape of the operator argument, or None for unary operators.
+
+        Returns
+        -------
+        callable
+            interval(lo, hi, arg_lo, arg_hi) returning a pair (lo, hi) enclosing the
+            result for every value in [lo, hi] and argument in [arg_lo, arg_hi]
+            (None for unary operators). Operands are already broadcast to the rank
+            of the result. The default is the unbounded interval.
+        """
+
+        def extension(lo, hi, arg_lo, arg_hi):
+            if arg_lo is not None:
+                lo = np.broadcast_arrays(lo, arg_lo)[0]
+            return unbounded(lo)
+
+        return extension
+
+    def function(self, xp, shape, arg_shape=None):
+        """Return a pure implementation of the operator against an array module.
+
+        Parameters
+        ----------
+        xp : module
+            Array module providing the numpy functions used (numpy, jax.numpy). The
+            implementation must also compile in Numba nopython mode when xp is
+            numpy: no out= argument, no keyword argument and no in-place update.
+        shape : tuple
+            Shape of the value the operator is applied to.
+        arg_shape : tuple or None
+            Shape of the operator argument, or None for unary operators.
+
+        Returns
+        -------
+        callable
+            function(value) for unary operators and function(value, arg)
+            otherwise, returning the result for a single solver vector (no batch
+            dimension). The default raises NotImplementedError, in which case the
+            program is evaluated by the NumPy tape.
+        """
+        raise NotImplementedError(f"{type(self).__name__} has no array function")
+
     def str(self, expr):
         """Return a string representation of the operator when applied to expr.
 
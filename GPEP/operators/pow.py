@@ -5,6 +5,7 @@ Supports both value ** expr and expr ** value depending on the `r` flag.
 """
 
 from .operator import Operator
+from .interval import power
 import numpy as np
 
 
@@ -19,6 +20,8 @@ class Pow(Operator):
         If True, computes expr ** value instead of value ** expr.
     """
 
+    __slots__ = ("expr", "r")
+
     def __init__(self, expr, r=False):
         self.expr = expr
         self.r = r
@@ -41,6 +44,39 @@ class Pow(Operator):
         else:
             return np.power(self.expr.eval(), value)
 
+    def kernel(self, shape, arg_shape=None):
+        """Return numpy.power writing into out, honoring the `r` flag."""
+        if not self.r:
+            return np.power
+        return lambda value, arg, out: np.power(arg, value, out)
+
+    def jvp(self, value, dvalue, arg, darg, out):
+        """Return the tangent of base ** exponent, honoring the `r` flag.
+
+        It is exponent * base ** (exponent - 1) * dbase + out * log(base) * dexponent.
+        """
+        if self.r:
+            value, dvalue, arg, darg = arg, darg, value, dvalue
+        tangent = None
+        if dvalue is not None:
+            tangent = arg * np.power(value, arg - 1) * dvalue
+        if darg is not None:
+            term = out * np.log(value) * darg
+            tangent = term if tangent is None else tangent + term
+        return tangent
+
+    def interval(self, shape, arg_shape=None):
+        """Return the interval power, honoring the `r` flag (see interval.power)."""
+        if not self.r:
+            return power
+        return lambda lo, hi, arg_lo, arg_hi: power(arg_lo, arg_hi, lo, hi)
+
+    def function(self, xp, shape, arg_shape=None):
+        """Return value ** arg, honoring the `r` flag."""
+        if not self.r:
+            return lambda value, arg: value**arg
+        return lambda value, arg: arg**value
+
     def str(self, expr):
         """Return string representation for power.
 
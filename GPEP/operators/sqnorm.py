@@ -0,0 +1,79 @@
+#
+# Created in 2026 by Gaëtan Serré
+#
+
+"""
+Squared Euclidean norm operator for Expressions.
+
+Fused form of value.norm() ** 2 produced by the compiler simplification pass;
+it computes value · value without the intermediate square root.
+"""
+
+from .operator import Operator
+from .interval import square, total
+import numpy as np
+
+
+class SqNorm(Operator):
+    """Squared Euclidean norm operator node."""
+
+    __slots__ = ()
+
+    def __init__(self):
+        super().__init__()
+
+    def eval(self, value):
+        """Return value · value.
+
+        Parameters
+        ----------
+        value : numeric or ndarray
+
+        Returns
+        -------
+        float
+        """
+        return np.dot(value, value)
+
+    def shape(self, shape, arg_shape=None):
+        """Return (): the squared norm of a vector is a scalar."""
+        return ()
+
+    def kernel(self, shape, arg_shape=None):
+        """Return numpy.vecdot(value, value) (numpy.square for scalars) writing into out."""
+        if shape == ():
+            return np.square
+        return lambda value, out: np.vecdot(value, value, out)
+
+    def jvp(self, value, dvalue, arg, darg, out):
+        """Return the tangent 2 value · dvalue."""
+        if dvalue is None:
+            return None
+        if value.ndim == out.ndim:
+            return 2 * value * dvalue
+        return 2 * np.vecdot(value, dvalue)
+
+    def interval(self, shape, arg_shape=None):
+        """Return the interval of value · value (a sum of squares of intervals)."""
+        if shape == ():
+            return lambda lo, hi, arg_lo, arg_hi: square(lo, hi)
+        return lambda lo, hi, arg_lo, arg_hi: total(*square(lo, hi))
+
+    def function(self, xp, shape, arg_shape=None):
+        """Return xp.dot(value, value) (value * value for scalars)."""
+        if shape == ():
+            return lambda value: value * value
+        return lambda value: xp.dot(value, value)
+
+    def str(self, expr):
+        """Return string representation for the squared norm.
+
+        Parameters
+        ----------
+        expr : Expression
+
+        Returns
+        -------
+        str
+        """
+        return f"||{str(expr)}||²"
@@ -6,6 +6,7 @@ produces a readable string for composed expressions.
 """
 
 from .operator import Operator
+import numpy as np
 
 
 class Sub(Operator):
@@ -19,6 +20,8 @@ class Sub(Operator):
         If True, computes expr - value instead of value - expr.
     """
 
+    __slots__ = ("expr", "r")
+
     def __init__(self, expr, r=False):
         self.expr = expr
         self.r = r
@@ -42,6 +45,34 @@ class Sub(Operator):
         else:
             return self.expr.eval() - value
 
+    def kernel(self, shape, arg_shape=None):
+        """Return numpy.subtract writing into out, honoring the `r` flag."""
+        if not self.r:
+            return np.subtract
+        return lambda value, arg, out: np.subtract(arg, value, out)
+
+    def jvp(self, value, dvalue, arg, darg, out):
+        """Return the tangent dvalue - darg (darg - dvalue when r is True)."""
+        if self.r:
+            dvalue, darg = darg, dvalue
+        if darg is None:
+            return dvalue
+        if dvalue is None:
+            return -darg
+        return dvalue - darg
+
+    def interval(self, shape, arg_shape=None):
+        """Return the interval difference, honoring the `r` flag."""
+        if not self.r:
+            return lambda lo, hi, arg_lo, arg_hi: (lo - arg_hi, hi - arg_lo)
+        return lambda lo, hi, arg_lo, arg_hi: (arg_lo - hi, arg_hi - lo)
+
+    def function(self, xp, shape, arg_shape=None):
+        """Return value - arg, honoring the `r` flag."""
+        if not self.r:
+            return lambda value, arg: value - arg
+        return lambda value, arg: arg - value
+
     def str(self, expr):
         """String representation for subtraction.
 
@@ -0,0 +1,8 @@
+#
+# Created in 2026 by Gaëtan Serré
+#
+
+from .calibration import Calibration, calibrate
+from .symmetry import Symmetry, detect_symmetry
+from .seeding import Seeds, sample_seeds
+from .relaxation import NotGramLinear, Relaxation, linearize, relaxation_bound
@@ -0,0 +1,194 @@
+#
+# Created in 2026 by Gaëtan Serré
+#
+
+"""
+Calibration of the search space of a GPEP problem.
+
+The natural scale of a worst-case instance depends on the initial conditions and
+on the constants of the function class. Calibration chooses one scale per block
+of the solver vector (points, gradients, values) and the optimizer then searches
+z = x / scale, in which every block lives at scale ~1, so that fixed bounds and
+a unit initial spread fit every problem.
+
+With r the scale of the points, the gradients and values are scaled as
+L * r and L * r² for L-smooth functions, M and M * r for M-Lipschitz functions,
+and r and r² otherwise, with the constants of the Function owning the block (of
+each Function of a Composite). Only these upper constants are used: the box
+must contain the largest gradients, and a strong convexity constant mu only
+bounds them from below (mu * r <= ||g||), which the interpolation constraints
+already enforce, so mu does not change the scales. The radius r is chosen by a
+short pilot sampling phase: it is the largest power of two at which at least
+half of the random samples satisfy every initial condition.
+"""
+
+from ..compiler import Evaluator
+import numpy as np
+from gob.benchmarks import create_bounds
+
+
+class Calibration:
+    """
+    Per-block scaling of the solver vector.
+
+    Parameters
+    ----------
+    f : Function or Composite
+        Function defining the layout of the solver vector. The blocks of every
+        Function of a Composite are scaled with its own constants.
+    d : int
+        Ambient dimension of points and gradients.
+    radius : float, optional
+        Scale r of the points (see block_scales). Default is 1.
+    width : float, optional
+        Half-width of the search box in scaled coordinates. Default is 5.
+    sigma0 : float, optional
+        Initial spread in scaled coordinates. Default is 1.
+
+    Attributes
+    ----------
+    blocks : list
+        Pairs (Function, (point_scale, grad_scale, value_scale)).
+    scale : ndarray
+        Scale of every component of the solver vector.
+    bounds : ndarray
+        Bounds (n_comp × 2) of the scaled search space.
+    """
+
+    def __init__(self, f, d, radius=1.0, width=5.0, sigma0=1.0):
+        self.d = d
+        self.radius = radius
+        self.width = width
+        self.sigma0 = sigma0
+        self.blocks = [
+            (g, block_scales(g, radius)) for g in getattr(f, "functions", [f])
+        ]
+        block = {}
+        for g, (point_scale, grad_scale, value_scale) in self.blocks:
+            block.update({id(v): point_scale for v in g.points.values()})
+            block.update({id(v): grad_scale for v in g.grads.values()})
+            block.update({id(v): value_scale for v in g.values.values()})
+        self.scale = np.ones(f.get_nb_components(d))
+        for v, offset, shape in f.get_layout(d):
+            if offset is not None:
+                self.scale[offset : offset + (shape[0] if shape else 1)] = block[id(v)]
+        self.bounds = create_bounds(len(self.scale), -width, width)
+
+    def to_x(self, z):
+        """Map scaled coordinates to the solver vector."""
+        return self.scale * z
+
+    def to_z(self, x):
+        """Map a solver vector to scaled coordinates."""
+        return x / self.scale
+
+    def wrap(self, F):
+        """
+        Return the objective in scaled coordinates.
+
+        Parameters
+        ----------
+        F : callable
+            Objective F(x, **kwargs) on the solver vector.
+
+        Returns
+        -------
+        callable
+            z -> F(scale * z, **kwargs).
+        """
+
+        def G(z, **kwargs):
+            return F(self.scale * z, **kwargs)
+
+        return G
+
+    def __str__(self):
+        lines = [f"Calibration (d={self.d}):"]
+        for g, scales in self.blocks:
+            indent = "\t"
+            if len(self.blocks) > 1:
+                lines.append(f"\t{g.name} ({g.prefix or 'no prefix'}):")
+                indent = "\t\t"
+            for name, scale in zip(("points", "gradients", "values"), scales):
+                lines.append(
+                    f"{indent}{name}: scale {scale:.3g}, "
+                    f"bounds ±{self.width * scale:.3g}"
+                )
+        lines.append(f"\tsigma0: {self.sigma0:.3g} (scaled)")
+        lines.append(f"\tpilot radius: {self.radius:.3g}")
+        return "\n".join(lines)
+
+
+def constant(f, name):
+    """Return the value of the function-class constant name, or None."""
+    c = getattr(f, name, None)
+    return None if c is None else float(np.asarray(c.eval()))
+
+
+def block_scales(f, r):
+    """
+    Return the (point, gradient, value) scales associated with the point scale r.
+
+    The scales follow the upper constants L or M of the class; mu is ignored.
+
+    Parameters
+    ----------
+    f : Function
+        A single Function (a Composite is scaled Function by Function, see
+        Calibration).
+    r : float
+
+    Returns
+    -------
+    (float, float, float)
+    """
+    L, M = constant(f, "L"), constant(f, "M")
+    if L is not None:
+        return r, L * r, L * r**2
+    if M is not None:
+        return r, M, M * r
+    return r, r, r**2
+
+
+def calibrate(pep, d, n_pilot=64, seed=None, width=5.0, sigma0=1.0):
+    """
+    Calibrate the per-block scales of the solver vector of a problem.
+
+    Parameters
+    ----------
+    pep : GPEP
+        Problem to calibrate.
+    d : int
+        Ambient dimension of points and gradients.
+    n_pilot : int, optional
+        Number of random samples per trial radius. Default is 64.
+    seed : int or None, optional
+        Seed of the pilot sampling.
+    width : float, optional
+        Half-width of the scaled search box. Default is 5.
+    sigma0 : float, optional
+        Initial spread in scaled coordinates. Default is 1.
+
+    Returns
+    -------
+    Calibration
+    """
+    f = pep.f
+    radius = 1.0
+    if pep.initial_conditions:
+        f.check_storage(d)
+        program = pep.compile(d)
+        program = program.restrict(
+            [i for i, key in enumerate(program.keys) if key is None]
+        )
+        evaluator = Evaluator(program, batch=n_pilot)
+        z = np.random.default_rng(seed).standard_normal(evaluator.x.shape)
+        feasible = []
+        radii = 2.0 ** np.arange(-10, 11)
+        for r in radii:
+            scale = Calibration(f, d, r).scale
+            _, residuals = evaluator.evaluate(scale * z)
+            feasible.append(np.mean(np.all(residuals <= 0, axis=-1)) >= 0.5)
+        if any(feasible):
+            radius = float(radii[np.flatnonzero(feasible)[-1]])
+    return Calibration(f, d, radius, width=width, sigma0=sigma0)
@@ -0,0 +1,279 @@
+#
+# Created in 2026 by Gaëtan Serré
+#
+
+"""
+Semidefinite relaxation bound of a GPEP problem.
+
+The global search only finds lower bounds of the worst case. When every
+constraint residual and every metric of the compiled problem is affine in the
+function values and in the inner products of the points and gradients (as in
+the classical PEP formulation), the problem is linear in the Gram matrix
+G = P^T P of the vectors P of the solver vector. Relaxing G = P^T P into G ⪰ 0
+gives a semidefinite program whose optimal value bounds the worst case from
+above in every dimension d, since any candidate maps to a feasible (G, F) with
+the same metric. It is exact when d is at least the number of vectors.
+
+The compiled program is analyzed node by node: vector nodes are linear
+combinations of the vector inputs, scalar nodes are affine in the values and in
+the Gram entries, and any other operation (norm, exp, product of two non-constant
+scalars, ...) makes the problem non Gram-linear, in which case no bound is
+available. The semidefinite program is solved in process by cvxpy, an optional
+dependency (pip install GPEP[sdp]).
+"""
+
+from ..operators import Add, Sub, Mul, Div, Pow, Dot, SqNorm
+from ..expression.expression import Min
+import time
+import numpy as np
+
+
+class NotGramLinear(ValueError):
+    """Raised when a compiled problem is not affine in the Gram matrix."""
+
+
+class Affine:
+    """
+    Scalar affine in the values and in the Gram entries.
+
+    Parameters
+    ----------
+    const : float, optional
+    values : dict, optional
+        Coefficient of every value input, by index.
+    gram : dict, optional
+        Coefficient of every Gram entry (i, j), i <= j, by pair of vector indices.
+    """
+
+    __slots__ = ("const", "values", "gram")
+
+    def __init__(self, const=0.0, values=None, gram=None):
+        self.const = float(const)
+        self.values = {} if values is None else values
+        self.gram = {} if gram is None else gram
+
+    def is_const(self):
+        return not self.values and not self.gram
+
+    def combine(self, other, a=1.0, b=1.0):
+        """Return a * self + b * other."""
+        values = {k: a * c for k, c in self.values.items()}
+        for k, c in other.values.items():
+            values[k] = values.get(k, 0.0) + b * c
+        gram = {k: a * c for k, c in self.gram.items()}
+        for k, c in other.gram.items():
+            gram[k] = gram.get(k, 0.0) + b * c
+        return Affine(a * self.const + b * other.const, values, gram)
+
+    def scale(self, a):
+        return self.combine(Affine(), a, 0.0)
+
+
+def combine(u, v, a=1.0, b=1.0):
+    """Return a * u + b * v for two linear combinations of vectors (dicts)."""
+    out = {k: a * c for k, c in u.items()}
+    for k, c in v.items():
+        out[k] = out.get(k, 0.0) + b * c
+    return out
+
+
+def inner(u, v):
+    """Return the inner product of two linear combinations of vectors, as an Affine."""
+    gram = {}
+    for i, a in u.items():
+        for j, b in v.items():
+            key = (i, j) if i <= j else (j, i)
+            gram[key] = gram.get(key, 0.0) + a * b
+    return Affine(gram=gram)
+
+
+def constant(form):
+    """Return the value of a constant scalar form, or None."""
+    if isinstance(form, Affine) and form.is_const():
+        return form.const
+    return None
+
+
+def linearize(program):
+    """
+    Express a compiled program as a linear problem in the Gram matrix.
+
+    Parameters
+    ----------
+    program : Program
+        Compiled problem (see GPEP.compile).
+
+    Returns
+    -------
+    (list, list, list of Affine, list of Affine)
+        Names of the vector inputs (rows of the Gram matrix), names of the value
+        inputs, the constraint residuals (feasible when <= 0) and the metrics
+        (the objective is their minimum).
+
+    Raises
+    ------
+    NotGramLinear
+        If a constraint or a metric is not affine in the values and Gram entries.
+    """
+    vectors, values = {}, {}
+    forms = {}
+    for node in program.graph.nodes:
+        args = [forms[a.index] for a in node.args]
+        if node.kind == "input":
+            index = vectors if node.shape != () else values
+            i = index.setdefault(node.value, (len(index), node.name))[0]
+            forms[node.index] = (
+                {i: 1.0} if node.shape != () else Affine(values={i: 1.0})
+            )
+        elif node.kind == "const":
+            if node.shape == ():
+                forms[node.index] = Affine(float(node.value))
+            elif np.all(np.asarray(node.value) == 0):
+                forms[node.index] = {}
+            else:
+                raise NotGramLinear("nonzero constant vector")
+        elif node.kind == "op":
+            forms[node.index] = linearize_op(node.op, args)
+        elif isinstance(node.op, Min) and node is program.objective:
+            forms[node.index] = args
+        else:
+            raise NotGramLinear(f"aggregator {type(node.op).__name__}")
+
+    constraints = [forms[n.index] for n in program.constraints]
+    metrics = forms[program.objective.index]
+    if not isinstance(metrics, list):
+        metrics = [metrics]
+    for form in constraints + metrics:
+        if not isinstance(form, Affine):
+            raise NotGramLinear("vector-valued constraint or metric")
+    names = [name for _, name in sorted(vectors.values())]
+    value_names = [name for _, name in sorted(values.values())]
+    return names, value_names, constraints, metrics
+
+
+def linearize_op(op, args):
+    """Return the form of op applied to the forms args, or raise NotGramLinear."""
+    name = type(op).__name__
+    a = args[0]
+    b = args[1] if len(args) > 1 else None
+    vector_a, vector_b = isinstance(a, dict), isinstance(b, dict)
+    if isinstance(op, (Add, Sub)):
+        sign = 1.0 if isinstance(op, Add) else -1.0
+        if vector_a and vector_b:
+            return combine(a, b, 1.0, sign)
+        if not vector_a and not vector_b:
+            return a.combine(b, 1.0, sign)
+    elif isinstance(op, Dot) and vector_a and vector_b:
+        return inner(a, b)
+    elif isinstance(op, SqNorm):
+        if vector_a:
+            return inner(a, a)
+        if constant(a) is not None:
+            return Affine(constant(a) ** 2)
+    elif isinstance(op, (Mul, Dot, Div)):
+        if constant(b) is not None and not (isinstance(op, Div) and constant(b) == 0):
+            c = 1.0 / constant(b) if isinstance(op, Div) else constant(b)
+            return combine(a, {}, c) if vector_a else a.scale(c)
+        if constant(a) is not None and not isinstance(op, Div):
+            return combine(b, {}, constant(a)) if vector_b else b.scale(constant(a))
+    elif isinstance(op, Pow) and constant(b) == 1:
+        return a
+    raise NotGramLinear(f"operator {name}")
+
+
+class Relaxation:
+    """
+    Upper bound of the worst case given by the semidefinite relaxation.
+
+    Parameters
+    ----------
+    bound : float or None
+        Optimal value of the relaxation (+inf if it is unbounded), or None if no
+        bound is available.
+    status : str
+        Solver status, or the reason why no bound is available.
+    n_vectors, n_values : int, optional
+        Size of the Gram matrix and number of values of the relaxation.
+    time : float, optional
+        Solve time in seconds.
+    """
+
+    def __init__(self, bound, status, n_vectors=0, n_values=0, time=0.0):
+        self.bound = bound
+        self.status = status
+        self.n_vectors = n_vectors
+        self.n_values = n_values
+        self.time = time
+
+    def gap(self, value):
+        """Return the relative gap (bound - value) / |bound| (None without bound)."""
+        if self.bound is None:
+            return None
+        return (self.bound - value) / max(abs(self.bound), 1e-300)
+
+    def __str__(self):
+        if self.bound is None:
+            return f"SDP relaxation: no bound available ({self.status})"
+        return (
+            f"SDP relaxation: upper bound {self.bound:.6g} "
+            f"(Gram {self.n_vectors}x{self.n_vectors}, {self.n_values} values, "
+            f"{self.status}, {self.time:.3g}s)"
+        )
+
+
+def relaxation_bound(pep, solver=None):
+    """
+    Bound the worst case of a problem from above by its semidefinite relaxation.
+
+    Parameters
+    ----------
+    pep : GPEP
+        Problem to bound.
+    solver : str or None, optional
+        cvxpy solver name (e.g. "CLARABEL", "SCS", "MOSEK"). Defaults to the
+        solver chosen by cvxpy.
+
+    Returns
+    -------
+    Relaxation
+        The bound, or the reason why none is available: the problem is not
+        Gram-linear, cvxpy is not installed, or the solver failed.
+    """
+    try:
+        names, value_names, constraints, metrics = linearize(pep.compile(1))
+    except NotGramLinear as e:
+        return Relaxation(None, f"not Gram-linear: {e}")
+    try:
+        import cvxpy as cp
+    except ImportError:
+        return Relaxation(None, "cvxpy is not installed")
+
+    n, m = len(names), len(value_names)
+    G = cp.Variable((n, n), PSD=True) if n else None
+    F = cp.Variable(m) if m else None
+    t = cp.Variable()
+
+    def expression(form):
+        terms = [form.const]
+        if form.values:
+            keys = list(form.values)
+            terms.append(F[keys] @ np.array([form.values[k] for k in keys]))
+        if form.gram:
+            rows, cols = zip(*form.gram)
+            terms.append(G[list(rows), list(cols)] @ np.array(list(form.gram.values())))
+        return sum(terms[1:], terms[0])
+
+    rows = [expression(form) <= 0 for form in constraints]
+    rows += [t <= expression(form) for form in metrics]
+    problem = cp.Problem(cp.Maximize(t), rows)
+    tic = time.perf_counter()
+    try:
+        problem.solve(solver=solver)
+    except cp.error.SolverError as e:
+        return Relaxation(None, f"solver failed: {e}", n, m)
+    elapsed = time.perf_counter() - tic
+    if problem.status in ("unbounded", "unbounded_inaccurate"):
+        return Relaxation(np.inf, problem.status, n, m, elapsed)
+    if problem.value is None or problem.status not in ("optimal", "optimal_inaccurate"):
+        return Relaxation(None, f"solver status {problem.status}", n, m, elapsed)
+    return Relaxation(float(problem.value), problem.status, n, m, elapsed)
@@ -0,0 +1,141 @@
+#
+# Created in 2026 by Gaëtan Serré
+#
+
+"""
+Feasible seeding of a GPEP problem from concrete function instances.
+
+Most random candidates violate the interpolation constraints. Seeding samples
+concrete functions of the declared class (see Function.sample), draws random
+initial points around their stationary point (the origin) and runs the unrolled
+algorithm on them numerically: the registered expressions are evaluated in
+registration order, each one only depending on the points, gradients and values
+already computed, and the oracle fills in its gradient and value. Every sample
+then maps to a solver vector that satisfies the interpolation constraints by
+construction, and its metric is a lower bound of the worst case whenever the
+initial conditions hold.
+
+All the samples are processed at once by a batched Evaluator.
+"""
+
+from ..compiler import Evaluator, Graph, Program
+import numpy as np
+
+
+class Seeds:
+    """
+    Feasible solver vectors obtained from concrete functions.
+
+    Parameters
+    ----------
+    x : ndarray
+        Feasible solver vectors, shape (n_feasible, n_comp), sorted by decreasing
+        metric.
+    metrics : ndarray
+        Metric of each feasible vector.
+    n_samples : int
+        Number of sampled functions.
+
+    Attributes
+    ----------
+    best : ndarray or None
+        Feasible vector of largest metric.
+    lower_bound : float
+        Largest metric of the feasible vectors (-inf if there is none).
+    """
+
+    def __init__(self, x, metrics, n_samples):
+        self.x = x
+        self.metrics = metrics
+        self.n_samples = n_samples
+        self.best = x[0] if len(x) else None
+        self.lower_bound = float(metrics[0]) if len(x) else -np.inf
+
+    def __len__(self):
+        return len(self.x)
+
+    def __str__(self):
+        return (
+            f"Seeding: {len(self)}/{self.n_samples} feasible sample(s), "
+            f"lower bound {self.lower_bound:.6g}"
+        )
+
+
+def sample_seeds(pep, d, n_samples=1024, radius=1.0, tol=1e-9, seed=None):
+    """
+    Run the unrolled algorithm of a problem on sampled functions of its class.
+
+    Parameters
+    ----------
+    pep : GPEP
+        Problem whose Function provides a sampler (see Function.sample).
+    d : int
+        Ambient dimension of points and gradients.
+    n_samples : int, optional
+        Number of sampled functions. Default is 1024.
+    radius : float, optional
+        Initial points are drawn uniformly at random in the ball of this radius
+        centered at the stationary point. Default is 1.
+    tol : float, optional
+        Largest residual of a feasible sample. Default is 1e-9.
+    seed : int or None, optional
+        Seed of the sampling.
+
+    Returns
+    -------
+    Seeds
+
+    Raises
+    ------
+    ValueError
+        If the problem has several Functions: the steps of composite methods
+        (e.g. proximal steps) define points implicitly through the gradients at
+        them, which an unrolled run cannot compute.
+    """
+    f = pep.f
+    if hasattr(f, "functions"):
+        raise ValueError(
+            "Seeding samples a single function class: it is not available for "
+            "problems with several Functions."
+        )
+    f.check_storage(d)
+    rng = np.random.default_rng(seed)
+    instance = f.sample(d, n_samples, rng)
+    layout = {v.id: offset for v, offset, _ in f.get_layout(d)}
+    x = np.zeros((n_samples, f.get_nb_components(d)))
+
+    def assign(k, point):
+        """Write the gradient and value of the oracle at point for the key k."""
+        values, grads = instance(point)
+        x[:, layout[f.grads[k].id] : layout[f.grads[k].id] + d] = grads
+        x[:, layout[f.values[k].id]] = values
+
+    for k, v in f.points.items():
+        if k in f.stat_grads:
+            # Stationary points sit at the origin, where the value is 0.
+            continue
+        direction = rng.standard_normal((n_samples, d))
+        direction /= np.maximum(
+            np.linalg.norm(direction, axis=1, keepdims=True), 1e-300
+        )
+        point = radius * rng.uniform(size=(n_samples, 1)) ** (1 / d) * direction
+        x[:, layout[v.id] : layout[v.id] + d] = point
+        assign(k, point)
+
+    keys = list(f.expr.keys())
+    if keys:
+        graph = Graph(f.get_layout(d))
+        outputs = [graph.lower(f.expr[k]) for k in keys]
+        program = Program(graph, [], graph.const(0.0), x.shape[1], outputs=outputs)
+        evaluator = Evaluator(program, batch=n_samples, x=x)
+        segments = evaluator.segments([1 + i for i in range(len(keys))])
+        for k, node, segment in zip(keys, outputs, segments):
+            for kernel, args in segment:
+                kernel(*args)
+            assign(k, evaluator.buffers[node.index])
+
+    evaluator = Evaluator(pep.compile(d), batch=n_samples)
+    metrics, residuals = evaluator.evaluate(x)
+    feasible = np.flatnonzero(np.all(residuals <= tol, axis=1))
+    order = feasible[np.argsort(-metrics[feasible], kind="stable")]
+    return Seeds(x[order], metrics[order].copy(), n_samples)
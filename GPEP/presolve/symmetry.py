@@ -0,0 +1,294 @@
+#
+# Created in 2026 by Gaëtan Serré
+#
+
+"""
+Detection of permutation symmetries of a GPEP problem.
+
+In multi-particle methods, the initial points are often interchangeable: swapping
+two of them, together with everything the algorithm derived from them, leaves the
+initial conditions and the metrics unchanged. The optimizer then explores many
+equivalent basins.
+
+For every transposition of two points, detect_symmetry() relabels the point and
+its proxies, finds the registered expression matching each relabeled expression
+(in registration order, by structural signature) and checks that the initial
+conditions and metrics are invariant. The transpositions found generate the full
+symmetric group of each orbit, so the symmetry can be broken by ordering the
+points of every orbit along their first coordinate.
+"""
+
+from ..variable import Variable
+from ..const import Const
+from ..expression import Expression
+from math import factorial
+import numpy as np
+
+
+class Signatures:
+    """
+    Structural signatures of expressions, up to a relabeling of their Variables.
+
+    Signatures are interned into integers shared by all relabelings, so that
+    two expressions have the same signature if and only if they are structurally
+    identical once relabeled. Chains of Add and Mul are flattened into multisets of
+    terms and the operands of Dot are unordered, so that sums over the points in
+    another order (as produced by the relabeling) have the same signature.
+    """
+
+    commutative = ("Add", "Mul")
+
+    def __init__(self):
+        self.table = {}
+        self.terms = {}
+
+    def intern(self, key):
+        return self.table.setdefault(key, len(self.table))
+
+    @staticmethod
+    def children(obj):
+        if isinstance(obj, Variable) or isinstance(obj, Const):
+            return []
+        if isinstance(obj, Expression):
+            if obj.op is None:
+                return [obj.var]
+            if hasattr(obj.op, "expr"):
+                return [obj.parent, obj.op.expr]
+            return [obj.parent]
+        if hasattr(obj, "e_list"):
+            return list(obj.e_list)
+        return []
+
+    def key(self, obj, memo, label):
+        if isinstance(obj, Variable):
+            return ("var", label.get(obj.id, obj.id))
+        if isinstance(obj, Const):
+            value = np.asarray(obj.value, dtype=float)
+            return ("const", value.shape, value.tobytes())
+        if isinstance(obj, Expression):
+            if obj.op is None:
+                return ("leaf", memo[id(obj.var)])
+            name = type(obj.op).__name__
+            children = self.children(obj)
+            if name in self.commutative:
+                terms = []
+                for c in children:
+                    terms.extend(self.terms.get((name, memo[id(c)]), [memo[id(c)]]))
+                terms = tuple(sorted(terms))
+                key = (name,) + terms
+                self.terms[(name, self.intern(key))] = terms
+                return key
+            args = [memo[id(c)] for c in children]
+            if name == "Dot":
+                args.sort()
+            return (name, getattr(obj.op, "r", None)) + tuple(args)
+        if hasattr(obj, "e_list"):
+            args = sorted(memo[id(e)] for e in obj.e_list)
+            return (type(obj).__name__,) + tuple(args)
+        value = np.asarray(obj, dtype=float)
+        return ("const", value.shape, value.tobytes())
+
+    def __call__(self, roots, label, memo=None):
+        """
+        Return the signature of every root.
+
+        Parameters
+        ----------
+        roots : list
+            Expressions, Variables, Consts or aggregators.
+        label : dict
+            Relabeling of Variable ids (identity for missing ids).
+        memo : dict, optional
+            Signatures already computed with the same label, by object id.
+
+        Returns
+        -------
+        list of int
+        """
+        memo = {} if memo is None else memo
+        for root in roots:
+            stack = [root]
+            while stack:
+                top = stack[-1]
+                if id(top) in memo:
+                    stack.pop()
+                    continue
+                deps = [c for c in self.children(top) if id(c) not in memo]
+                if deps:
+                    stack.extend(deps)
+                    continue
+                stack.pop()
+                memo[id(top)] = self.intern(self.key(top, memo, label))
+        return [memo[id(root)] for root in roots]
+
+
+class Symmetry:
+    """
+    Group of point permutations leaving a problem invariant.
+
+    Parameters
+    ----------
+    orbits : list of list
+        Keys of the interchangeable points (in registration order), one list per
+        orbit of size at least 2.
+    generators : list of dict
+        Transpositions found, as relabelings of Variable ids.
+
+    Attributes
+    ----------
+    order : int
+        Number of permutations in the group (product of the factorials of the
+        orbit sizes).
+    """
+
+    def __init__(self, orbits, generators):
+        self.orbits = orbits
+        self.generators = generators
+        self.order = 1
+        for orbit in orbits:
+            self.order *= factorial(len(orbit))
+
+    def orderings(self):
+        """
+        Return the pairs of consecutive points of every orbit.
+
+        Returns
+        -------
+        list of (str, str)
+            Pairs (k1, k2) such that imposing x_k1[0] <= x_k2[0] breaks the
+            symmetry without excluding any worst case up to permutation.
+        """
+        return [(o[i], o[i + 1]) for o in self.orbits for i in range(len(o) - 1)]
+
+    def __str__(self):
+        if not self.orbits:
+            return "Symmetry group: trivial"
+        orbits = ", ".join("{" + ", ".join(o) + "}" for o in self.orbits)
+        return (
+            f"Symmetry group of order {self.order}: "
+            f"product of the symmetric groups of {orbits}"
+        )
+
+
+def proxies(f, k):
+    """Return the Variables (point, value, gradient) attached to the key k of f."""
+    grads = f.grads if k in f.grads else f.stat_grads
+    return [f.points[k], f.values[k], grads[k]] if k in f.points else []
+
+
+def transposition(pep, a, b, signatures, expr_sigs, owners):
+    """
+    Return the relabeling induced by swapping the points a and b, or None.
+
+    Parameters
+    ----------
+    pep : GPEP
+    a, b : str
+        Keys of the points in pep.f.points.
+    signatures : Signatures
+    expr_sigs : dict
+        Key of every registered expression by owning Function and identity
+        signature.
+    owners : dict
+        Index of the Function owning every key.
+
+    Returns
+    -------
+    dict or None
+        Relabeling of Variable ids if the swap is an automorphism of the problem.
+    """
+    f = pep.f
+    if owners[a] != owners[b] or (a in f.stat_grads) != (b in f.stat_grads):
+        return None
+    label = {}
+    for u, v in zip(proxies(f, a), proxies(f, b)):
+        label[u.id], label[v.id] = v.id, u.id
+    memo = {}
+    for k, e in f.expr.items():
+        (s,) = signatures([e], label, memo)
+        image = expr_sigs.get((owners[k], s))
+        if image is None:
+            return None
+        label[f.values[k].id] = f.values[image].id
+        label[f.grads[k].id] = f.grads[image].id
+    if sorted(label.values()) != sorted(label.keys()):
+        return None
+    if invariants(pep, signatures, label, memo) != invariants(pep, signatures, {}):
+        return None
+    return label
+
+
+def invariants(pep, signatures, label, memo=None):
+    """
+    Return the multisets of signatures of the initial conditions and of the metrics.
+
+    Parameters
+    ----------
+    pep : GPEP
+    signatures : Signatures
+    label : dict
+        Relabeling of Variable ids.
+    memo : dict, optional
+        Signatures already computed with the same label.
+
+    Returns
+    -------
+    (list, list)
+        Sorted (sym, lhs, rhs) triples of the initial conditions and sorted
+        signatures of the metrics.
+    """
+    memo = {} if memo is None else memo
+    conditions = []
+    for c in pep.initial_conditions:
+        lhs, rhs = signatures([c.expr1, c.expr2], label, memo)
+        conditions.append((c.sym, lhs, rhs))
+    metrics = signatures(list(pep.metric), label, memo)
+    return sorted(conditions), sorted(metrics)
+
+
+def detect_symmetry(pep):
+    """
+    Detect the transpositions of points that leave a problem invariant.
+
+    Parameters
+    ----------
+    pep : GPEP
+
+    Returns
+    -------
+    Symmetry
+    """
+    f = pep.f
+    owners = {
+        k: i for i, g in enumerate(getattr(f, "functions", [f])) for k in g.values
+    }
+    signatures = Signatures()
+    keys = list(f.expr.keys())
+    sigs = signatures([f.expr[k] for k in keys], {})
+    expr_sigs = {}
+    for k, s in zip(keys, sigs):
+        expr_sigs.setdefault((owners[k], s), k)
+
+    points = list(f.points.keys())
+    parent = {k: k for k in points}
+
+    def find(k):
+        while parent[k] != k:
+            k = parent[k]
+        return k
+
+    generators = []
+    for i, a in enumerate(points):
+        for b in points[i + 1 :]:
+            if find(a) == find(b):
+                continue
+            label = transposition(pep, a, b, signatures, expr_sigs, owners)
+            if label is not None:
+                generators.append(label)
+                parent[find(b)] = find(a)
+
+    orbits = {}
+    for k in points:
+        orbits.setdefault(find(k), []).append(k)
+    orbits = [o for o in orbits.values() if len(o) > 1]
+    return Symmetry(orbits, generators)
@@ -0,0 +1,5 @@
+#
+# Created in 2026 by Gaëtan Serré
+#
+
+from .solution import Solution, pack
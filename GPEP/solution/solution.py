@@ -0,0 +1,236 @@
+#
+# Created in 2026 by Gaëtan Serré
+#
+
+"""
+Structured result of a GPEP solve.
+
+The flat solver vector depends on the layout of the Function (registration
+order, ambient dimension). A Solution also stores the value of every proxy
+Variable by id, so that it can be inspected by name and repacked into the solver
+vector of another layout to warm-start a new solve.
+"""
+
+import numpy as np
+
+
+def fit(value, shape):
+    """Zero-pad or truncate a value to a given shape (() or (d,))."""
+    value = np.asarray(value, dtype=float)
+    if shape == ():
+        return float(value.flat[0]) if value.size > 0 else 0.0
+    out = np.zeros(shape)
+    n = min(shape[0], value.size)
+    out[:n] = value.ravel()[:n]
+    return out
+
+
+def pack(f, d, variables):
+    """
+    Build the solver vector of a Function from named values.
+
+    Parameters
+    ----------
+    f : Function
+        Function defining the layout (see Function.get_layout).
+    d : int
+        Ambient dimension of points and gradients.
+    variables : dict
+        Values by Variable id (or by Variable). Vectors are zero-padded or
+        truncated to dimension d; missing Variables are set to 0.
+
+    Returns
+    -------
+    ndarray
+        Solver vector of size f.get_nb_components(d).
+    """
+    variables = {getattr(k, "id", k): v for k, v in variables.items()}
+    x = np.zeros(f.get_nb_components(d))
+    for v, offset, shape in f.get_layout(d):
+        if offset is None or v.id not in variables:
+            continue
+        size = shape[0] if shape else 1
+        x[offset : offset + size] = fit(variables[v.id], shape)
+    return x
+
+
+class Solution:
+    """
+    Result of GPEP.solve.
+
+    For backward compatibility, a Solution unpacks as the pair (x, objective).
+
+    Parameters
+    ----------
+    x : ndarray
+        Solver vector of the solution.
+    objective : float
+        Exact value of the metric at x.
+    variables : dict
+        Value of every proxy Variable (points, gradients, values) by id.
+    residuals : ndarray
+        Residual of every constraint (feasible when <= 0).
+    keys : list
+        Origin of every constraint: (k1, k2) for interpolation constraints between
+        the points/expressions k1 and k2 (k1 == k2 for one-point constraints), None
+        for initial conditions.
+    d : int
+        Ambient dimension.
+    n_eval : int
+        Number of objective evaluations.
+    timings : dict
+        Wall-clock durations in seconds ("compile", "presolve", "optimize",
+        "total").
+    f : Function, optional
+        Function of the problem, used to sort the variables into points,
+        gradients and values.
+    timed_out : bool, optional
+        Whether the time limit of the solve was reached before the optimizer
+        finished. Default is False.
+    upper_bound : float or None, optional
+        Upper bound of the worst case given by the relaxation of the problem, if
+        one was computed. Default is None.
+
+    Attributes
+    ----------
+    points, grads, values : dict
+        Values of the points, gradients and function values, keyed like
+        Function.points, Function.grads (including stationary points) and
+        Function.values.
+    """
+
+    def __init__(
+        self,
+        x,
+        objective,
+        variables,
+        residuals,
+        keys,
+        d,
+        n_eval,
+        timings,
+        f=None,
+        timed_out=False,
+        upper_bound=None,
+    ):
+        self.x = x
+        self.objective = objective
+        self.variables = variables
+        self.residuals = residuals
+        self.keys = keys
+        self.d = d
+        self.n_eval = n_eval
+        self.timings = timings
+        self.timed_out = timed_out
+        self.upper_bound = upper_bound
+        self.points, self.grads, self.values = {}, {}, {}
+        if f is not None:
+            for k, v in f.points.items():
+                self.points[k] = variables[v.id]
+            for proxies in (f.grads, f.stat_grads):
+                for k, v in proxies.items():
+                    self.grads[k] = variables[v.id]
+            for k, v in f.values.items():
+                self.values[k] = variables[v.id]
+
+    @classmethod
+    def from_function(
+        cls,
+        f,
+        d,
+        x,
+        objective,
+        residuals,
+        keys,
+        n_eval,
+        timings,
+        timed_out=False,
+        upper_bound=None,
+    ):
+        """
+        Build a Solution from a Function whose proxies hold the solution values.
+
+        Parameters
+        ----------
+        f : Function
+            Function bound to x (see Function.bind).
+        d, x, objective, residuals, keys, n_eval, timings, timed_out, upper_bound
+            See Solution.
+
+        Returns
+        -------
+        Solution
+        """
+        variables = {}
+        for v, _, _ in f.get_layout(d):
+            variables[v.id] = np.array(v.eval(), dtype=float)
+        return cls(
+            np.array(x, dtype=float),
+            objective,
+            variables,
+            np.array(residuals, dtype=float),
+            list(keys),
+            d,
+            n_eval,
+            timings,
+            f,
+            timed_out,
+            upper_bound,
+        )
+
+    @property
+    def max_violation(self):
+        """Largest constraint residual (<= 0 when every constraint holds)."""
+        return float(self.residuals.max()) if self.residuals.size > 0 else 0.0
+
+    def violated(self, tol=0.0):
+        """
+        Return the keys of the constraints whose residual exceeds tol.
+
+        Parameters
+        ----------
+        tol : float, optional
+
+        Returns
+        -------
+        list
+        """
+        return [k for k, r in zip(self.keys, self.residuals) if r > tol]
+
+    def vector(self, f, d):
+        """
+        Repack the solution into the solver vector of a (possibly different) layout.
+
+        Parameters
+        ----------
+        f : Function
+        d : int
+
+        Returns
+        -------
+        ndarray
+        """
+        return pack(f, d, self.variables)
+
+    def __iter__(self):
+        yield self.x
+        yield self.objective
+
+    def __len__(self):
+        return 2
+
+    def __getitem__(self, i):
+        return (self.x, self.objective)[i]
+
+    def __str__(self):
+        lines = [
+            f"Objective: {self.objective}",
+            f"Max violation: {self.max_violation:.3g} "
+            f"({len(self.violated())}/{len(self.keys)} constraints violated)",
+            f"Evaluations: {self.n_eval}"
+            + (" (time limit reached)" if self.timed_out else ""),
+            "Timings: " + ", ".join(f"{k} {t:.3g}s" for k, t in self.timings.items()),
+        ]
+        if self.upper_bound is not None:
+            lines.insert(1, f"Upper bound (relaxation): {self.upper_bound}")
+        return "\n".join(lines)
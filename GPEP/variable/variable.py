@@ -28,6 +28,8 @@ class Variable(Expression):
     Variable.eval() raises ValueError if value is None.
     """
 
+    __slots__ = ("id", "value")
+
     def __init__(self, id, value=None):
         """
         Initialize a Variable.
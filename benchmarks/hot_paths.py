@@ -0,0 +1,176 @@
+#
+# Created in 2026 by Gaëtan Serré
+#
+
+"""
+Micro-benchmarks of the GPEP evaluation hot paths.
+
+Each benchmark is parameterized by a problem size and timed with timeit, so that
+the scaling of the inner pieces of the engine is visible independently of any
+global solve:
+
+- eval: Expression.eval on a chain of t gradient steps.
+- build: construction of that chain through operator overloading.
+- interpolation: Function.create_interpolation_constraints with N points.
+- marshalling: Function.set_points / set_grads / set_values / set_stat_grads.
+- objective: one full call of the penalized objective built by GPEP.objective.
+- str: Function.__str__.
+
+For every benchmark, the log-log slope between the two largest sizes is reported
+as an empirical scaling exponent (e.g. ~2 for O(N²)).
+
+Usage
+-----
+python benchmarks/hot_paths.py [--quick] [--repeat R] [--only NAME ...]
+"""
+
+import argparse
+import timeit
+import numpy as np
+
+from GPEP import GPEP, Variable
+from GPEP.functions import SmoothStronglyConvexFunction
+
+
+def gd_problem(t, gamma=1.0):
+    """Build a PEP for t steps of gradient descent.
+
+    Parameters
+    ----------
+    t : int
+        Number of gradient steps. The Function then tracks N = t + 2 points.
+    gamma : float, optional
+        Step size.
+
+    Returns
+    -------
+    GPEP
+        Problem with one initial condition and one metric.
+    """
+    f = SmoothStronglyConvexFunction(L=1, mu=0.1)
+    xs = f.get_stationary_point()
+    fs = f(xs)
+    x0 = f.gen_initial_point()
+    x = x0
+    for _ in range(t):
+        x = x - gamma * f.grad(x)
+    pep = GPEP(f)
+    pep.set_initial_condition((x0 - xs).norm() ** 2 <= 1)
+    pep.set_metric(f(x) - fs)
+    return pep
+
+
+def bound_problem(t, seed=0):
+    """Build a GD problem and assign random values to all its proxies.
+
+    Returns
+    -------
+    (GPEP, ndarray)
+        The problem and the solver vector that was bound.
+    """
+    pep = gd_problem(t)
+    d = pep.get_dimension()
+    x = np.random.default_rng(seed).standard_normal(pep.get_nb_components(d))
+    pep.objective(d)(x)
+    return pep, x
+
+
+def gd_chain(t):
+    """Return (x_t, leaves) where x_t is t symbolic gradient steps on free Variables."""
+    x = Variable("x", np.ones(4))
+    gs = [Variable(f"g{i}", np.full(4, 0.1)) for i in range(t)]
+    for g in gs:
+        x = x - 0.5 * g
+    return x, gs
+
+
+def bench_eval(t):
+    x, _ = gd_chain(t)
+    return x.eval
+
+
+def bench_build(t):
+    return lambda: gd_chain(t)
+
+
+def bench_interpolation(t):
+    pep, _ = bound_problem(t)
+    return pep.f.create_interpolation_constraints
+
+
+def bench_marshalling(t):
+    pep, x = bound_problem(t)
+    f = pep.f
+    d = pep.get_dimension()
+    nb_points, nb_grads = len(f.points), len(f.grads)
+    points = x[: nb_points * d].reshape(nb_points, d)
+    grads = x[nb_points * d : (nb_points + nb_grads) * d].reshape(nb_grads, d)
+    values = x[(nb_points + nb_grads) * d :]
+
+    def run():
+        f.set_points(points)
+        f.set_grads(grads)
+        f.set_values(values)
+        f.set_stat_grads(d)
+
+    return run
+
+
+def bench_objective(t):
+    pep, x = bound_problem(t)
+    F = pep.objective(pep.get_dimension())
+    return lambda: F(x)
+
+
+def bench_str(t):
+    pep, _ = bound_problem(t)
+    return lambda: str(pep.f)
+
+
+BENCHMARKS = {
+    "eval": (bench_eval, [8, 32, 128, 512]),
+    "build": (bench_build, [8, 32, 128, 512]),
+    "interpolation": (bench_interpolation, [2, 4, 8, 16, 32]),
+    "marshalling": (bench_marshalling, [2, 4, 8, 16, 32]),
+    "objective": (bench_objective, [2, 4, 8, 16, 32]),
+    "str": (bench_str, [2, 4, 8, 16]),
+}
+
+
+def time_call(fn, repeat, min_time=0.05):
+    """Return the best time per call (seconds) over repeat timeit runs."""
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    number = max(1, int(number * min_time / 0.2))
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def run(names, repeat, quick=False):
+    """Run the selected benchmarks and print one table per benchmark."""
+    for name in names:
+        factory, sizes = BENCHMARKS[name]
+        if quick:
+            sizes = sizes[:3]
+        times = []
+        print(f"{name}")
+        for size in sizes:
+            times.append(time_call(factory(size), repeat))
+            print(f"\tsize={size:<5d} {times[-1] * 1e6:12.2f} µs")
+        if len(sizes) > 1:
+            slope = np.log(times[-1] / times[-2]) / np.log(sizes[-1] / sizes[-2])
+            print(f"\tscaling exponent ≈ {slope:.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--quick", action="store_true", help="Only run small sizes.")
+    parser.add_argument("--repeat", type=int, default=5, help="timeit repeats.")
+    parser.add_argument(
+        "--only", nargs="+", choices=list(BENCHMARKS), default=list(BENCHMARKS)
+    )
+    args = parser.parse_args()
+    run(args.only, args.repeat, quick=args.quick)
+
+
+if __name__ == "__main__":
+    main()
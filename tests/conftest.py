@@ -0,0 +1,89 @@
+#
+# Created in 2026 by Gaëtan Serré
+#
+
+"""
+Small performance estimation problems shared by the tests, one per Function class.
+"""
+
+from GPEP import GPEP, emax
+from GPEP.functions import (
+    ConvexFunction,
+    ConvexLipschitzFunction,
+    SmoothConvexFunction,
+    SmoothFunction,
+    SmoothStronglyConvexFunction,
+)
+import numpy as np
+import pytest
+
+
+def gradient_descent(f, steps, gamma, metrics=2):
+    """Return the PEP of gradient descent on f, with one or two metrics."""
+    xs = f.get_stationary_point()
+    fs = f(xs)
+    x0 = f.gen_initial_point()
+    x = x0
+    for k in range(steps):
+        x = x - gamma / (k + 1) * f.grad(x)
+    pep = GPEP(f)
+    pep.set_initial_condition((x0 - xs).norm() ** 2 <= 1)
+    pep.set_metric(f(x) - fs)
+    if metrics > 1:
+        pep.set_metric(f.grad(x).norm() ** 2 * 0.5 + (x - xs).dot(x - xs).abs())
+    return pep
+
+
+def particles(n=2):
+    """Return the PEP of one step of n interacting particles (several metrics)."""
+    f = SmoothStronglyConvexFunction(L=3, mu=0.1)
+    xs = f.get_stationary_point()
+    fs = f(xs)
+    x0s = [f.gen_initial_point() for _ in range(n)]
+    kernel = lambda a, b: (-((a - b).norm() ** 2) / 0.02).exp()
+    x = [a - (1 / 3) * sum(f.grad(b) * kernel(a, b) for b in x0s) / n for a in x0s]
+    pep = GPEP(f)
+    pep.set_initial_condition(emax([(a - xs).norm() ** 2 for a in x0s]) <= 1)
+    for a in x:
+        pep.set_metric(f(a) - fs)
+    return pep
+
+
+PROBLEMS = {
+    "smooth_strongly_convex": lambda: gradient_descent(
+        SmoothStronglyConvexFunction(L=1, mu=0.1), 2, 1.0
+    ),
+    "smooth": lambda: gradient_descent(SmoothFunction(L=2), 2, 0.5),
+    "convex_lipschitz": lambda: gradient_descent(
+        ConvexLipschitzFunction(M=1.5), 2, 0.5
+    ),
+    "convex": lambda: gradient_descent(ConvexFunction(), 2, 0.5),
+    "smooth_convex": lambda: gradient_descent(SmoothConvexFunction(L=1), 2, 1.0),
+    "particles": particles,
+}
+
+
+@pytest.fixture(params=sorted(PROBLEMS))
+def pep(request):
+    """A fresh problem of every kind."""
+    return PROBLEMS[request.param]()
+
+
+@pytest.fixture
+def rng():
+    return np.random.default_rng(0)
+
+
+def random_points(rng, n_comp, n=10):
+    """Return n random solver vectors of mixed scales."""
+    scales = rng.choice([0.01, 1.0, 10.0], size=(n, 1))
+    return rng.standard_normal((n, n_comp)) * scales
+
+
+def unpack(f, d, x):
+    """Return the values by Variable id of a solver vector."""
+    return {
+        v.id: x[offset : offset + (shape[0] if shape else 1)]
+        for v, offset, shape in f.get_layout(d)
+        if offset is not None
+    }
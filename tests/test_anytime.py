@@ -0,0 +1,84 @@
+#
+# Created in 2026 by Gaëtan Serré
+#
+
+from GPEP.objective import Anytime
+from conftest import PROBLEMS, random_points
+import time
+import numpy as np
+
+
+class Scripted:
+    """Optimizer evaluating a fixed list of candidates, returning the lowest value."""
+
+    def __init__(self, candidates):
+        self.candidates = candidates
+
+    def minimize(self, F):
+        values = [F(z) for z in self.candidates]
+        i = int(np.argmin(values))
+        return self.candidates[i], values[i]
+
+
+def test_deadline_stops_evaluations():
+    """After the deadline, F is not called and the record is kept."""
+    calls = []
+
+    def F(z):
+        calls.append(z)
+        time.sleep(0.02)
+        return float(z[0])
+
+    monitor = Anytime(F, deadline=time.perf_counter() + 0.05)
+    candidates = [np.array([v]) for v in (3.0, 2.0, 1.0, -5.0, -6.0, -7.0)]
+    z, value = monitor.minimize(Scripted(candidates))
+    assert monitor.timed_out and 0 < monitor.n_eval < len(candidates)
+    assert len(calls) == monitor.n_eval
+    assert value == float(calls[-1][0]) and z[0] == value
+    assert monitor.snapshot() is None
+    monitor.publish()
+    assert monitor.snapshot()["value"] == value
+
+
+def test_target_stops_evaluations():
+    """The first candidate reaching the target ends the run."""
+    calls = []
+
+    def F(z):
+        calls.append(z)
+        return float(z[0])
+
+    monitor = Anytime(F, target=0.0)
+    candidates = [np.array([v]) for v in (3.0, 1.0, -1.0, -5.0, -2.0)]
+    z, value = monitor.minimize(Scripted(candidates))
+    assert monitor.reached and not monitor.timed_out
+    assert len(calls) == 3 and value == -1.0 and z[0] == -1.0
+
+
+def test_only_exact_values_are_recorded():
+    """Lower bounds and estimates neither enter the record nor reach the target."""
+    inexact = {-9.0, -3.0}
+    last = []
+
+    def F(z):
+        last[:] = [float(z[0]) not in inexact]
+        return float(z[0])
+
+    monitor = Anytime(F, target=-4.0, exact=lambda: last[0])
+    candidates = [np.array([v]) for v in (2.0, -9.0, 1.0, -3.0)]
+    z, value = monitor.minimize(Scripted(candidates))
+    assert not monitor.reached and monitor.n_eval == 4
+    assert value == 1.0 and z[0] == 1.0
+
+
+def test_short_circuited_values_are_not_exact(rng):
+    """The Objective flags the values of short-circuited candidates as inexact."""
+    pep = PROBLEMS["smooth_strongly_convex"]()
+    F = pep.objective(2, short_circuit=True, window=10)
+    flags = []
+    for x in random_points(rng, F.program.n_comp, 100):
+        n_short = F.n_short
+        F(x)
+        flags.append((F.exact, F.n_short > n_short))
+    assert any(short for _, short in flags)
+    assert all(exact != short for exact, short in flags)
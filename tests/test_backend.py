@@ -0,0 +1,93 @@
+#
+# Created in 2026 by Gaëtan Serré
+#
+
+from GPEP.compiler import Backend, Evaluator, FusedEvaluator, get_backend
+from conftest import PROBLEMS, random_points
+import sys
+import numpy as np
+import pytest
+
+
+@pytest.mark.parametrize("name", ["numba", "jax"])
+def test_fused_evaluator_matches_tape(pep, rng, name):
+    """The program fused by a JIT backend evaluates like the NumPy tape."""
+    pytest.importorskip(name)
+    backend = get_backend(name)
+    pep.f.check_storage(2)
+    program = pep.compile(2)
+    fused = backend.evaluator(program)
+    assert isinstance(fused, FusedEvaluator)
+    tape = Evaluator(program)
+    for x in random_points(rng, program.n_comp):
+        objective, residuals = tape.evaluate(x)
+        fused.evaluate(x)
+        np.testing.assert_allclose(fused.residuals, residuals, rtol=1e-12, atol=1e-12)
+        np.testing.assert_allclose(fused.objective, objective, rtol=1e-12, atol=1e-12)
+
+
+@pytest.mark.parametrize("name", ["numpy", "numba", "jax"])
+def test_gradients_agree(rng, name):
+    """Every backend supplies the same derivatives as the NumPy tape."""
+    if name != "numpy":
+        pytest.importorskip(name)
+    pep = PROBLEMS["smooth_strongly_convex"]()
+    pep.f.check_storage(2)
+    program = pep.compile(2)
+    gradient = get_backend(name).gradient(program)
+    reference = Backend().gradient(program)
+    for x in rng.standard_normal((3, program.n_comp)):
+        for value, expected in zip(gradient(x), reference(x)):
+            np.testing.assert_allclose(value, expected, rtol=1e-9, atol=1e-12)
+
+
+def test_missing_package_falls_back(monkeypatch):
+    """A backend whose package is missing falls back to NumPy with a warning."""
+    monkeypatch.setitem(sys.modules, "numba", None)
+    with pytest.warns(RuntimeWarning, match="falling back to NumPy"):
+        backend = get_backend("numba")
+    assert backend.name == "numpy"
+
+
+def test_soft_minimum_falls_back():
+    """Programs that cannot be fused are evaluated by the NumPy tape."""
+    pytest.importorskip("numba")
+    pep = PROBLEMS["particles"]()
+    pep.f.check_storage(1)
+    program = pep.compile(1, temperature=0.1)
+    with pytest.warns(RuntimeWarning, match="falling back to NumPy"):
+        evaluator = get_backend("numba").evaluator(program)
+    assert isinstance(evaluator, Evaluator)
+
+
+def test_fallback_keeps_numpy_modes(monkeypatch):
+    """NumPy-only evaluation modes work when a missing backend falls back."""
+    monkeypatch.setitem(sys.modules, "numba", None)
+    pep = PROBLEMS["smooth"]()
+    with pytest.warns(RuntimeWarning, match="falling back to NumPy"):
+        F = pep.objective(2, backend="numba", short_circuit=True)
+    assert F.backend.name == "numpy"
+
+
+def test_jit_backend_rejects_numpy_modes():
+    """A loaded JIT backend cannot run the partial evaluations of the tape."""
+    pytest.importorskip("numba")
+    pep = PROBLEMS["smooth"]()
+    with pytest.raises(ValueError, match="cannot be combined"):
+        pep.objective(2, backend="numba", incremental=True)
+
+
+def test_jax_keeps_global_precision(rng):
+    """The JAX backend computes in float64 without changing the JAX configuration."""
+    jax = pytest.importorskip("jax")
+    before = jax.config.jax_enable_x64
+    pep = PROBLEMS["smooth"]()
+    pep.f.check_storage(2)
+    program = pep.compile(2)
+    fused = get_backend("jax").evaluator(program)
+    x = random_points(rng, program.n_comp, 1)[0]
+    fused.evaluate(x)
+    assert jax.config.jax_enable_x64 == before
+    np.testing.assert_allclose(
+        fused.residuals, Evaluator(program).evaluate(x)[1], rtol=1e-12, atol=1e-12
+    )
@@ -0,0 +1,31 @@
+#
+# Created in 2026 by Gaëtan Serré
+#
+
+from GPEP.drivers import branch_and_bound
+from GPEP.drivers.branch_and_bound import default_bounds
+from GPEP.functions import SmoothConvexFunction
+from conftest import gradient_descent
+import numpy as np
+
+
+def test_default_bounds_fix_the_stationary_point():
+    """The stationary point and its value are fixed at 0, the rest is free."""
+    pep = gradient_descent(SmoothConvexFunction(L=1), 1, 1.0, metrics=1)
+    f, d = pep.f, 2
+    bounds = default_bounds(f, d, 10.0)
+    layout = {v.id: offset for v, offset, _ in f.get_layout(d)}
+    xs = next(iter(f.stat_grads))
+    fixed = [layout[f.values[xs].id]]
+    fixed += range(layout[f.points[xs].id], layout[f.points[xs].id] + d)
+    assert np.all(bounds[fixed] == 0)
+    free = np.delete(bounds, fixed, axis=0)
+    assert len(free) and np.all(free == [-10.0, 10.0])
+
+
+def test_bracket_contains_gradient_descent_rate():
+    """One step of gradient descent with step 1/L: the rate L R² / 6 is bracketed."""
+    pep = gradient_descent(SmoothConvexFunction(L=1), 1, 1.0, metrics=1)
+    solution = branch_and_bound(pep, d=1, node_limit=50_000, tol=1e-3, processes=1)
+    assert solution.max_violation <= 1e-6
+    assert solution.objective <= 1 / 6 <= solution.upper_bound < 0.2
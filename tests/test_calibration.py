@@ -0,0 +1,54 @@
+#
+# Created in 2026 by Gaëtan Serré
+#
+
+from GPEP import GPEP
+from GPEP.functions import ConvexLipschitzFunction, SmoothFunction
+from GPEP.presolve import calibrate
+from conftest import PROBLEMS
+import numpy as np
+
+
+def scales(calibration, pep, f, d):
+    """Return the scales of the point, gradient and value proxies of f in pep."""
+    scale = {}
+    for v, offset, shape in pep.f.get_layout(d):
+        if offset is not None:
+            scale[v.id] = calibration.scale[
+                offset : offset + (shape[0] if shape else 1)
+            ]
+    return (
+        np.concatenate([scale[v.id] for v in f.points.values()]),
+        np.concatenate([scale[v.id] for v in f.grads.values()]),
+        np.concatenate([scale[v.id] for v in f.values.values()]),
+    )
+
+
+def test_scales_follow_class_constants():
+    """The pilot radius fits the initial condition, and L scales the other blocks."""
+    pep = PROBLEMS["smooth"]()
+    calibration = calibrate(pep, 2, seed=0)
+    r = calibration.radius
+    assert 0.25 <= r <= 1
+    points, grads, values = scales(calibration, pep, pep.f, 2)
+    assert np.all(points == r) and np.all(grads == 2 * r) and np.all(values == 2 * r**2)
+    assert np.all(calibration.bounds == [-5, 5])
+
+
+def test_composite_blocks_use_their_own_constants():
+    """Every Function of a Composite is scaled with its own constants."""
+    f = SmoothFunction(L=4)
+    h = ConvexLipschitzFunction(M=3, prefix="h")
+    xs = f.gen_initial_point()
+    x0 = h.gen_initial_point()
+    x1 = x0 - f.grad(x0) - h.grad(x0)
+    pep = GPEP([f, h])
+    pep.set_initial_condition((x0 - xs).norm() ** 2 <= 1)
+    pep.set_metric(f(x1) + h(x1) - f(xs) - h(xs))
+    calibration = calibrate(pep, 2, seed=0)
+    r = calibration.radius
+    _, grads, values = scales(calibration, pep, f, 2)
+    assert np.all(grads == 4 * r) and np.all(values == 4 * r**2)
+    _, grads, values = scales(calibration, pep, h, 2)
+    assert np.all(grads == 3) and np.all(values == 3 * r)
+    assert "h" in str(calibration)
@@ -0,0 +1,69 @@
+#
+# Created in 2026 by Gaëtan Serré
+#
+
+from GPEP import GPEP
+from GPEP.functions import (
+    ConvexFunction,
+    ConvexLipschitzFunction,
+    SmoothConvexFunction,
+)
+from GPEP.presolve import sample_seeds
+from gob.optimizers import CMA_ES
+import pytest
+
+
+def proximal_gradient():
+    """Return the PEP of one proximal gradient step on f + h."""
+    f = SmoothConvexFunction(L=1)
+    h = ConvexFunction(prefix="h")
+    xs = f.gen_initial_point()
+    x0 = f.gen_initial_point()
+    y = x0 - f.grad(x0)
+    x = h.gen_initial_point()
+    pep = GPEP([f, h])
+    pep.set_initial_condition((f.grad(xs) + h.grad(xs)).norm() ** 2 <= 0)
+    pep.set_initial_condition((x - (y - h.grad(x))).norm() ** 2 <= 0)
+    pep.set_initial_condition((x0 - xs).norm() ** 2 <= 1)
+    pep.set_metric(f(x) + h(x) - f(xs) - h(xs))
+    return pep
+
+
+def subgradient():
+    """Return the PEP of one subgradient step with step 1/2 on f + h."""
+    f = SmoothConvexFunction(L=1)
+    h = ConvexLipschitzFunction(M=1, prefix="h")
+    xs = f.gen_initial_point()
+    x0 = f.gen_initial_point()
+    x1 = x0 - 0.5 * (f.grad(x0) + h.grad(x0))
+    pep = GPEP([f, h])
+    pep.set_initial_condition((f.grad(xs) + h.grad(xs)).norm() ** 2 <= 0)
+    pep.set_initial_condition((x0 - xs).norm() ** 2 <= 1)
+    pep.set_metric(f(x1) + h(x1) - f(xs) - h(xs))
+    return pep
+
+
+def test_solve_several_functions():
+    """A composite PEP is solved end to end, with the proxies of every Function."""
+    pep = subgradient()
+    solution = pep.solve(
+        opt=lambda bounds, m_0=None: CMA_ES(bounds, n_eval=20000, sigma0=1, m_0=m_0),
+        calibrate=True,
+        d=2,
+    )
+    assert solution.max_violation <= 1e-6 and solution.objective > 1e-3
+    assert any(name.startswith("h") for name in solution.values)
+    try:
+        import cvxpy  # noqa: F401
+    except ImportError:
+        return
+    assert solution.objective <= pep.relaxation_bound().bound + 1e-6
+
+
+def test_seeding_rejects_several_functions():
+    """Seeding several Functions fails early with a ValueError."""
+    pep = proximal_gradient()
+    with pytest.raises(ValueError, match="several Functions"):
+        pep.solve(seeds=8)
+    with pytest.raises(ValueError, match="several Functions"):
+        sample_seeds(pep, 2, n_samples=8)
@@ -0,0 +1,61 @@
+#
+# Created in 2026 by Gaëtan Serré
+#
+
+from GPEP.drivers import lift
+from GPEP.compiler import Evaluator
+from GPEP.functions import (
+    ConvexFunction,
+    ConvexLipschitzFunction,
+    SmoothConvexFunction,
+    SmoothStronglyConvexFunction,
+)
+from GPEP.solution import pack
+from conftest import gradient_descent
+from types import SimpleNamespace
+import numpy as np
+import pytest
+
+
+def quadratic_solution(pep, d, rng):
+    """Return the variables of pep for f(x) = x^T A x / 2, a feasible point."""
+    f = pep.f
+    f.check_storage(d)
+    A = np.diag(np.linspace(0.1, 1, d))
+    variables = {f.points["x0"].id: np.zeros(d)}
+    start = rng.standard_normal(d)
+    variables[f.points["x1"].id] = start / np.linalg.norm(start)
+    proxies = list(f.grads.items()) + list(f.stat_grads.items())
+    for key, grad in proxies:
+        if key in f.points:
+            point = variables[f.points[key].id]
+        else:
+            f.bind(pack(f, d, variables))
+            point = np.asarray(f.expr[key].eval(), dtype=float)
+        variables[grad.id] = A @ point
+        variables[f.values[key].id] = 0.5 * point @ A @ point
+    return variables
+
+
+@pytest.mark.parametrize(
+    "function",
+    [
+        lambda: SmoothStronglyConvexFunction(L=1, mu=0.1),
+        lambda: SmoothConvexFunction(L=1),
+        lambda: ConvexLipschitzFunction(M=1.5),
+        lambda: ConvexFunction(),
+    ],
+)
+def test_lift_repairs_appended_point(function, rng):
+    """The point appended by one more iteration is made feasible."""
+    d = 2
+    previous = gradient_descent(function(), 2, 1.0, metrics=1)
+    solution = SimpleNamespace(variables=quadratic_solution(previous, d, rng))
+    pep = gradient_descent(function(), 3, 1.0, metrics=1)
+    evaluator = Evaluator(pep.compile(d))
+    copied = lift(solution, pep, d, iterations=0)
+    assert evaluator.evaluate(pack(pep.f, d, copied))[1].max() > 1e-6
+    residuals = evaluator.evaluate(pack(pep.f, d, lift(solution, pep, d)))[1]
+    assert residuals.max() <= 1e-9
+    for key, value in solution.variables.items():
+        np.testing.assert_array_equal(copied[key], value)
@@ -0,0 +1,25 @@
+#
+# Created in 2026 by Gaëtan Serré
+#
+
+from GPEP.drivers import grow_dimension
+from conftest import PROBLEMS
+from types import SimpleNamespace
+
+
+def test_probes_forward_solve_options(monkeypatch):
+    """The probes use the solve options of the caller, except opt and x0."""
+    pep = PROBLEMS["smooth"]()
+    calls = []
+
+    def solve(**kwargs):
+        calls.append(kwargs)
+        return SimpleNamespace(objective=float(kwargs["d"]), max_violation=0.0)
+
+    monkeypatch.setattr(pep, "solve", solve)
+    grow_dimension(pep, lazy=True, backend="numba", calibrate=True, opt="full")
+    probes = [kwargs for kwargs in calls if kwargs["opt"] != "full"]
+    assert probes and len(calls) == 2 * len(probes) + 1
+    for kwargs in probes:
+        assert kwargs["lazy"] and kwargs["calibrate"] and kwargs["backend"] == "numba"
+        assert kwargs["x0"] is not None
@@ -0,0 +1,56 @@
+#
+# Created in 2026 by Gaëtan Serré
+#
+
+from GPEP.compiler import Evaluator
+from conftest import PROBLEMS, random_points
+import warnings
+import pytest
+import numpy as np
+
+
+def test_aggregates_without_deprecated_calls(rng):
+    """Min/max aggregates of several metrics must not use deprecated numpy calls."""
+    pep = PROBLEMS["particles"]()
+    assert len(pep.metric) > 1
+    pep.f.check_storage(2)
+    program = pep.compile(2)
+    evaluators = [Evaluator(program), Evaluator(program, batch=4)]
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)
+        for x in random_points(rng, program.n_comp, 4):
+            evaluators[0].evaluate(x)
+        evaluators[1].evaluate(random_points(rng, program.n_comp, 4))
+    assert np.all(np.isfinite(evaluators[1].objective))
+
+
+def test_run_changed_matches_run(pep, rng):
+    """Re-evaluating the nodes depending on a few coordinates equals a full run."""
+    pep.f.check_storage(2)
+    program = pep.compile(2)
+    incremental, full = Evaluator(program), Evaluator(program)
+    x = random_points(rng, program.n_comp, 1)[0]
+    incremental.evaluate(x)
+    for _ in range(10):
+        changed = rng.choice(program.n_comp, size=rng.integers(1, 4), replace=False)
+        x[changed] += rng.standard_normal(len(changed))
+        np.copyto(incremental.x, x)
+        incremental.run_changed(changed)
+        full.evaluate(x)
+        np.testing.assert_allclose(incremental.residuals, full.residuals, rtol=1e-12)
+        np.testing.assert_allclose(incremental.objective, full.objective, rtol=1e-12)
+
+
+@pytest.mark.parametrize("d", [1, 3])
+def test_simplify_preserves_values(pep, rng, d):
+    """The simplification pass does not change the objective nor the residuals."""
+    pep.f.check_storage(d)
+    simplified = Evaluator(pep.compile(d))
+    plain = Evaluator(pep.compile(d, simplify=False))
+    assert len(simplified.tape) <= len(plain.tape)
+    for x in random_points(rng, simplified.program.n_comp):
+        objective, residuals = simplified.evaluate(x)
+        np.testing.assert_allclose(
+            residuals, plain.evaluate(x)[1], rtol=1e-9, atol=1e-12
+        )
+        np.testing.assert_allclose(objective, plain.objective, rtol=1e-9, atol=1e-12)
@@ -0,0 +1,38 @@
+#
+# Created in 2026 by Gaëtan Serré
+#
+
+from GPEP.functions import SmoothConvexFunction
+import numpy as np
+import pytest
+
+
+def test_reallocation_keeps_values(rng):
+    """Registering proxies after an assignment keeps the points, gradients and values."""
+    f = SmoothConvexFunction(L=1)
+    x0 = f.gen_initial_point()
+    f.grad(x0)
+    f(x0)
+    f.check_storage(2)
+    points, grads = rng.standard_normal((1, 2)), rng.standard_normal((1, 2))
+    f.set_points(points)
+    f.set_grads(grads)
+    f.set_values([0.5])
+    x1 = x0 - f.grad(x0)
+    f(x1)
+    f.check_storage(3)
+    np.testing.assert_array_equal(f.X[0], np.append(points[0], 0))
+    np.testing.assert_array_equal(f.G[0], np.append(grads[0], 0))
+    assert f.F[0] == 0.5
+    assert np.all(f.F[1:] == 0) and np.all(f.G[1:] == 0)
+
+
+def test_check_storage_requires_dimension():
+    """Without a previous allocation, the dimension must be given."""
+    f = SmoothConvexFunction(L=1)
+    f(f.gen_initial_point())
+    with pytest.raises(ValueError, match="dimension"):
+        f.check_storage()
+    f.check_storage(2)
+    f.check_storage()
+    assert f.d == 2
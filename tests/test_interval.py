@@ -0,0 +1,28 @@
+#
+# Created in 2026 by Gaëtan Serré
+#
+
+from GPEP.compiler import Evaluator, IntervalEvaluator
+from GPEP.operators.interval import total
+from conftest import random_points
+import numpy as np
+
+
+def test_intervals_enclose_points(pep, rng):
+    """The bounds of degenerate boxes enclose the values at their point."""
+    pep.f.check_storage(2)
+    program = pep.compile(2)
+    x = random_points(rng, program.n_comp, 50)
+    objective, residuals = Evaluator(program, batch=50).evaluate(x)
+    o_lo, o_hi, r_lo, r_hi = IntervalEvaluator(program).evaluate(x, x)
+    assert np.all((o_lo <= objective) & (objective <= o_hi))
+    assert np.all((r_lo <= residuals) & (residuals <= r_hi))
+    finite = np.isfinite(o_lo) & (objective != 0)
+    assert np.all(o_lo[finite] < o_hi[finite])
+
+
+def test_total_rounds_outward():
+    """A sum with cancellation is enclosed despite the rounding of each addition."""
+    terms = np.array([1.0, 1e-16, -1.0, 1e-16])
+    lo, hi = total(terms, terms)
+    assert lo < 2e-16 < hi
@@ -0,0 +1,32 @@
+#
+# Created in 2026 by Gaëtan Serré
+#
+
+from GPEP.compiler import Evaluator
+from conftest import random_points
+import numpy as np
+
+
+def test_jacobian_matches_finite_differences(pep, rng):
+    """Forward-mode Jacobian values and products agree with central differences."""
+    jacobian = pep.jacobian(2)
+    evaluator = Evaluator(jacobian.program)
+    h = 1e-6
+    for x in rng.standard_normal((3, jacobian.shape[1])):
+        dense = jacobian.todense(x)
+        columns = []
+        for e in np.eye(len(x)):
+            forward = evaluator.evaluate(x + h * e)[1].copy()
+            backward = evaluator.evaluate(x - h * e)[1]
+            columns.append((forward - backward) / (2 * h))
+        expected = np.stack(columns, axis=1)
+        np.testing.assert_allclose(dense, expected, rtol=1e-5, atol=1e-5)
+        # Structural zeros are exact zeros.
+        mask = np.ones(jacobian.shape, dtype=bool)
+        rows = np.repeat(np.arange(jacobian.shape[0]), np.diff(jacobian.indptr))
+        mask[rows, jacobian.indices] = False
+        assert not np.any(dense[mask])
+        v = random_points(rng, len(x), 1)[0]
+        np.testing.assert_allclose(
+            jacobian.jvp(v, x)[1], dense @ v, rtol=1e-9, atol=1e-9
+        )
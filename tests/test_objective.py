@@ -0,0 +1,83 @@
+#
+# Created in 2026 by Gaëtan Serré
+#
+
+from GPEP.presolve import sample_seeds
+from conftest import PROBLEMS, random_points
+import warnings
+import numpy as np
+import pytest
+
+
+def test_penalty_without_deprecated_calls(rng):
+    """The penalized value must not use deprecated numpy calls."""
+    pep = PROBLEMS["particles"]()
+    F = pep.objective(2)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)
+        for x in random_points(rng, F.program.n_comp, 4):
+            F(x)
+
+
+def reference(pep, penalty):
+    """Penalized value and metric computed by Expression.eval on the bound storage."""
+    constraints = pep.f.create_interpolation_constraints() + pep.initial_conditions
+    residuals = np.array([float(np.squeeze(c.c_eval())) for c in constraints])
+    metric = min(float(np.squeeze(m.eval())) for m in pep.metric)
+    violation = np.maximum(residuals, 0).sum()
+    return -metric + penalty * max(1, abs(metric)) * violation, metric
+
+
+@pytest.mark.parametrize("d", [1, 3])
+def test_compiled_objective_matches_expressions(pep, rng, d):
+    """The compiled objective equals the interpreted evaluation of the expressions."""
+    F = pep.objective(d)
+    for x in random_points(rng, F.program.n_comp):
+        value, metric = F(x), F(x, only_obj=True)
+        expected_value, expected_metric = reference(pep, F.penalty)
+        assert value == pytest.approx(expected_value, rel=1e-9, abs=1e-9)
+        assert metric == pytest.approx(expected_metric, rel=1e-9, abs=1e-9)
+
+
+def test_short_circuit_ranks_hopeless_behind_feasible(rng):
+    """Short-circuited values are lower bounds ranking behind every feasible candidate."""
+    pep = PROBLEMS["smooth_strongly_convex"]()
+    seeds = sample_seeds(pep, 2, 200, seed=0)
+    F = pep.objective(2, short_circuit=True, window=10, reorder_period=50)
+    exact = pep.objective(2)
+    candidates = np.concatenate([seeds.x, random_points(rng, F.program.n_comp, 400)])
+    feasible = np.arange(len(candidates)) < len(seeds)
+    order = rng.permutation(len(candidates))
+    candidates, feasible = candidates[order], feasible[order]
+    values, short = np.zeros(len(candidates)), np.zeros(len(candidates), dtype=bool)
+    for i, x in enumerate(candidates):
+        n_short = F.n_short
+        values[i] = F(x)
+        short[i] = F.n_short > n_short
+    full = np.array([exact(x) for x in candidates])
+    assert short.any()
+    assert np.all(values[short] <= full[short])
+    np.testing.assert_allclose(values[~short], full[~short], rtol=1e-12)
+    np.testing.assert_array_equal(values[feasible], full[feasible])
+    assert values[short].min() > full[feasible].max()
+
+
+def test_annealing_reaches_hard_minimum(rng):
+    """The SoftMin temperature decreases to its floor and the metric to the hard min."""
+    pep = PROBLEMS["particles"]()
+    F = pep.objective(
+        2, temperature=1.0, anneal_rate=0.5, anneal_period=10, min_temperature=1e-8
+    )
+    hard = pep.objective(2)
+    x = random_points(rng, F.program.n_comp, 1)[0]
+    target = hard(x, only_obj=True)
+    temperatures, gaps = [], []
+    for _ in range(40):
+        for _ in range(10):
+            metric = F(x, only_obj=True)
+        temperatures.append(F.softmin.temperature)
+        gaps.append(target - metric)
+    assert np.all(np.diff(temperatures) <= 0)
+    assert temperatures[:2] == [1.0, 0.5] and temperatures[-1] == 1e-8
+    assert gaps[0] > 1e-3 and np.all(np.array(gaps) >= -1e-12)
+    assert gaps[-1] == pytest.approx(0, abs=1e-6)
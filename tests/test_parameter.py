@@ -0,0 +1,20 @@
+#
+# Created in 2026 by Gaëtan Serré
+#
+
+from GPEP.drivers.parameter import brent, golden_section
+import pytest
+
+
+@pytest.mark.parametrize("search", [brent, golden_section])
+def test_search_solves_each_point_once(search):
+    """The line searches find the minimum without solving a parameter twice."""
+    calls = []
+
+    def F(p, width):
+        calls.append(p)
+        return (p - 0.3) ** 2
+
+    p = search(F, 0.0, 1.0, 1e-4)
+    assert p == pytest.approx(0.3, abs=1e-3)
+    assert len(calls) == len(set(calls))
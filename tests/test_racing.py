@@ -0,0 +1,38 @@
+#
+# Created in 2026 by Gaëtan Serré
+#
+
+from GPEP.drivers import race
+from conftest import PROBLEMS
+from types import SimpleNamespace
+
+
+def test_successive_halving(monkeypatch):
+    """Survivors get a growing share of the budget and the best feasible one wins."""
+    pep = PROBLEMS["smooth"]()
+    quality = {"a": 1.0, "b": 3.0, "c": 2.0, "infeasible": 10.0}
+    runs = []
+
+    def solve(opt, x0=None, **kwargs):
+        name, n_eval = opt(None)
+        runs.append((name, n_eval, x0))
+        violation = 1.0 if name == "infeasible" else 0.0
+        objective = quality[name] + n_eval * 1e-6
+        return SimpleNamespace(objective=objective, max_violation=violation)
+
+    monkeypatch.setattr(pep, "solve", solve)
+    candidates = {
+        name: lambda bounds, n_eval, name=name: (name, n_eval) for name in quality
+    }
+    solution = race(pep, candidates, budget=1200, processes=1)
+
+    schedule = {}
+    for name, n_eval, _ in runs:
+        schedule.setdefault(n_eval, []).append(name)
+    assert schedule == {
+        100: ["a", "b", "c", "infeasible"],
+        200: ["b", "c"],
+        400: ["b"],
+    }
+    assert runs[-1][2] is not None and runs[-1][2].objective == 3.0 + 200e-6
+    assert solution.objective == 3.0 + 400e-6 and solution.max_violation == 0
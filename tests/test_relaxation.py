@@ -0,0 +1,37 @@
+#
+# Created in 2026 by Gaëtan Serré
+#
+
+from GPEP import GPEP
+from GPEP.functions import SmoothConvexFunction
+from conftest import PROBLEMS
+import pytest
+
+pytest.importorskip("cvxpy")
+
+
+def gradient_descent(steps, L=1.0):
+    """Return the PEP of gradient descent with step 1/L on an L-smooth convex f."""
+    f = SmoothConvexFunction(L=L)
+    xs = f.get_stationary_point()
+    x0 = f.gen_initial_point()
+    x = x0
+    for _ in range(steps):
+        x = x - 1 / L * f.grad(x)
+    pep = GPEP(f)
+    pep.set_initial_condition((x0 - xs).norm() ** 2 <= 1)
+    pep.set_metric(f(x) - f(xs))
+    return pep
+
+
+@pytest.mark.parametrize("steps", [1, 2])
+def test_bound_matches_gradient_descent_rate(steps):
+    """The relaxation is tight for gradient descent: L R² / (4N + 2)."""
+    relaxation = gradient_descent(steps).relaxation_bound()
+    assert relaxation.bound == pytest.approx(1 / (4 * steps + 2), rel=1e-4)
+
+
+def test_no_bound_for_nonlinear_metric():
+    """A metric that is not linear in the Gram matrix (here |.|) has no bound."""
+    relaxation = PROBLEMS["smooth"]().relaxation_bound()
+    assert relaxation.bound is None and "Gram-linear" in relaxation.status
@@ -0,0 +1,21 @@
+#
+# Created in 2026 by Gaëtan Serré
+#
+
+from GPEP.compiler import Evaluator
+from GPEP.presolve import sample_seeds
+import numpy as np
+
+
+def test_seeds_satisfy_interpolation_constraints(pep):
+    """Unrolling the algorithm on sampled functions gives feasible vectors only."""
+    d = 2
+    seeds = sample_seeds(pep, d, 2000, seed=0)
+    assert len(seeds) == 2000
+    program = pep.compile(d)
+    metrics, residuals = Evaluator(program, batch=len(seeds)).evaluate(seeds.x)
+    interpolation = [i for i, key in enumerate(program.keys) if key is not None]
+    assert interpolation and residuals[:, interpolation].max() <= 1e-9
+    np.testing.assert_array_equal(metrics, seeds.metrics)
+    assert np.all(np.diff(seeds.metrics) <= 0)
+    assert seeds.lower_bound == seeds.metrics[0]
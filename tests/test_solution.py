@@ -0,0 +1,51 @@
+#
+# Created in 2026 by Gaëtan Serré
+#
+
+from GPEP.presolve import sample_seeds
+from GPEP.solution import Solution, pack
+from conftest import PROBLEMS, random_points, unpack
+import numpy as np
+import pytest
+
+
+class Fixed:
+    """Optimizer returning a fixed candidate."""
+
+    def __init__(self, z):
+        self.z = z
+
+    def minimize(self, F):
+        return self.z, F(self.z)
+
+
+def test_pack_unpack_round_trip(pep, rng):
+    """A Solution repacks into its own vector, and through a larger dimension."""
+    d = 2
+    F = pep.objective(d)
+    x = random_points(rng, F.program.n_comp, 1)[0]
+    F(x)
+    solution = Solution.from_function(
+        pep.f, d, x, F(x, only_obj=True), F.evaluator.residuals, F.program.keys, 1, {}
+    )
+    np.testing.assert_array_equal(solution.vector(pep.f, d), x)
+    for k, v in pep.f.points.items():
+        np.testing.assert_array_equal(solution.points[k], v.eval())
+    larger = unpack(pep.f, d + 1, pack(pep.f, d + 1, solution.variables))
+    np.testing.assert_array_equal(pack(pep.f, d, larger), x)
+
+
+@pytest.mark.parametrize("better", [False, True])
+def test_warm_start_kept_only_if_better(rng, better):
+    """The warm start is returned when it beats the optimizer, rejected otherwise."""
+    pep = PROBLEMS["smooth_strongly_convex"]()
+    d = 2
+    seeds = sample_seeds(pep, d, 64, seed=0)
+    n_comp = pep.get_nb_components(d)
+    feasible, infeasible = seeds.best, 5 * random_points(rng, n_comp, 1)[0]
+    x0, z = (feasible, infeasible) if better else (infeasible, feasible)
+    x0 = unpack(pep.f, d, x0)
+    solution = pep.solve(opt=lambda bounds: Fixed(z), x0=x0, d=d)
+    np.testing.assert_array_equal(solution.x, feasible)
+    assert solution.max_violation <= 1e-9
+    assert solution.objective == pytest.approx(seeds.lower_bound)
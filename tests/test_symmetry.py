@@ -0,0 +1,61 @@
+#
+# Created in 2026 by Gaëtan Serré
+#
+
+from GPEP.compiler import Evaluator
+from GPEP.presolve import sample_seeds
+from GPEP.solution import pack
+from conftest import PROBLEMS, particles, unpack
+import numpy as np
+import pytest
+
+
+def ordered(f, symmetry, variables):
+    """Return the image of variables under the group element ordering the orbits."""
+    pairs = [(f.points[a].id, f.points[b].id) for a, b in symmetry.orderings()]
+    frontier = [variables]
+    for _ in range(symmetry.order):
+        for variables in frontier:
+            if all(variables[a][0] <= variables[b][0] for a, b in pairs):
+                return variables
+        frontier = [
+            {label.get(k, k): v for k, v in variables.items()}
+            for variables in frontier
+            for label in symmetry.generators
+        ]
+    raise AssertionError("No group element orders the points.")
+
+
+def test_particles_are_interchangeable():
+    """The three particles of an interacting particle step form one S3 orbit."""
+    symmetry = particles(3).symmetry()
+    assert len(symmetry.orbits) == 1 and len(symmetry.orbits[0]) == 3
+    assert symmetry.order == 6
+    assert len(symmetry.orderings()) == 2
+
+
+def test_gradient_descent_has_no_symmetry():
+    """The initial and the stationary points of gradient descent are not swapped."""
+    symmetry = PROBLEMS["smooth_strongly_convex"]().symmetry()
+    assert symmetry.orbits == [] and symmetry.order == 1
+    assert str(symmetry) == "Symmetry group: trivial"
+
+
+def test_orderings_keep_the_optimum():
+    """Every feasible point has an ordered image with the same metric."""
+    d = 2
+    pep = particles(3)
+    symmetry = pep.symmetry()
+    seeds = sample_seeds(pep, d, 256, seed=0)
+    assert len(seeds) > 0
+    broken = Evaluator(pep.compile(d, symmetry=symmetry))
+    n_constraints = len(pep.compile(d).constraints)
+    assert len(broken.residuals) == n_constraints + len(symmetry.orderings())
+    moved = 0
+    for x, metric in zip(seeds.x, seeds.metrics):
+        image = pack(pep.f, d, ordered(pep.f, symmetry, unpack(pep.f, d, x)))
+        moved += not np.array_equal(image, x)
+        objective, residuals = broken.evaluate(image)
+        assert residuals.max() <= 1e-9
+        assert objective == pytest.approx(metric, rel=1e-12)
+    assert moved > 0